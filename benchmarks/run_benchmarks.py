@@ -0,0 +1,216 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of the records hot paths against an in-memory fake server.
+
+Every run appends its results to a JSON lines file and compares them with the previous results of the same
+benchmark and number of records, reporting throughput and memory regressions. The import benchmarks measure
+the cold start of `import argilla_sdk` and of the first access to the client in fresh interpreters.
+
+    python benchmarks/run_benchmarks.py --sizes 10000 100000
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import argilla_sdk as rg
+from argilla_sdk.testing import FakeArgillaServer
+
+DEFAULT_RESULTS_PATH = Path(__file__).parent / "results.jsonl"
+BENCHMARKS = ["import", "log", "iterate", "to_json", "to_datasets"]
+IMPORT_BENCHMARKS = {
+    "import": "import argilla_sdk",
+    "import_client": "import argilla_sdk; argilla_sdk.Argilla",
+}
+
+
+def build_rows(size: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": str(i),
+            "text": f"Record number {i} of the benchmark dataset",
+            "label": "positive" if i % 2 else "negative",
+            "score": i / size,
+            "source": "benchmark",
+        }
+        for i in range(size)
+    ]
+
+
+def create_dataset(server: FakeArgillaServer) -> rg.Dataset:
+    # Settings properties are bound to the default client when created, so the client is created first
+    client = server.client()
+    settings = rg.Settings(
+        fields=[rg.TextField(name="text")],
+        questions=[rg.LabelQuestion(name="label", labels=["negative", "positive"])],
+        metadata=[rg.FloatMetadataProperty(name="score"), rg.TermsMetadataProperty(name="source")],
+    )
+    dataset = rg.Dataset(name="benchmark", workspace="argilla", settings=settings, client=client)
+    return dataset.create()
+
+
+def benchmark_phases(dataset: rg.Dataset, rows: List[Dict[str, Any]], tmp_dir: Path) -> Dict[str, Callable]:
+    user_id = dataset._client.me.id
+    phases = {
+        "log": lambda: dataset.records.log(records=rows, user_id=user_id, batch_size=500),
+        "iterate": lambda: sum(1 for _ in dataset.records(batch_size=500)),
+        "to_json": lambda: dataset.records.to_json(tmp_dir / f"records_{time.monotonic_ns()}.json"),
+    }
+    if importlib.util.find_spec("datasets") is not None:
+        phases["to_datasets"] = lambda: dataset.records.to_datasets()
+    return phases
+
+
+def run_size(size: int, benchmarks: List[str], measure_memory: bool) -> List[Dict[str, Any]]:
+    """Runs the benchmarks twice: once to measure the time, and once under tracemalloc to measure the memory
+    peak of every phase, since tracing the allocations slows down the code being measured."""
+    rows = build_rows(size)
+    results = {}
+
+    passes = [False, True] if measure_memory else [False]
+    for traced in passes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dataset = create_dataset(FakeArgillaServer())
+            phases = benchmark_phases(dataset, rows, Path(tmp_dir))
+            if traced:
+                tracemalloc.start()
+            # Phases run in order, since iterating and exporting need the logged records
+            for name, phase in phases.items():
+                if name not in benchmarks and name != "log":
+                    continue
+                if traced:
+                    tracemalloc.reset_peak()
+                start = time.perf_counter()
+                phase()
+                elapsed = time.perf_counter() - start
+                result = results.setdefault(name, {"benchmark": name, "records": size})
+                if traced:
+                    result["peak_memory_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024**2, 2)
+                else:
+                    result["seconds"] = round(elapsed, 4)
+                    result["records_per_second"] = round(size / elapsed, 1)
+            if traced:
+                tracemalloc.stop()
+
+    return [result for name, result in results.items() if name in benchmarks]
+
+
+def run_import_benchmarks(repeats: int = 5) -> List[Dict[str, Any]]:
+    """Measures the import time in fresh interpreters, keeping the fastest of several runs to reduce the noise
+    of the file system cache. The interpreter startup is not included in the measure."""
+    results = []
+    for name, statement in IMPORT_BENCHMARKS.items():
+        code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+        timings = [
+            float(subprocess.check_output([sys.executable, "-W", "ignore", "-c", code], text=True))
+            for _ in range(repeats)
+        ]
+        results.append({"benchmark": name, "records": 0, "seconds": round(min(timings), 6)})
+    return results
+
+
+def load_previous_results(path: Path) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    previous = {}
+    if path.exists():
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    result = json.loads(line)
+                    previous[(result["benchmark"], result["records"])] = result
+    return previous
+
+
+def find_regressions(
+    result: Dict[str, Any], previous: Optional[Dict[str, Any]], threshold: float
+) -> List[Tuple[str, Any, Any]]:
+    if previous is None:
+        return []
+    regressions = []
+    if "records_per_second" not in result:
+        if result["seconds"] > previous["seconds"] * (1 + threshold):
+            regressions.append(("seconds", previous["seconds"], result["seconds"]))
+    elif result["records_per_second"] < previous["records_per_second"] * (1 - threshold):
+        regressions.append(("records_per_second", previous["records_per_second"], result["records_per_second"]))
+    if "peak_memory_mb" in result and "peak_memory_mb" in previous:
+        if result["peak_memory_mb"] > previous["peak_memory_mb"] * (1 + threshold):
+            regressions.append(("peak_memory_mb", previous["peak_memory_mb"], result["peak_memory_mb"]))
+    return regressions
+
+
+def current_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000], help="Numbers of records, e.g. 10000 1000000")
+    parser.add_argument("--benchmarks", nargs="+", choices=BENCHMARKS, default=BENCHMARKS)
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS_PATH, help="JSON lines file with the results")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative change reported as a regression")
+    parser.add_argument("--skip-memory", action="store_true", help="Do not measure the memory peak")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with an error on regressions")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    previous_results = load_previous_results(args.output)
+    run_info = {
+        "commit": current_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "sdk": rg.__version__,
+    }
+
+    regressions_found = False
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    results = run_import_benchmarks() if "import" in args.benchmarks else []
+    records_benchmarks = [name for name in args.benchmarks if name != "import"]
+    with open(args.output, "a") as output:
+        for size in args.sizes if records_benchmarks else []:
+            results += run_size(size=size, benchmarks=records_benchmarks, measure_memory=not args.skip_memory)
+        for result in results:
+            result.update(run_info)
+            output.write(json.dumps(result) + "\n")
+
+            if "records_per_second" in result:
+                memory = f"{result['peak_memory_mb']:>9.2f} MB" if "peak_memory_mb" in result else ""
+                print(
+                    f"{result['benchmark']:<13} {result['records']:>9} records {result['seconds']:>9.3f} s "
+                    f"{result['records_per_second']:>11.1f} records/s {memory}"
+                )
+            else:
+                print(f"{result['benchmark']:<13} {'':>17} {result['seconds']:>9.4f} s")
+            previous = previous_results.get((result["benchmark"], result["records"]))
+            for metric, before, after in find_regressions(result, previous, args.threshold):
+                regressions_found = True
+                print(f"  REGRESSION {metric}: {before} -> {after} (previous commit {previous.get('commit')})")
+
+    return 1 if regressions_found and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,15 +12,89 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from argilla_sdk.client import *  # noqa
-from argilla_sdk.datasets import *  # noqa
-from argilla_sdk.workspaces._resource import *  # noqa
-from argilla_sdk.users._resource import *  # noqa
-from argilla_sdk.settings import *  # noqa
-from argilla_sdk.suggestions import *  # noqa
-from argilla_sdk.responses import *  # noqa
-from argilla_sdk.records import *  # noqa
-from argilla_sdk.vectors import *  # noqa
-
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 __version__ = "2.0.0a0.dev0"
+
+# The public classes are imported on first access (PEP 562), so `import argilla_sdk` stays fast for
+# scripts that only use part of the SDK
+_LAZY_ATTRIBUTES = {
+    "Argilla": "argilla_sdk.client",
+    "CachingTransport": "argilla_sdk._api",
+    "Tracer": "argilla_sdk._helpers",
+    "NoOpTracer": "argilla_sdk._helpers",
+    "Progress": "argilla_sdk._helpers",
+    "ProgressCallback": "argilla_sdk._helpers",
+    "TqdmProgress": "argilla_sdk._helpers",
+    "Dataset": "argilla_sdk.datasets",
+    "Workspace": "argilla_sdk.workspaces._resource",
+    "User": "argilla_sdk.users._resource",
+    "Settings": "argilla_sdk.settings",
+    "TextField": "argilla_sdk.settings",
+    "VectorField": "argilla_sdk.settings",
+    "LabelQuestion": "argilla_sdk.settings",
+    "MultiLabelQuestion": "argilla_sdk.settings",
+    "RankingQuestion": "argilla_sdk.settings",
+    "TextQuestion": "argilla_sdk.settings",
+    "RatingQuestion": "argilla_sdk.settings",
+    "SpanQuestion": "argilla_sdk.settings",
+    "QuestionType": "argilla_sdk.settings",
+    "TermsMetadataProperty": "argilla_sdk.settings",
+    "FloatMetadataProperty": "argilla_sdk.settings",
+    "IntegerMetadataProperty": "argilla_sdk.settings",
+    "MetadataType": "argilla_sdk.settings",
+    "Suggestion": "argilla_sdk.suggestions",
+    "Response": "argilla_sdk.responses",
+    "UserResponse": "argilla_sdk.responses",
+    "Record": "argilla_sdk.records",
+    "DatasetRecords": "argilla_sdk.records",
+    "Query": "argilla_sdk.records",
+    "Filter": "argilla_sdk.records",
+    "Condition": "argilla_sdk.records",
+    "Vector": "argilla_sdk.vectors",
+}
+
+_SUBMODULES = [
+    "client",
+    "datasets",
+    "records",
+    "responses",
+    "settings",
+    "suggestions",
+    "users",
+    "vectors",
+    "workspaces",
+]
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache the attribute, so this function is only called on the first access
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_SUBMODULES))
+
+
+if TYPE_CHECKING:
+    from argilla_sdk.client import *  # noqa
+    from argilla_sdk._api import CachingTransport  # noqa
+    from argilla_sdk._helpers import NoOpTracer, Progress, ProgressCallback, TqdmProgress, Tracer  # noqa
+    from argilla_sdk.datasets import *  # noqa
+    from argilla_sdk.workspaces._resource import Workspace  # noqa
+    from argilla_sdk.users._resource import User  # noqa
+    from argilla_sdk.settings import *  # noqa
+    from argilla_sdk.suggestions import *  # noqa
+    from argilla_sdk.responses import *  # noqa
+    from argilla_sdk.records import *  # noqa
+    from argilla_sdk.vectors import *  # noqa
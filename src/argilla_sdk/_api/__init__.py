@@ -20,3 +20,4 @@ from argilla_sdk._api._client import *  # noqa 403
 from argilla_sdk._api._fields import *  # noqa 403
 from argilla_sdk._api._records import *  # noqa 403
 from argilla_sdk._api._questions import *  # noqa 403
+from argilla_sdk._api._metrics import *  # noqa 403
@@ -12,20 +12,56 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import inspect
 from datetime import datetime
-from typing import Generic, TYPE_CHECKING, TypeVar
+from typing import Callable, Generic, Optional, TYPE_CHECKING, TypeVar
 from uuid import UUID
 
-from argilla_sdk._helpers import LoggingMixin
-
+from argilla_sdk._helpers import LoggingMixin, NoOpTracer, SingleFlight, Tracer
 
 if TYPE_CHECKING:
     from httpx import Client
 
+    from argilla_sdk._api._metrics import MetricsRegistry
+
 
-__all__ = ["ResourceAPI"]
+__all__ = ["ResourceAPI", "coalesce_requests"]
 
 T = TypeVar("T")
+Method = TypeVar("Method", bound=Callable)
+
+
+def coalesce_requests(method: Method) -> Method:
+    """Decorator for the idempotent methods of a ResourceAPI. When the API client is created with
+    `coalesce_requests=True`, concurrent calls with the same arguments share a single request and its result.
+
+    Example:
+    ```python
+
+    @coalesce_requests
+    @api_error_handler
+    def get(self, workspace_id: UUID) -> WorkspaceModel:
+        ...
+    ```
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "ResourceAPI", *args, **kwargs):
+        if self._single_flight is None:
+            return method(self, *args, **kwargs)
+
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        key = (type(self), method.__name__, tuple(arguments.arguments.items())[1:])
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        return self._single_flight.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
 
 
 # TODO: Use ABC and align all the abstract method for the different resources APIs
@@ -33,8 +69,24 @@ T = TypeVar("T")
 class ResourceAPI(LoggingMixin, Generic[T]):
     """Base class for all API resources that contains common methods."""
 
-    def __init__(self, http_client: "Client") -> None:
+    # Coalesces the concurrent identical calls of the methods decorated with `coalesce_requests`, if set
+    _single_flight: Optional[SingleFlight] = None
+    # Records the calls of the methods decorated with `api_error_handler`, if set
+    _metrics: Optional["MetricsRegistry"] = None
+    # Opens a span around the calls of the methods decorated with `api_error_handler`
+    _tracer: Tracer = NoOpTracer()
+
+    def __init__(
+        self,
+        http_client: "Client",
+        single_flight: Optional[SingleFlight] = None,
+        metrics: Optional["MetricsRegistry"] = None,
+        tracer: Optional[Tracer] = None,
+    ) -> None:
         self.http_client = http_client
+        self._single_flight = single_flight
+        self._metrics = metrics
+        self._tracer = tracer or NoOpTracer()
 
     ################
     # CRUD methods #
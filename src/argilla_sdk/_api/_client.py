@@ -14,13 +14,17 @@
 
 import logging
 import os
-from typing import Optional
+import pickle
+import threading
+import weakref
+from typing import Any, Dict, Optional
 
 import httpx
 
 from argilla_sdk._api import HTTPClientConfig, create_http_client
 from argilla_sdk._api._datasets import DatasetsAPI
 from argilla_sdk._api._fields import FieldsAPI
+from argilla_sdk._api._metrics import MetricsRegistry
 from argilla_sdk._api._metadata import MetadataAPI
 from argilla_sdk._api._questions import QuestionsAPI
 from argilla_sdk._api._records import RecordsAPI
@@ -28,6 +32,7 @@ from argilla_sdk._api._users import UsersAPI
 from argilla_sdk._api._vectors import VectorsAPI
 from argilla_sdk._api._workspaces import WorkspacesAPI
 from argilla_sdk._constants import _DEFAULT_API_KEY, _DEFAULT_API_URL
+from argilla_sdk._helpers import NoOpTracer, SingleFlight, Tracer, current_api_span, current_progress
 
 __all__ = ["APIClient"]
 
@@ -40,17 +45,51 @@ DEFAULT_HTTP_CONFIG = HTTPClientConfig(api_url=ARGILLA_API_URL, api_key=ARGILLA_
 class ArgillaAPI:
     """Argilla API access object."""
 
-    def __init__(self, http_client: httpx.Client):
+    def __init__(
+        self,
+        http_client: httpx.Client,
+        single_flight: Optional[SingleFlight] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+    ):
         self.http_client = http_client
 
-        self.__workspaces = WorkspacesAPI(http_client=self.http_client)
-        self.__datasets = DatasetsAPI(http_client=self.http_client)
-        self.__users = UsersAPI(http_client=self.http_client)
-        self.__fields = FieldsAPI(http_client=self.http_client)
-        self.__questions = QuestionsAPI(http_client=self.http_client)
-        self.__records = RecordsAPI(http_client=self.http_client)
-        self.__vectors = VectorsAPI(http_client=self.http_client)
-        self.__metadata = MetadataAPI(http_client=self.http_client)
+        api_args = {
+            "http_client": self.http_client,
+            "single_flight": single_flight,
+            "metrics": metrics,
+            "tracer": tracer,
+        }
+        self.__workspaces = WorkspacesAPI(**api_args)
+        self.__datasets = DatasetsAPI(**api_args)
+        self.__users = UsersAPI(**api_args)
+        self.__fields = FieldsAPI(**api_args)
+        self.__questions = QuestionsAPI(**api_args)
+        self.__records = RecordsAPI(**api_args)
+        self.__vectors = VectorsAPI(**api_args)
+        self.__metadata = MetadataAPI(**api_args)
+
+    def _set_http_client(self, http_client: httpx.Client) -> None:
+        """Replaces the HTTP client of every resource API, keeping the resource API objects"""
+        self.http_client = http_client
+        for resource_api in self.__resource_apis():
+            resource_api.http_client = http_client
+
+    def _set_tracer(self, tracer: Tracer) -> None:
+        for resource_api in self.__resource_apis():
+            resource_api._tracer = tracer
+
+    def __resource_apis(self) -> list:
+        return [
+            self.__workspaces,
+            self.__datasets,
+            self.__users,
+            self.__fields,
+            self.__questions,
+            self.__records,
+            self.__vectors,
+            self.__metadata,
+        ]
 
     @property
     def workspaces(self) -> "WorkspacesAPI":
@@ -89,12 +128,26 @@ class APIClient:
     """Initialize the SDK with the given API URL and API key.
     This class is used to create an instance of the Argilla API client.
 
+    The requests sent by the client are recorded in its `metrics` registry, and traced with its `tracer`.
+
+    The HTTP client is created on first use and shared by all the threads of the process. After `os.fork()`,
+    the child process opens a new connection pool on first use instead of reusing the connections of the parent.
+    Clients are pickled as their configuration, so they can be sent to `multiprocessing` workers and rebuilt there.
+    The HTTP client arguments that cannot be pickled, like most transports, are left out.
+
+    The `transport` can be a function returning a transport, like `rg.CachingTransport`, which is called for
+    every new HTTP client, so every process gets its own transport and connections.
+
     Args:
         api_url (str, optional): The URL of the Argilla API. Defaults to the value of
             the `ARGILLA_API_URL` environment variable.
         api_key (str, optional): The API key to authenticate with the Argilla API. Defaults to
             the value of the `ARGILLA_API_KEY` environment variable.
         timeout (int, optional): The timeout in seconds for the HTTP requests. Defaults to 60.
+        coalesce_requests (bool, optional): Whether concurrent identical requests reading datasets, workspaces,
+            users and settings share a single request and its result. Defaults to False.
+        tracer (Tracer, optional): The tracer opening spans around the SDK operations and their requests, like an
+            OpenTelemetry tracer. Defaults to a tracer recording nothing.
         **http_client_args: Additional keyword arguments to pass to the httpx.Client instance.
             See https://www.python-httpx.org/api/#client for more information.
     """
@@ -104,6 +157,8 @@ class APIClient:
         api_url: Optional[str] = DEFAULT_HTTP_CONFIG.api_url,
         api_key: Optional[str] = DEFAULT_HTTP_CONFIG.api_key,
         timeout: int = DEFAULT_HTTP_CONFIG.timeout,
+        coalesce_requests: bool = False,
+        tracer: Optional[Tracer] = None,
         **http_client_args,
     ):
         http_client_args = http_client_args or {}
@@ -111,19 +166,59 @@ class APIClient:
 
         self.api_url = api_url
         self.api_key = api_key
+        self.coalesce_requests = coalesce_requests
         self._http_client_args = http_client_args
+        self.metrics = MetricsRegistry()
+        self._tracer = tracer or NoOpTracer()
+
+        self._init_connection_state()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "api_url": self.api_url,
+            "api_key": self.api_key,
+            "coalesce_requests": self.coalesce_requests,
+            "_http_client_args": self._picklable_http_client_args(),
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.metrics = MetricsRegistry()
+        # Tracers belong to the process that created them, so they are not pickled
+        self._tracer = NoOpTracer()
+        self._init_connection_state()
+
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     @property
     def http_client(self) -> httpx.Client:
-        return create_http_client(
-            api_url=self.api_url,  # type: ignore
-            api_key=self.api_key,  # type: ignore
-            **self._http_client_args,
-        )
+        return self._connect().http_client
 
     @property
     def api(self) -> "ArgillaAPI":
-        return ArgillaAPI(http_client=self.http_client)
+        return self._connect()
+
+    @property
+    def tracer(self) -> Tracer:
+        """The tracer opening spans around the SDK operations and their requests."""
+        return self._tracer
+
+    @tracer.setter
+    def tracer(self, tracer: Optional[Tracer]) -> None:
+        self._tracer = tracer or NoOpTracer()
+        if self._api is not None:
+            self._api._set_tracer(self._tracer)
+
+    def close(self) -> None:
+        """Closes the HTTP client and its connections. Using the client again opens a new HTTP client."""
+        with self._lock:
+            if self._api is not None and self._pid == os.getpid():
+                self._api.http_client.close()
+            self._pid = None
 
     ##############################
     # Utility methods
@@ -133,3 +228,119 @@ class APIClient:
         class_name = self.__class__.__name__
         message = f"{class_name}: {message}"
         logging.log(level=level, msg=message)
+
+    ##############################
+    # Private methods
+    ##############################
+
+    def _init_connection_state(self) -> None:
+        self._lock = threading.Lock()
+        self._api: Optional[ArgillaAPI] = None
+        self._pid: Optional[int] = None
+        _CLIENTS.add(self)
+
+    def _connect(self) -> "ArgillaAPI":
+        api = self._api
+        if api is not None and self._pid == os.getpid():
+            return api
+        with self._lock:
+            if self._api is None or self._pid != os.getpid():
+                self._set_http_client(self._create_http_client())
+            return self._api
+
+    def _create_http_client(self) -> httpx.Client:
+        http_client_args = dict(self._http_client_args)
+        transport = http_client_args.get("transport")
+        if callable(transport) and not isinstance(transport, httpx.BaseTransport):
+            http_client_args["transport"] = transport()
+        # The metrics, tracing and progress hooks run after the hooks passed to the client
+        event_hooks = {event: list(hooks) for event, hooks in http_client_args.pop("event_hooks", {}).items()}
+        for event, hooks in self.metrics.event_hooks().items():
+            event_hooks.setdefault(event, []).extend(hooks)
+        event_hooks.setdefault("request", []).extend([_trace_request, _track_request_progress])
+        event_hooks.setdefault("response", []).extend([_trace_response, _track_response_progress])
+
+        return create_http_client(
+            api_url=self.api_url,  # type: ignore
+            api_key=self.api_key,  # type: ignore
+            event_hooks=event_hooks,
+            **http_client_args,
+        )
+
+    def _set_http_client(self, http_client: httpx.Client) -> None:
+        # Resources keep references to the resource APIs, so the existing APIs are updated with the new client
+        if self._api is None:
+            single_flight = SingleFlight() if self.coalesce_requests else None
+            self._api = ArgillaAPI(
+                http_client=http_client, single_flight=single_flight, metrics=self.metrics, tracer=self._tracer
+            )
+        else:
+            self._api._set_http_client(http_client)
+        self._pid = os.getpid()
+
+    def _picklable_http_client_args(self) -> Dict[str, Any]:
+        picklable_args = {}
+        for name, value in self._http_client_args.items():
+            try:
+                pickle.dumps(value)
+            except Exception:
+                self.log(f"The HTTP client argument {name!r} cannot be pickled and is left out.", level=logging.WARNING)
+                continue
+            picklable_args[name] = value
+        return picklable_args
+
+    def _reset_after_fork(self) -> None:
+        """Drops the connections inherited from the parent process, which must not be shared. The resource APIs
+        open a new HTTP client on their first request in the child process"""
+        self._lock = threading.Lock()
+        self._pid = None
+        if self._api is not None:
+            self._api._set_http_client(_ReconnectingHTTPClient(self))
+
+
+class _ReconnectingHTTPClient:
+    """The HTTP client of the resource APIs of a client after a fork, which opens a new HTTP client on first use"""
+
+    def __init__(self, client: APIClient):
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client.http_client, name)
+
+
+def _trace_request(request: httpx.Request) -> None:
+    """Sets the request attributes on the span of the resource API method sending it"""
+    span = current_api_span()
+    span.set_attribute("http.request.method", request.method)
+    span.set_attribute("url.full", str(request.url))
+    span.set_attribute("http.request.body.size", int(request.headers.get("content-length", 0)))
+
+
+def _trace_response(response: httpx.Response) -> None:
+    """Sets the response attributes on the span of the resource API method receiving it"""
+    span = current_api_span()
+    span.set_attribute("http.response.status_code", response.status_code)
+    span.set_attribute("http.response.body.size", len(response.read()))
+
+
+def _track_request_progress(request: httpx.Request) -> None:
+    """Adds the request body size to the progress of the records operation sending it"""
+    current_progress().add_bytes(sent=int(request.headers.get("content-length", 0)))
+
+
+def _track_response_progress(response: httpx.Response) -> None:
+    """Adds the response body size to the progress of the records operation receiving it"""
+    current_progress().add_bytes(received=len(response.read()))
+
+
+# Clients alive in the process, to reset their connections after a fork
+_CLIENTS: "weakref.WeakSet[APIClient]" = weakref.WeakSet()
+
+
+def _reset_clients_after_fork() -> None:
+    for client in list(_CLIENTS):
+        client._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
@@ -16,7 +16,7 @@ from typing import List, Optional, Dict
 from uuid import UUID
 
 import httpx
-from argilla_sdk._api._base import ResourceAPI
+from argilla_sdk._api._base import ResourceAPI, coalesce_requests
 from argilla_sdk._exceptions._api import api_error_handler
 from argilla_sdk._models import DatasetModel
 
@@ -57,6 +57,7 @@ class DatasetsAPI(ResourceAPI[DatasetModel]):
         self._log_message(message=f"Updated dataset {dataset.url}")
         return dataset
 
+    @coalesce_requests
     @api_error_handler
     def get(self, dataset_id: UUID) -> "DatasetModel":
         response = self.http_client.get(url=f"{self.url_stub}/{dataset_id}")
@@ -72,6 +73,7 @@ class DatasetsAPI(ResourceAPI[DatasetModel]):
         response.raise_for_status()
         self._log_message(message=f"Deleted dataset {dataset_id}")
 
+    @coalesce_requests
     def exists(self, dataset_id: UUID) -> bool:
         response = self.http_client.get(f"{self.url_stub}/{dataset_id}")
         return response.status_code == 200
@@ -88,12 +90,15 @@ class DatasetsAPI(ResourceAPI[DatasetModel]):
         self._log_message(message=f"Published dataset {dataset_id}")
         return self._model_from_json(response_json=response_json)
 
+    @coalesce_requests
     @api_error_handler
     def list(self, workspace_id: Optional[UUID] = None) -> List["DatasetModel"]:
-        response = self.http_client.get("/api/v1/me/datasets")
+        params = {"workspace_id": str(workspace_id)} if workspace_id else None
+        response = self.http_client.get("/api/v1/me/datasets", params=params)
         response.raise_for_status()
         response_json = response.json()
         datasets = self._model_from_jsons(response_jsons=response_json["items"])
+        # Servers ignoring the workspace filter return the datasets of all the workspaces
         if workspace_id:
             datasets = [dataset for dataset in datasets if dataset.workspace_id == workspace_id]
         self._log_message(message=f"Listed {len(datasets)} datasets")
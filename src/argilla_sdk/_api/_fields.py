@@ -17,7 +17,7 @@ from uuid import UUID
 
 import httpx
 
-from argilla_sdk._api._base import ResourceAPI
+from argilla_sdk._api._base import ResourceAPI, coalesce_requests
 from argilla_sdk._exceptions import api_error_handler
 from argilla_sdk._models import FieldModel
 
@@ -33,6 +33,7 @@ class FieldsAPI(ResourceAPI[FieldModel]):
     # CRUD methods #
     ################
 
+    @coalesce_requests
     @api_error_handler
     def get(self, id: UUID) -> FieldModel:
         raise NotImplementedError()
@@ -67,6 +68,7 @@ class FieldsAPI(ResourceAPI[FieldModel]):
     # Utility methods #
     ####################
 
+    @coalesce_requests
     @api_error_handler
     def list(self, dataset_id: UUID) -> List[FieldModel]:
         response = self.http_client.get(f"/api/v1/datasets/{dataset_id}/fields")
@@ -14,3 +14,4 @@
 
 from argilla_sdk._api._http._client import *  # noqa F401, F403
 from argilla_sdk._api._http._helpers import *  # noqa F401, F403
+from argilla_sdk._api._http._cache import *  # noqa F401, F403
@@ -0,0 +1,273 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+
+import httpx
+
+__all__ = ["CachingTransport", "DEFAULT_CACHE_TTL", "DEFAULT_CACHE_MAX_ENTRIES"]
+
+DEFAULT_CACHE_TTL = 30.0
+DEFAULT_CACHE_MAX_ENTRIES = 512
+
+# The resources read far more often than they change. Records and responses are never cached
+_CACHED_RESOURCES = {
+    "datasets",
+    "workspaces",
+    "users",
+    "fields",
+    "questions",
+    "vectors-settings",
+    "metadata-properties",
+}
+_UNCACHED_RESOURCES = {"records", "responses", "search", "progress", "metrics"}
+# The headers identifying the user, whose responses are cached separately
+_CREDENTIAL_HEADERS = ("X-Argilla-Api-Key", "Authorization")
+
+
+class _CacheEntry(NamedTuple):
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+    resource: str
+    stored_at: float
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        validators = {}
+        if "etag" in self.headers:
+            validators["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            validators["If-Modified-Since"] = self.headers["last-modified"]
+        return validators
+
+
+class CachingTransport(httpx.BaseTransport):
+    """An HTTP transport caching the responses of the `GET` requests for datasets, workspaces, users, fields,
+    questions, vectors and metadata properties. Record requests are never cached.
+
+    A cached response is returned without a request while it is younger than the time to live of its resource.
+    Once expired, it is revalidated with `If-None-Match`/`If-Modified-Since` when the server sent an `ETag` or a
+    `Last-Modified` header, and fetched again otherwise. Any successful write to those resources through the
+    transport discards the cached responses, so a client sees its own changes immediately. The responses are
+    cached by API key, so a transport shared by clients of different users never returns the responses of
+    another user.
+
+    The transport can be pickled and used after a fork: the copy starts with an empty cache and a new inner
+    transport, created with the `transport` function when one was given. A transport instance is only kept
+    when it can be pickled, and replaced by a new `httpx.HTTPTransport` otherwise.
+
+    ```python
+    client = rg.Argilla(api_url="...", api_key="...", transport=rg.CachingTransport())
+    ```
+
+    Args:
+        transport (Optional[Union[httpx.BaseTransport, Callable[[], httpx.BaseTransport]]]): The transport sending
+            the requests that are not served from the cache, or a function creating it. Defaults to
+            `httpx.HTTPTransport`.
+        ttl (float): The seconds a cached response is used without a request. Defaults to 30.
+        ttls (Optional[Dict[str, float]]): The time to live by resource, overriding `ttl`. The resources are
+            "datasets", "workspaces", "users", "fields", "questions", "vectors-settings" and "metadata-properties".
+        max_entries (int): The maximum number of cached responses. The least recently used ones are discarded first.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[Union[httpx.BaseTransport, Callable[[], httpx.BaseTransport]]] = None,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ):
+        unknown_resources = set(ttls or {}) - _CACHED_RESOURCES
+        if unknown_resources:
+            raise ValueError(f"Unknown cached resources {sorted(unknown_resources)}. Use {sorted(_CACHED_RESOURCES)}")
+
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+
+        transport = transport or httpx.HTTPTransport
+        if isinstance(transport, httpx.BaseTransport):
+            self._transport_factory = None
+            self._transport = transport
+        else:
+            self._transport_factory = transport
+            self._transport = None
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        _TRANSPORTS.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        transport = self._transport_factory or self._transport
+        if not _is_picklable(transport):
+            transport = None
+        return {"transport": transport, "ttl": self.ttl, "ttls": self.ttls, "max_entries": self.max_entries}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    def clear(self) -> None:
+        """Discards all the cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        resource = _cached_resource(request.url.path)
+        if resource is None:
+            return self._inner_transport().handle_request(request)
+
+        if request.method != "GET":
+            response = self._inner_transport().handle_request(request)
+            if response.is_success:
+                self.clear()
+            return response
+
+        key = _cache_key(request)
+        entry = self._get(key)
+        if entry is not None and not self._is_expired(entry):
+            return self._response_from(entry)
+
+        if entry is not None:
+            request.headers.update(entry.validators)
+
+        response = self._inner_transport().handle_request(request)
+        if entry is not None and response.status_code == 304:
+            response.close()
+            entry = entry._replace(stored_at=time.monotonic())
+            self._put(key, entry)
+            return self._response_from(entry)
+
+        if response.status_code != 200:
+            return response
+
+        entry = _CacheEntry(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=_read_raw_content(response),
+            resource=resource,
+            stored_at=time.monotonic(),
+        )
+        self._put(key, entry)
+        return self._response_from(entry)
+
+    def close(self) -> None:
+        self.clear()
+        if self._transport is not None:
+            self._transport.close()
+
+    ############################
+    # Private methods
+    ############################
+
+    def _inner_transport(self) -> httpx.BaseTransport:
+        transport = self._transport
+        if transport is None:
+            with self._lock:
+                if self._transport is None:
+                    self._transport = self._transport_factory()
+                transport = self._transport
+        return transport
+
+    def _reset_after_fork(self) -> None:
+        """Empties the cache in a forked process, and drops the inner transport sharing the connections of the
+        parent process, which is created again on the first request when it was given as a function"""
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        if self._transport_factory is not None:
+            self._transport = None
+
+    def _get(self, key: str) -> Optional[_CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _put(self, key: str, entry: _CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        ttl = self.ttls.get(entry.resource, self.ttl)
+        return time.monotonic() - entry.stored_at >= ttl
+
+    @staticmethod
+    def _response_from(entry: _CacheEntry) -> httpx.Response:
+        # The content is kept as received, so the client decodes it according to the cached headers
+        return httpx.Response(
+            status_code=entry.status_code,
+            headers=entry.headers,
+            stream=httpx.ByteStream(entry.content),
+        )
+
+
+_TRANSPORTS: "weakref.WeakSet[CachingTransport]" = weakref.WeakSet()
+
+
+def _reset_transports_after_fork() -> None:
+    for transport in list(_TRANSPORTS):
+        transport._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_transports_after_fork)
+
+
+def _is_picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return False
+    return True
+
+
+def _cached_resource(path: str) -> Optional[str]:
+    """Returns the resource of an API path when its responses can be cached, e.g. "fields" for
+    `/api/v1/datasets/{dataset_id}/fields`, and None otherwise."""
+    resource = None
+    for segment in path.strip("/").split("/"):
+        if segment in _UNCACHED_RESOURCES:
+            return None
+        if segment in _CACHED_RESOURCES:
+            resource = segment
+    if resource is None and path.rstrip("/").endswith("/me"):
+        resource = "users"
+    return resource
+
+
+def _cache_key(request: httpx.Request) -> str:
+    """Returns the key of the cached response of a request, which includes a digest of the credentials of the user
+    sending it, since responses like `/api/v1/me/workspaces` depend on the user."""
+    credentials = "\n".join(request.headers.get(header, "") for header in _CREDENTIAL_HEADERS)
+    return f"{hashlib.sha256(credentials.encode()).hexdigest()}:{request.url}"
+
+
+def _read_raw_content(response: httpx.Response) -> bytes:
+    try:
+        return b"".join(response.stream)
+    finally:
+        response.close()
@@ -17,7 +17,7 @@ from uuid import UUID
 
 import httpx
 
-from argilla_sdk._api._base import ResourceAPI
+from argilla_sdk._api._base import ResourceAPI, coalesce_requests
 from argilla_sdk._exceptions import api_error_handler
 from argilla_sdk._models import MetadataFieldModel
 
@@ -33,6 +33,7 @@ class MetadataAPI(ResourceAPI[MetadataFieldModel]):
     # CRUD methods #
     ################
 
+    @coalesce_requests
     @api_error_handler
     def get(self, metadata_id: UUID) -> MetadataFieldModel:
         raise NotImplementedError()
@@ -66,6 +67,7 @@ class MetadataAPI(ResourceAPI[MetadataFieldModel]):
     # Utility methods #
     ####################
 
+    @coalesce_requests
     @api_error_handler
     def list(self, dataset_id: UUID) -> List[MetadataFieldModel]:
         response = self.http_client.get(f"/api/v1/me/datasets/{dataset_id}/metadata-properties")
@@ -0,0 +1,219 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import re
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+__all__ = ["MetricsRegistry"]
+
+_UUID_SEGMENT = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+_START_EXTENSION = "argilla_metrics_start"
+
+QUANTILES = (0.5, 0.95, 0.99)
+DEFAULT_SAMPLE_SIZE = 1024
+
+
+class _Stats:
+    """The counters and the latest durations of an endpoint or an operation"""
+
+    def __init__(self, sample_size: int):
+        self.count = 0
+        self.errors: Counter = Counter()
+        self.duration_sum = 0.0
+        self.durations: Deque[float] = deque(maxlen=sample_size)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def observe(self, duration: float, error: Optional[str] = None) -> None:
+        self.count += 1
+        self.duration_sum += duration
+        self.durations.append(duration)
+        if error is not None:
+            self.errors[error] += 1
+
+    def quantiles(self) -> Dict[float, float]:
+        durations = sorted(self.durations)
+        if not durations:
+            return {quantile: 0.0 for quantile in QUANTILES}
+        # Nearest-rank quantiles over the latest durations
+        return {quantile: durations[max(math.ceil(quantile * len(durations)) - 1, 0)] for quantile in QUANTILES}
+
+    def to_dict(self, with_sizes: bool) -> Dict[str, Any]:
+        stats = {
+            "count": self.count,
+            "errors": dict(self.errors),
+            "latency": {
+                **{f"p{round(quantile * 100)}": value for quantile, value in self.quantiles().items()},
+                "sum": self.duration_sum,
+            },
+        }
+        if with_sizes:
+            stats["request_bytes"] = self.request_bytes
+            stats["response_bytes"] = self.response_bytes
+        return stats
+
+
+class MetricsRegistry:
+    """Collects the metrics of the requests sent by a client: the count, latency, request and response sizes and
+    errors of every endpoint, from the HTTP client event hooks, and the count, latency and errors of every
+    resource API method, like `RecordsAPI.bulk_upsert` or `FieldsAPI.list`.
+
+    Endpoints are identified by their method and path, with the ids replaced by `{id}`. Latency quantiles are
+    computed over the latest `sample_size` requests of every endpoint or method.
+
+    ```python
+    client = rg.Argilla(api_url="...", api_key="...")
+    dataset.records.log(records)
+
+    client.metrics.to_dict()["requests"]["POST /api/v1/datasets/{id}/records/bulk"]["latency"]["p95"]
+    print(client.metrics.to_prometheus())
+    ```
+
+    Args:
+        sample_size (int): The number of latest durations kept by endpoint and method to compute the quantiles.
+    """
+
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self._requests: Dict[Tuple[str, str], _Stats] = {}
+        self._operations: Dict[str, _Stats] = {}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Discards all the collected metrics."""
+        with self._lock:
+            self._requests.clear()
+            self._operations.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the metrics of the requests by endpoint and of the operations by resource API method."""
+        with self._lock:
+            return {
+                "requests": {
+                    f"{method} {endpoint}": stats.to_dict(with_sizes=True)
+                    for (method, endpoint), stats in self._requests.items()
+                },
+                "operations": {
+                    operation: stats.to_dict(with_sizes=False) for operation, stats in self._operations.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            requests = [
+                ({"method": method, "endpoint": endpoint}, stats)
+                for (method, endpoint), stats in self._requests.items()
+            ]
+            operations = [({"operation": operation}, stats) for operation, stats in self._operations.items()]
+
+            lines = []
+            lines += _counter("argilla_http_requests_total", "HTTP requests sent.", requests, lambda s: s.count)
+            lines += _errors(
+                "argilla_http_request_errors_total", "HTTP requests answered with an error status.", requests
+            )
+            lines += _summary("argilla_http_request_duration_seconds", "HTTP request latency.", requests)
+            lines += _counter(
+                "argilla_http_request_bytes_total",
+                "Bytes sent in HTTP request bodies.",
+                requests,
+                lambda s: s.request_bytes,
+            )
+            lines += _counter(
+                "argilla_http_response_bytes_total",
+                "Bytes received in HTTP response bodies.",
+                requests,
+                lambda s: s.response_bytes,
+            )
+            lines += _counter(
+                "argilla_api_operations_total", "Resource API method calls.", operations, lambda s: s.count
+            )
+            lines += _errors("argilla_api_operation_errors_total", "Resource API method calls that failed.", operations)
+            lines += _summary("argilla_api_operation_duration_seconds", "Resource API method latency.", operations)
+            return "\n".join(lines) + "\n"
+
+    ############################
+    # Observers
+    ############################
+
+    def observe_operation(self, operation: str, duration: float, error: Optional[BaseException] = None) -> None:
+        """Records a call of a resource API method, with the class name of the exception it raised, if any."""
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = self._operations[operation] = _Stats(self.sample_size)
+            stats.observe(duration, error=type(error).__name__ if error is not None else None)
+
+    def on_request(self, request: httpx.Request) -> None:
+        """HTTP client event hook marking the start of a request."""
+        request.extensions[_START_EXTENSION] = time.perf_counter()
+
+    def on_response(self, response: httpx.Response) -> None:
+        """HTTP client event hook recording a response."""
+        request = response.request
+        start = request.extensions.get(_START_EXTENSION)
+        response.read()
+        duration = time.perf_counter() - start if start is not None else 0.0
+
+        key = (request.method, _endpoint(request.url.path))
+        with self._lock:
+            stats = self._requests.get(key)
+            if stats is None:
+                stats = self._requests[key] = _Stats(self.sample_size)
+            stats.observe(duration, error=str(response.status_code) if response.is_error else None)
+            stats.request_bytes += int(request.headers.get("content-length", 0))
+            # Responses built in memory, e.g. by mock transports, are not downloaded
+            stats.response_bytes += response.num_bytes_downloaded or len(response.content)
+
+    def event_hooks(self) -> Dict[str, List]:
+        """The event hooks feeding the registry, to pass to an `httpx.Client`."""
+        return {"request": [self.on_request], "response": [self.on_response]}
+
+
+def _endpoint(path: str) -> str:
+    return "/".join("{id}" if _UUID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    escaped = {name: value.replace("\\", "\\\\").replace('"', '\\"') for name, value in labels.items()}
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped.items()) + "}"
+
+
+def _counter(name: str, help: str, series: List[Tuple[Dict[str, str], _Stats]], value) -> List[str]:
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} counter"]
+    lines += [f"{name}{_labels(labels)} {value(stats)}" for labels, stats in series]
+    return lines
+
+
+def _errors(name: str, help: str, series: List[Tuple[Dict[str, str], _Stats]]) -> List[str]:
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} counter"]
+    for labels, stats in series:
+        lines += [f"{name}{_labels({**labels, 'error': error})} {count}" for error, count in stats.errors.items()]
+    return lines
+
+
+def _summary(name: str, help: str, series: List[Tuple[Dict[str, str], _Stats]]) -> List[str]:
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} summary"]
+    for labels, stats in series:
+        for quantile, value in stats.quantiles().items():
+            lines.append(f"{name}{_labels({**labels, 'quantile': str(quantile)})} {value}")
+        lines.append(f"{name}_sum{_labels(labels)} {stats.duration_sum}")
+        lines.append(f"{name}_count{_labels(labels)} {stats.count}")
+    return lines
@@ -16,7 +16,7 @@ from typing import List, Dict
 from uuid import UUID
 
 import httpx
-from argilla_sdk._api._base import ResourceAPI
+from argilla_sdk._api._base import ResourceAPI, coalesce_requests
 from argilla_sdk._exceptions import api_error_handler
 from argilla_sdk._models import (
     TextQuestionModel,
@@ -74,8 +74,9 @@ class QuestionsAPI(ResourceAPI[QuestionBaseModel]):
 
     @api_error_handler
     def delete(self, question_id: UUID) -> None:
-        # TODO: Implement delete method for fields with server side ID
-        raise NotImplementedError
+        url = f"/api/v1/questions/{question_id}"
+        self.http_client.delete(url).raise_for_status()
+        self._log_message(message=f"Deleted question {question_id}")
 
     ####################
     # Utility methods #
@@ -88,6 +89,7 @@ class QuestionsAPI(ResourceAPI[QuestionBaseModel]):
             response_models.append(response_model)
         return response_models
 
+    @coalesce_requests
     @api_error_handler
     def list(self, dataset_id: UUID) -> List[QuestionModel]:
         response = self.http_client.get(f"/api/v1/datasets/{dataset_id}/questions")
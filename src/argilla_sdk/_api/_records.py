@@ -19,7 +19,8 @@ import httpx
 from typing_extensions import deprecated
 
 from argilla_sdk._api._base import ResourceAPI
-from argilla_sdk._exceptions import api_error_handler
+from argilla_sdk._exceptions import ArgillaAPIError, api_error_handler
+from argilla_sdk._helpers import current_api_span
 from argilla_sdk._models import RecordModel, UserResponseModel, SearchQueryModel
 
 __all__ = ["RecordsAPI"]
@@ -30,6 +31,8 @@ class RecordsAPI(ResourceAPI[RecordModel]):
 
     MAX_RECORDS_PER_CREATE_BULK = 500
     MAX_RECORDS_PER_UPSERT_BULK = 500
+    MAX_RECORDS_PER_DELETE_BULK = 100
+    MAX_RESPONSES_PER_CREATE_BULK = 100
 
     http_client: httpx.Client
 
@@ -71,6 +74,7 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         with_suggestions: bool = True,
         with_responses: bool = True,
         with_vectors: Optional[Union[List, bool]] = None,
+        sort_by: Optional[List[str]] = None,
     ) -> List[RecordModel]:
         """List records in a dataset
         Args:
@@ -80,6 +84,7 @@ class RecordsAPI(ResourceAPI[RecordModel]):
             with_vectors: The name of vectors to include
             with_suggestions: Whether to include suggestions
             with_responses: Whether to include responses
+            sort_by: The sort criteria, as a list of `<property>:<asc|desc>` strings. For example `["inserted_at:asc"]`
         """
         include = []
         if with_suggestions:
@@ -94,11 +99,14 @@ class RecordsAPI(ResourceAPI[RecordModel]):
             "limit": limit,
             "include": include,
         }
+        if sort_by:
+            params["sort_by"] = sort_by
 
         response = self.http_client.get(f"/api/v1/datasets/{dataset_id}/records", params=params)
         response.raise_for_status()
         response_json = response.json()
         json_records = response_json["items"]
+        current_api_span().set_attribute("argilla.records.count", len(json_records))
         return self._model_from_jsons(json_records)
 
     @api_error_handler
@@ -110,6 +118,7 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         limit: int = 100,
         with_suggestions: bool = True,
         with_responses: bool = True,
+        sort_by: Optional[List[str]] = None,
         # TODO: Add support for `with_vectors`
     ) -> Tuple[List[Tuple[RecordModel, float]], int]:
         include = []
@@ -122,6 +131,8 @@ class RecordsAPI(ResourceAPI[RecordModel]):
             "limit": limit,
             "include": include,
         }
+        if sort_by:
+            params["sort_by"] = sort_by
         response = self.http_client.post(
             f"/api/v1/datasets/{dataset_id}/records/search", json=query.model_dump(by_alias=True), params=params
         )
@@ -129,6 +140,8 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         response_json = response.json()
         json_items = response_json["items"]
         total = response_json["total"]
+        current_api_span().set_attribute("argilla.records.count", len(json_items))
+        current_api_span().set_attribute("argilla.records.total", total)
         return [(self._model_from_json(item["record"]), item["query_score"]) for item in json_items], total
 
     @api_error_handler
@@ -154,6 +167,18 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         response.raise_for_status()
         self._log_message(message=f"Updated {len(records)} records in dataset {dataset_id}")
 
+    @api_error_handler
+    def delete_many(self, dataset_id: UUID, records_ids: List[UUID]) -> None:
+        if len(records_ids) > self.MAX_RECORDS_PER_DELETE_BULK:
+            raise ValueError(f"Cannot delete more than {self.MAX_RECORDS_PER_DELETE_BULK} records at once")
+        response = self.http_client.delete(
+            url=f"/api/v1/datasets/{dataset_id}/records",
+            params={"ids": ",".join(str(record_id) for record_id in records_ids)},
+        )
+        response.raise_for_status()
+        current_api_span().set_attribute("argilla.records.count", len(records_ids))
+        self._log_message(message=f"Deleted {len(records_ids)} records from dataset {dataset_id}")
+
     @api_error_handler
     def bulk_create(
         self, dataset_id: UUID, records: List[RecordModel]
@@ -167,14 +192,24 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         )
         response.raise_for_status()
         response_json = response.json()
+        current_api_span().set_attribute("argilla.records.count", len(records))
         self._log_message(message=f"Created {len(records)} in dataset {dataset_id}")
         return self._model_from_jsons(response_jsons=response_json["items"])
 
     @api_error_handler
-    def bulk_upsert(self, dataset_id: UUID, records: List[RecordModel]) -> Tuple[List[RecordModel], int]:
+    def bulk_upsert(
+        self, dataset_id: UUID, records: List[RecordModel], partial: bool = False
+    ) -> Tuple[List[RecordModel], int]:
+        """Creates or updates records in a dataset
+        Args:
+            dataset_id: The ID of the dataset
+            records: The records to create or update
+            partial: Whether to send only the attributes set in the record models, so that the rest of the
+                attributes of existing records are left untouched
+        """
         if len(records) > self.MAX_RECORDS_PER_UPSERT_BULK:
             raise ValueError(f"Cannot upsert more than {self.MAX_RECORDS_PER_UPSERT_BULK} records at once")
-        record_dicts = [record.model_dump() for record in records]
+        record_dicts = [record.model_dump(exclude_unset=partial) for record in records]
         response = self.http_client.put(
             url=f"/api/v1/datasets/{dataset_id}/records/bulk",
             json={"items": record_dicts},
@@ -182,11 +217,35 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         response.raise_for_status()
         response_json = response.json()
         updated = len(response_json.get("updated_item_ids", []))
+        current_api_span().set_attribute("argilla.records.count", len(records))
+        current_api_span().set_attribute("argilla.records.updated", updated)
         self._log_message(
             message=f"Updated {updated} records and create {len(records) - updated} records in dataset {dataset_id}"
         )
         return self._model_from_jsons(response_jsons=response_json["items"]), updated
 
+    @api_error_handler
+    def bulk_upsert_serialized(self, dataset_id: UUID, content: bytes) -> Tuple[List[RecordModel], int]:
+        """Creates or updates records in a dataset from an already serialized request body
+        Args:
+            dataset_id: The ID of the dataset
+            content: The JSON body of the request, with the records to create or update under the "items" key
+        """
+        response = self.http_client.put(
+            url=f"/api/v1/datasets/{dataset_id}/records/bulk",
+            content=content,
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        response_json = response.json()
+        updated = len(response_json.get("updated_item_ids", []))
+        current_api_span().set_attribute("argilla.records.count", len(response_json["items"]))
+        current_api_span().set_attribute("argilla.records.updated", updated)
+        self._log_message(
+            message=f"Updated {updated} records and create {len(response_json['items']) - updated} records in dataset {dataset_id}"
+        )
+        return self._model_from_jsons(response_jsons=response_json["items"]), updated
+
     ####################
     # Response methods #
     ####################
@@ -198,13 +257,42 @@ class RecordsAPI(ResourceAPI[RecordModel]):
             json=user_response.model_dump(),
         ).raise_for_status()
 
+    @api_error_handler
+    def bulk_create_responses(self, responses: List[Tuple[UUID, UserResponseModel]]) -> List[Optional[str]]:
+        """Creates responses for the current user in many records with a single request.
+
+        Args:
+            responses: The responses to create, as pairs of record id and user response.
+
+        Returns:
+            A list aligned with the responses, with the error detail of every failed response or None.
+        """
+        if len(responses) > self.MAX_RESPONSES_PER_CREATE_BULK:
+            raise ValueError(f"Cannot create more than {self.MAX_RESPONSES_PER_CREATE_BULK} responses at once")
+        items = [
+            {**user_response.model_dump(exclude={"user_id"}), "record_id": str(record_id)}
+            for record_id, user_response in responses
+        ]
+        response = self.http_client.post(url="/api/v1/me/responses/bulk", json={"items": items})
+        response.raise_for_status()
+        response_json = response.json()
+
+        errors = [item.get("error") for item in response_json["items"]]
+        errors = [error and str(error.get("detail", error)) for error in errors]
+        self._log_message(message=f"Created {errors.count(None)} of {len(responses)} responses")
+        return errors
+
     def create_record_responses(self, record: RecordModel) -> None:
         if not record.responses:
             return
         if not record.id:
             raise ValueError("Record must have an ID to create responses")
-        for record_response in record.responses:
-            self.create_record_response(record_id=record.id, user_response=record_response)
+        responses = [(record.id, record_response) for record_response in record.responses]
+        for batch in range(0, len(responses), self.MAX_RESPONSES_PER_CREATE_BULK):
+            errors = self.bulk_create_responses(responses=responses[batch : batch + self.MAX_RESPONSES_PER_CREATE_BULK])
+            errors = [error for error in errors if error]
+            if errors:
+                raise ArgillaAPIError(f"Cannot create responses for record {record.id}: {errors}")
 
     ####################
     # Private methods #
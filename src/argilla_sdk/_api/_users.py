@@ -17,7 +17,7 @@ from uuid import UUID
 
 import httpx
 
-from argilla_sdk._api._base import ResourceAPI
+from argilla_sdk._api._base import ResourceAPI, coalesce_requests
 from argilla_sdk._exceptions import api_error_handler
 from argilla_sdk._models._user import UserModel
 
@@ -43,6 +43,7 @@ class UsersAPI(ResourceAPI[UserModel]):
 
         return user_created
 
+    @coalesce_requests
     @api_error_handler
     def get(self, user_id: UUID) -> UserModel:
         # TODO: Implement this endpoint in the API
@@ -67,6 +68,7 @@ class UsersAPI(ResourceAPI[UserModel]):
     # V0 API methods #
     ####################
 
+    @coalesce_requests
     @api_error_handler
     def list(self) -> List[UserModel]:
         response = self.http_client.get(url="/api/users")
@@ -76,6 +78,7 @@ class UsersAPI(ResourceAPI[UserModel]):
         self._log_message(message=f"Listed {len(users)} users")
         return users
 
+    @coalesce_requests
     @api_error_handler
     def list_by_workspace_id(self, workspace_id: UUID) -> List[UserModel]:
         response = self.http_client.get(url=f"/api/workspaces/{workspace_id}/users")
@@ -85,6 +88,7 @@ class UsersAPI(ResourceAPI[UserModel]):
         self._log_message(message=f"Listed {len(users)} users")
         return users
 
+    @coalesce_requests
     @api_error_handler
     def get_me(self) -> UserModel:
         response = self.http_client.get("/api/me")
@@ -17,7 +17,7 @@ from uuid import UUID
 
 import httpx
 
-from argilla_sdk._api._base import ResourceAPI
+from argilla_sdk._api._base import ResourceAPI, coalesce_requests
 from argilla_sdk._exceptions import api_error_handler
 from argilla_sdk._models import VectorFieldModel
 
@@ -64,6 +64,7 @@ class VectorsAPI(ResourceAPI[VectorFieldModel]):
     # Utility methods #
     ####################
 
+    @coalesce_requests
     @api_error_handler
     def list(self, dataset_id: UUID) -> List[VectorFieldModel]:
         response = self.http_client.get(f"/api/v1/datasets/{dataset_id}/vectors-settings")
@@ -17,7 +17,7 @@ from uuid import UUID
 
 import httpx
 
-from argilla_sdk._api._base import ResourceAPI
+from argilla_sdk._api._base import ResourceAPI, coalesce_requests
 from argilla_sdk._exceptions._api import api_error_handler
 from argilla_sdk._models._workspace import WorkspaceModel
 
@@ -42,6 +42,7 @@ class WorkspacesAPI(ResourceAPI[WorkspaceModel]):
         self._log_message(message=f"Created workspace {workspace.name}")
         return workspace
 
+    @coalesce_requests
     @api_error_handler
     def get(self, workspace_id: UUID) -> WorkspaceModel:
         response = self.http_client.get(url=f"{self.url_stub}/{workspace_id}")
@@ -55,6 +56,7 @@ class WorkspacesAPI(ResourceAPI[WorkspaceModel]):
         response = self.http_client.delete(url=f"{self.url_stub}/{workspace_id}")
         response.raise_for_status()
 
+    @coalesce_requests
     def exists(self, workspace_id: UUID) -> bool:
         response = self.http_client.get(url=f"{self.url_stub}/{workspace_id}")
         return response.status_code == 200
@@ -63,6 +65,7 @@ class WorkspacesAPI(ResourceAPI[WorkspaceModel]):
     # Utility methods #
     ####################
 
+    @coalesce_requests
     @api_error_handler
     def list(self) -> List[WorkspaceModel]:
         response = self.http_client.get(url="/api/v1/me/workspaces")
@@ -72,6 +75,7 @@ class WorkspacesAPI(ResourceAPI[WorkspaceModel]):
         self._log_message(message=f"Got {len(workspaces)} workspaces")
         return workspaces
 
+    @coalesce_requests
     @api_error_handler
     def list_by_user_id(self, user_id: UUID) -> List[WorkspaceModel]:
         response = self.http_client.get(f"/api/v1/users/{user_id}/workspaces")
@@ -81,6 +85,7 @@ class WorkspacesAPI(ResourceAPI[WorkspaceModel]):
         self._log_message(message=f"Got {len(workspaces)} workspaces")
         return workspaces
 
+    @coalesce_requests
     @api_error_handler
     def list_current_user_workspaces(self) -> List[WorkspaceModel]:
         response = self.http_client.get(url="/api/v1/me/workspaces")
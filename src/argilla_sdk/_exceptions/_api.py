@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import time
+
 from httpx import HTTPStatusError
 
 from argilla_sdk._exceptions._base import ArgillaErrorBase
+from argilla_sdk._helpers._tracing import trace_api_span
 
 
 class ArgillaAPIError(ArgillaErrorBase):
@@ -51,7 +55,7 @@ class UnauthorizedError(ArgillaAPIError):
 
 def api_error_handler(func):
     """Decorator to handle API errors from ResourceAPI methods
-    and raise the appropriate exception.
+    and raise the appropriate exception. The calls are recorded in the metrics of the ResourceAPI, if any.
     Args: func: the request method to decorate
 
     Example:
@@ -76,10 +80,36 @@ def api_error_handler(func):
         exception_class = switch.get(status_code, ArgillaAPIError)
         raise exception_class(f"{exception_class.message}. Details: {error_detail}")
 
-    def _handler_wrapper(*args, **kwargs):
+    def _call(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except HTTPStatusError as e:
             _error_switch(status_code=e.response.status_code, error_detail=e.response.text)
 
+    def _observe(*args, **kwargs):
+        metrics = getattr(args[0], "_metrics", None) if args else None
+        if metrics is None:
+            return _call(*args, **kwargs)
+
+        start = time.perf_counter()
+        error = None
+        try:
+            return _call(*args, **kwargs)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            operation = f"{type(args[0]).__name__}.{func.__name__}"
+            metrics.observe_operation(operation, duration=time.perf_counter() - start, error=error)
+
+    @functools.wraps(func)
+    def _handler_wrapper(*args, **kwargs):
+        tracer = getattr(args[0], "_tracer", None) if args else None
+        if tracer is None:
+            return _observe(*args, **kwargs)
+
+        # The requests sent by the method set their attributes on its span
+        with trace_api_span(tracer, f"{type(args[0]).__name__}.{func.__name__}"):
+            return _observe(*args, **kwargs)
+
     return _handler_wrapper
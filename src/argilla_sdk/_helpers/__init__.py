@@ -12,7 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from ._concurrency import *  # noqa
 from ._dataclasses import *  # noqa
 from ._iterator import *  # noqa
 from ._log import *  # noqa
 from ._uuid import *  # noqa
+from ._snapshot import *  # noqa
+from ._singleflight import *  # noqa
+from ._tracing import *  # noqa
+from ._progress import *  # noqa
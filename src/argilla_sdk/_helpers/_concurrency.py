@@ -0,0 +1,58 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+__all__ = ["map_concurrently", "DEFAULT_MAX_WORKERS"]
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def map_concurrently(
+    fn: Callable[[Item], Result],
+    items: Iterable[Item],
+    max_workers: Optional[int] = DEFAULT_MAX_WORKERS,
+) -> List[Result]:
+    """Applies a function to every item using a pool of threads, which is suitable for I/O bound
+    work like API requests. The results are returned in the same order as the items and the first
+    raised exception is propagated to the caller. The function runs in a copy of the context of the caller,
+    so the default client and the open tracing spans of the caller are used in the threads.
+
+    Args:
+        fn (Callable): The function to apply to every item.
+        items (Iterable): The items to process.
+        max_workers (Optional[int]): The maximum number of threads. If 1 or None, items are processed serially.
+
+    Returns:
+        List: The results of the function, in the same order as the items.
+    """
+    items = list(items)
+    max_workers = min(max_workers or 1, len(items))
+
+    if max_workers <= 1:
+        return [fn(item) for item in items]
+
+    context = contextvars.copy_context()
+
+    def run_in_context(item: Item) -> Result:
+        # A context can only be entered by one thread at a time, so every call runs in its own copy
+        return context.copy().run(fn, item)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_in_context, items))
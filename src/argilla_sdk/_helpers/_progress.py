@@ -0,0 +1,245 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Protocol
+
+__all__ = ["Progress", "ProgressCallback", "ProgressTracker", "TqdmProgress", "track_progress", "current_progress"]
+
+
+@dataclass(frozen=True)
+class Progress:
+    """The progress of a long-running records operation, like `DatasetRecords.log` or `DatasetRecords.to_json`.
+
+    Attributes:
+        operation (str): The name of the operation, e.g. "DatasetRecords.log".
+        records (int): The number of records processed so far.
+        total (Optional[int]): The number of records to process, if known.
+        bytes_sent (int): The number of bytes sent in request bodies.
+        bytes_received (int): The number of bytes received in response bodies.
+        elapsed (float): The seconds since the operation started.
+        finished (bool): Whether the operation has finished.
+    """
+
+    operation: str
+    records: int = 0
+    total: Optional[int] = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    elapsed: float = 0.0
+    finished: bool = False
+
+    @property
+    def records_per_second(self) -> float:
+        """The average number of records processed per second."""
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """The estimated seconds until the operation finishes, if the total is known."""
+        if self.total is None or self.records_per_second == 0:
+            return None
+        return max(self.total - self.records, 0) / self.records_per_second
+
+
+class ProgressCallback(Protocol):
+    """A function receiving the progress of an operation after every processed batch of records, and once
+    more when the operation finishes."""
+
+    def __call__(self, progress: Progress) -> None: ...
+
+
+class ProgressTracker:
+    """Counts the progress of an operation and reports it to a callback. The HTTP client event hooks add the
+    sizes of the requests sent while the tracker is active, see `activate`.
+
+    Args:
+        callback (Optional[ProgressCallback]): The callback receiving the progress. If None, nothing is reported.
+        operation (str): The name of the operation.
+        total (Optional[int]): The number of records to process, if known.
+    """
+
+    def __init__(self, callback: Optional[ProgressCallback], operation: str, total: Optional[int] = None):
+        self.callback = callback
+        self.operation = operation
+        self._total = total
+        self._records = 0
+        self._bytes_sent = 0
+        self._bytes_received = 0
+        self._finished = False
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> Optional[int]:
+        return self._total
+
+    def set_total(self, total: int) -> None:
+        with self._lock:
+            self._total = total
+
+    def advance(self, records: int) -> None:
+        """Adds processed records and reports the progress."""
+        with self._lock:
+            self._records += records
+        self._report()
+
+    def add_bytes(self, sent: int = 0, received: int = 0) -> None:
+        """Adds bytes sent or received, which are reported with the next progress."""
+        with self._lock:
+            self._bytes_sent += sent
+            self._bytes_received += received
+
+    def finish(self) -> None:
+        """Reports the final progress. Further calls do nothing."""
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+        self._report()
+
+    def snapshot(self) -> Progress:
+        with self._lock:
+            return Progress(
+                operation=self.operation,
+                records=self._records,
+                total=self._total,
+                bytes_sent=self._bytes_sent,
+                bytes_received=self._bytes_received,
+                elapsed=time.perf_counter() - self._start,
+                finished=self._finished,
+            )
+
+    @contextmanager
+    def activate(self) -> Iterator["ProgressTracker"]:
+        """Makes the tracker the one returned by `current_progress` until the context is exited."""
+        token = _current_tracker.set(self)
+        try:
+            yield self
+        finally:
+            _current_tracker.reset(token)
+
+    def _report(self) -> None:
+        if self.callback is not None:
+            self.callback(self.snapshot())
+
+
+class _NoOpProgressTracker(ProgressTracker):
+    """The tracker of the operations run without a callback, which counts nothing"""
+
+    def set_total(self, total: int) -> None:
+        pass
+
+    def advance(self, records: int) -> None:
+        pass
+
+    def add_bytes(self, sent: int = 0, received: int = 0) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+
+_NO_OP_TRACKER = _NoOpProgressTracker(callback=None, operation="")
+
+# The tracker of the innermost operation tracked in the current thread or task
+_current_tracker: ContextVar[ProgressTracker] = ContextVar("argilla_current_progress", default=_NO_OP_TRACKER)
+
+
+@contextmanager
+def track_progress(
+    callback: Optional[ProgressCallback], operation: str, total: Optional[int] = None
+) -> Iterator[ProgressTracker]:
+    """Tracks the progress of an operation, reporting it to the callback.
+
+    Operations run without a callback report their progress to the operation running them, if any, so that
+    `Dataset.from_disk` reports the records logged by `DatasetRecords.log`.
+
+    Args:
+        callback (Optional[ProgressCallback]): The callback receiving the progress.
+        operation (str): The name of the operation, e.g. "DatasetRecords.log".
+        total (Optional[int]): The number of records to process, if known.
+    """
+    if callback is None:
+        tracker = current_progress()
+        if tracker.total is None and total is not None:
+            tracker.set_total(total)
+        yield tracker
+        return
+
+    tracker = ProgressTracker(callback=callback, operation=operation, total=total)
+    try:
+        with tracker.activate():
+            yield tracker
+    finally:
+        tracker.finish()
+
+
+def current_progress() -> ProgressTracker:
+    """Returns the tracker of the innermost tracked operation in the current context, or a tracker reporting
+    nothing."""
+    return _current_tracker.get()
+
+
+class TqdmProgress:
+    """A progress callback showing a tqdm progress bar, with the throughput and the bytes sent and received.
+    Requires the `tqdm` package.
+
+    ```python
+    dataset.records.log(records, progress=rg.TqdmProgress())
+    ```
+
+    Args:
+        **tqdm_kwargs: The arguments of the progress bar, like `position` or `leave`.
+    """
+
+    def __init__(self, **tqdm_kwargs: Any):
+        self.tqdm_kwargs = tqdm_kwargs
+        self._bar = None
+
+    def __call__(self, progress: Progress) -> None:
+        if self._bar is None:
+            self._bar = self._create_bar(progress)
+        if progress.total is not None and self._bar.total != progress.total:
+            self._bar.total = progress.total
+        self._bar.update(progress.records - self._bar.n)
+        self._bar.set_postfix(
+            sent=_format_bytes(progress.bytes_sent),
+            received=_format_bytes(progress.bytes_received),
+            refresh=False,
+        )
+        if progress.finished:
+            self._bar.close()
+            self._bar = None
+
+    def _create_bar(self, progress: Progress):
+        try:
+            from tqdm.auto import tqdm
+        except ImportError as e:
+            raise ImportError("tqdm is not installed. Please install it using `pip install tqdm`.") from e
+
+        kwargs = {"desc": progress.operation, "unit": "records", **self.tqdm_kwargs}
+        return tqdm(total=progress.total, **kwargs)
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}TB"
@@ -0,0 +1,77 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+__all__ = ["SingleFlight"]
+
+Result = TypeVar("Result")
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key: the first caller runs the function and the callers arriving
+    while it runs wait for it and share its outcome, instead of running the function again. Calls made after the
+    function has returned run it again, so nothing is cached.
+
+    The waiting callers get a deep copy of the result, so they can modify it without affecting each other.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Result]) -> Result:
+        """Runs the function, or waits for the running call with the same key and returns its result.
+
+        Args:
+            key (Hashable): The key identifying identical calls.
+            fn (Callable): The function to run.
+
+        Returns:
+            The result of the function. Exceptions raised by the function are raised to every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
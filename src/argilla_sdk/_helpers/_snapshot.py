@@ -0,0 +1,117 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, List, NamedTuple, Optional, Tuple, TypeVar
+from uuid import UUID
+
+__all__ = ["ModelsSnapshot", "DEFAULT_SNAPSHOT_TTL"]
+
+Model = TypeVar("Model")
+
+DEFAULT_SNAPSHOT_TTL = 60.0
+
+
+class _SnapshotState(NamedTuple):
+    models: List[Any]
+    by_id: Dict[UUID, Any]
+    by_name: Dict[Any, Any]
+    taken_at: float
+
+
+class ModelsSnapshot(Generic[Model]):
+    """A snapshot of the models listed from the server, indexed by id and by name. The models are listed on
+    first use, and listed again when the snapshot is older than its time to live or has been invalidated.
+
+    Args:
+        list_models (Callable): The function listing the models from the server.
+        name_key (Callable): The function returning the name of a model, used as key of the name index.
+        ttl (Optional[float]): The seconds the snapshot is used before listing the models again. If None, the
+            models are only listed again after `refresh` or `invalidate`. If 0, every access lists the models.
+    """
+
+    def __init__(
+        self,
+        list_models: Callable[[], List[Model]],
+        name_key: Callable[[Model], Any],
+        ttl: Optional[float] = DEFAULT_SNAPSHOT_TTL,
+    ):
+        self.ttl = ttl
+        self._list_models = list_models
+        self._name_key = name_key
+        self._state: Optional[_SnapshotState] = None
+        self._lock = threading.Lock()
+
+    @property
+    def models(self) -> List[Model]:
+        """The listed models, in the order returned by the server."""
+        state, _ = self._current_state()
+        return state.models
+
+    def get_by_id(self, id: UUID) -> Optional[Model]:
+        """Returns the model with the id, listing the models again when it is not in the snapshot."""
+        return self._lookup(lambda state: state.by_id.get(id))
+
+    def get_by_name(self, name: Any) -> Optional[Model]:
+        """Returns the model with the name, listing the models again when it is not in the snapshot."""
+        return self._lookup(lambda state: state.by_name.get(name))
+
+    def refresh(self) -> None:
+        """Lists the models from the server, replacing the snapshot."""
+        self._refresh()
+
+    def invalidate(self) -> None:
+        """Discards the snapshot, so the models are listed again on the next access."""
+        self._state = None
+
+    ############################
+    # Private methods
+    ############################
+
+    def _lookup(self, find: Callable[[_SnapshotState], Optional[Model]]) -> Optional[Model]:
+        state, listed = self._current_state()
+        model = find(state)
+        # The model may have been created after the snapshot was taken, by another client or process
+        if model is None and not listed:
+            model = find(self._refresh())
+        return model
+
+    def _refresh(self) -> _SnapshotState:
+        with self._lock:
+            self._state = self._take()
+            return self._state
+
+    def _current_state(self) -> Tuple[_SnapshotState, bool]:
+        """Returns the snapshot, taking it when there is none or it is expired, and whether it was taken now."""
+        state = self._state
+        if state is not None and not self._is_expired(state):
+            return state, False
+        with self._lock:
+            if self._state is None or self._is_expired(self._state):
+                self._state = self._take()
+                return self._state, True
+            return self._state, False
+
+    def _is_expired(self, state: _SnapshotState) -> bool:
+        return self.ttl is not None and time.monotonic() - state.taken_at >= self.ttl
+
+    def _take(self) -> _SnapshotState:
+        models = list(self._list_models())
+        return _SnapshotState(
+            models=models,
+            by_id={model.id: model for model in models},
+            by_name={self._name_key(model): model for model in models},
+            taken_at=time.monotonic(),
+        )
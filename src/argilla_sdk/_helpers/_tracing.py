@@ -0,0 +1,110 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, ContextManager, Dict, Iterator, Optional, Protocol, runtime_checkable
+
+__all__ = ["Span", "Tracer", "NoOpTracer", "trace_span", "trace_api_span", "current_span", "current_api_span"]
+
+
+@runtime_checkable
+class Span(Protocol):
+    """A span of a tracer. OpenTelemetry spans implement this interface."""
+
+    def set_attribute(self, key: str, value: Any) -> None: ...
+
+
+@runtime_checkable
+class Tracer(Protocol):
+    """A tracer opening the spans of the SDK operations. OpenTelemetry tracers, as returned by
+    `opentelemetry.trace.get_tracer`, implement this interface."""
+
+    def start_as_current_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager[Span]:
+        """Opens a span, which is the parent of the spans opened until it is closed."""
+        ...
+
+
+class _NoOpSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+class NoOpTracer:
+    """The default tracer, which does not record anything."""
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        yield _NO_OP_SPAN
+
+
+_NO_OP_SPAN = _NoOpSpan()
+
+# The innermost span opened by the SDK in the current thread or task
+_current_span: ContextVar[Span] = ContextVar("argilla_current_span", default=_NO_OP_SPAN)
+# The span of the innermost resource API method in the current thread or task
+_current_api_span: ContextVar[Optional[Span]] = ContextVar("argilla_current_api_span", default=None)
+
+
+@contextmanager
+def trace_span(tracer: Optional[Tracer], name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+    """Opens a span with the tracer, which is returned by `current_span` until it is closed.
+
+    Args:
+        tracer (Optional[Tracer]): The tracer. If None or a `NoOpTracer`, nothing is recorded.
+        name (str): The name of the span, e.g. "DatasetRecords.log".
+        attributes (Optional[Dict[str, Any]]): The attributes of the span, e.g. `{"argilla.records.count": 100}`.
+            Attributes with None values are not set.
+    """
+    if tracer is None or isinstance(tracer, NoOpTracer):
+        yield _NO_OP_SPAN
+        return
+
+    attributes = {key: value for key, value in (attributes or {}).items() if value is not None}
+    with tracer.start_as_current_span(name, attributes=attributes) as span:
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+
+
+@contextmanager
+def trace_api_span(tracer: Optional[Tracer], name: str) -> Iterator[Span]:
+    """Opens the span of a resource API method, which is returned by `current_api_span` while it is the innermost
+    span. The requests sent by the method set their attributes on it.
+
+    Args:
+        tracer (Optional[Tracer]): The tracer. If None or a `NoOpTracer`, nothing is recorded.
+        name (str): The name of the span, e.g. "RecordsAPI.bulk_upsert".
+    """
+    with trace_span(tracer, name) as span:
+        token = _current_api_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_api_span.reset(token)
+
+
+def current_span() -> Span:
+    """Returns the innermost span opened by `trace_span` in the current context, or a span recording nothing."""
+    return _current_span.get()
+
+
+def current_api_span() -> Span:
+    """Returns the innermost span if it was opened by `trace_api_span`, or a span recording nothing. Requests sent
+    outside a resource API method, like `DatasetsAPI.exists`, do not set their attributes on the span of the
+    operation sending them."""
+    span = _current_span.get()
+    return span if span is _current_api_span.get() else _NO_OP_SPAN
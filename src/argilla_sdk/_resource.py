@@ -33,6 +33,8 @@ class Resource(LoggingMixin):
     _api: "ResourceAPI"
 
     _MAX_OUTDATED_RETENTION = 30
+    # The collection of the client listing this kind of resource, e.g. "datasets", if any
+    _collection_name: Optional[str] = None
 
     def __init__(self, api: Optional["ResourceAPI"] = None, client: Optional["Argilla"] = None) -> None:
         self._client = client
@@ -81,6 +83,7 @@ class Resource(LoggingMixin):
         response_model = self._api.create(self._model)
         self._model = response_model
         self._update_last_api_call()
+        self._invalidate_collection()
         self._log_message(f"Resource created: {self}")
         return self
 
@@ -95,12 +98,14 @@ class Resource(LoggingMixin):
         response_model = self._api.update(self._model)
         self._model = response_model
         self._update_last_api_call()
+        self._invalidate_collection()
         self._log_message(f"Resource updated: {self}")
         return self
 
     def delete(self) -> None:
         self._api.delete(self._model.id)
         self._update_last_api_call()
+        self._invalidate_collection()
         self._log_message(f"Resource deleted: {self}")
 
     ############################
@@ -119,6 +124,10 @@ class Resource(LoggingMixin):
         except Exception as e:
             raise ArgillaSerializeError(f"Failed to serialize the resource. {e.__class__.__name__}") from e
 
+    def _invalidate_collection(self) -> None:
+        if self._collection_name is not None and self._client is not None:
+            self._client._invalidate_collection(self._collection_name)
+
     def _update_last_api_call(self):
         self._last_api_call = datetime.utcnow()
 
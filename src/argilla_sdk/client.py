@@ -15,11 +15,14 @@
 import warnings
 from abc import abstractmethod
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, overload, List, Optional, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, overload, Any, Iterator, List, Optional, Tuple, Union
+from uuid import UUID
 
 from argilla_sdk import _api
 from argilla_sdk._api._client import DEFAULT_HTTP_CONFIG
-from argilla_sdk._helpers import GenericIterator
+from argilla_sdk._helpers import DEFAULT_SNAPSHOT_TTL, GenericIterator, ModelsSnapshot
 from argilla_sdk._helpers._resource_repr import ResourceHTMLReprMixin
 from argilla_sdk._models import UserModel, WorkspaceModel, DatasetModel
 
@@ -27,15 +30,23 @@ if TYPE_CHECKING:
     from argilla_sdk import Workspace
     from argilla_sdk import Dataset
     from argilla_sdk import User
+    from argilla_sdk._api import DatasetsAPI, UsersAPI, WorkspacesAPI
+    from argilla_sdk._helpers import Tracer
 
     from IPython.display import HTML
 
 __all__ = ["Argilla"]
 
+# The default client of the current thread or task, set with `Argilla.as_default`
+_context_default_client: ContextVar[Optional["Argilla"]] = ContextVar("argilla_default_client", default=None)
+
 
 class Argilla(_api.APIClient):
     """Argilla API client. This is the main entry point to interact with the API.
 
+    Resources created without a client use the default client: the client set with `as_default` in the
+    current thread or task, or else the last client created in the process.
+
     Attributes:
         workspaces: A collection of workspaces.
         datasets: A collection of datasets.
@@ -52,26 +63,43 @@ class Argilla(_api.APIClient):
         api_url: Optional[str] = DEFAULT_HTTP_CONFIG.api_url,
         api_key: Optional[str] = DEFAULT_HTTP_CONFIG.api_key,
         timeout: int = DEFAULT_HTTP_CONFIG.timeout,
+        coalesce_requests: bool = False,
+        tracer: Optional["Tracer"] = None,
         **http_client_args,
     ) -> None:
-        super().__init__(api_url=api_url, api_key=api_key, timeout=timeout, **http_client_args)
+        super().__init__(
+            api_url=api_url,
+            api_key=api_key,
+            timeout=timeout,
+            coalesce_requests=coalesce_requests,
+            tracer=tracer,
+            **http_client_args,
+        )
 
+        self._init_collections()
         self._set_default(self)
 
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        self._init_collections()
+        # A client unpickled in a worker process is the default client when there is none yet
+        if self.__class__._default_client is None:
+            self._set_default(self)
+
     @property
     def workspaces(self) -> "Workspaces":
         """A collection of workspaces on the server."""
-        return Workspaces(client=self)
+        return self._workspaces
 
     @property
     def datasets(self) -> "Datasets":
         """A collection of datasets on the server."""
-        return Datasets(client=self)
+        return self._datasets
 
     @property
     def users(self) -> "Users":
         """A collection of users on the server."""
-        return Users(client=self)
+        return self._users
 
     @property
     def me(self) -> "User":
@@ -80,10 +108,36 @@ class Argilla(_api.APIClient):
 
         return User(client=self, _model=self.api.users.get_me())
 
+    @contextmanager
+    def as_default(self) -> Iterator["Argilla"]:
+        """Uses the client as the default client of the current thread or task within the context.
+
+        ```python
+        with client.as_default():
+            dataset = rg.Dataset(name="my_dataset")  # uses `client`
+        ```
+        """
+        token = _context_default_client.set(self)
+        try:
+            yield self
+        finally:
+            _context_default_client.reset(token)
+
     ############################
     # Private methods
     ############################
 
+    def _init_collections(self) -> None:
+        self._workspaces = Workspaces(client=self)
+        self._datasets = Datasets(client=self)
+        self._users = Users(client=self)
+
+    def _invalidate_collection(self, name: str) -> None:
+        """Discards the resources cached by a collection after one of them is created, updated or deleted"""
+        collection = self.__dict__.get(f"_{name}")
+        if collection is not None:
+            collection._invalidate()
+
     @classmethod
     def _set_default(cls, client: "Argilla") -> None:
         """Set the default instance of Argilla."""
@@ -92,50 +146,98 @@ class Argilla(_api.APIClient):
     @classmethod
     def _get_default(cls) -> "Argilla":
         """Get the default instance of Argilla. If it doesn't exist, create a new one."""
+        context_client = _context_default_client.get()
+        if context_client is not None:
+            return context_client
         if cls._default_client is None:
             cls._default_client = Argilla()
         return cls._default_client
 
 
-class Users(Sequence["User"], ResourceHTMLReprMixin):
+class _CachedCollection(ResourceHTMLReprMixin):
+    """Base class of the collections of the client, which list the resources once and keep a snapshot of them
+    indexed by id and name. The snapshot is listed again after `ttl` seconds, on `refresh`, when a lookup misses,
+    and when a resource of the collection is created, updated or deleted with the same client."""
+
+    def __init__(self, client: "Argilla", ttl: Optional[float] = DEFAULT_SNAPSHOT_TTL) -> None:
+        self._client = client
+        self._snapshot = ModelsSnapshot(list_models=self._list_models, name_key=self._name_key, ttl=ttl)
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """The seconds the listed resources are used before listing them again. None keeps them until `refresh`."""
+        return self._snapshot.ttl
+
+    @ttl.setter
+    def ttl(self, value: Optional[float]) -> None:
+        self._snapshot.ttl = value
+
+    def refresh(self) -> None:
+        """Lists the resources from the server again, replacing the cached ones."""
+        self._snapshot.refresh()
+
+    def __iter__(self):
+        return self._Iterator(self.list())
+
+    def __getitem__(self, index):
+        models = self._snapshot.models[index]
+        if isinstance(index, slice):
+            return [self._from_model(model) for model in models]
+        return self._from_model(models)
+
+    def __len__(self) -> int:
+        return len(self._snapshot.models)
+
+    def list(self) -> list:
+        return [self._from_model(model) for model in self._snapshot.models]
+
+    ############################
+    # Private methods
+    ############################
+
+    def _repr_html_(self) -> "HTML":
+        return self._represent_as_html(resources=self.list())
+
+    def _invalidate(self) -> None:
+        self._snapshot.invalidate()
+
+    def _list_models(self) -> list:
+        return self._api.list()
+
+    @staticmethod
+    def _name_key(model) -> Any:
+        return model.name
+
+
+class Users(_CachedCollection, Sequence["User"]):
     """A collection of users. It can be used to create a new user or to get an existing one."""
 
     class _Iterator(GenericIterator["User"]):
         pass
 
-    def __init__(self, client: "Argilla") -> None:
-        self._client = client
-        self._api = client.api.users
+    @property
+    def _api(self) -> "UsersAPI":
+        return self._client.api.users
 
     def __call__(self, username: str, **kwargs) -> "User":
         from argilla_sdk.users import User
 
-        user_models = self._api.list()
-        for model in user_models:
-            if model.username == username:
-                return User(_model=model, client=self._client)
+        model = self._snapshot.get_by_name(username)
+        if model is not None:
+            return User(_model=model, client=self._client)
         warnings.warn(f"User {username} not found. Creating a new user. Do `user.create()` to create the user.")
         return User(username=username, client=self._client, **kwargs)
 
-    def __iter__(self):
-        return self._Iterator(self.list())
-
     @overload
     @abstractmethod
-    def __getitem__(self, index: int) -> "User":
-        ...
+    def __getitem__(self, index: int) -> "User": ...
 
     @overload
     @abstractmethod
-    def __getitem__(self, index: slice) -> Sequence["User"]:
-        ...
+    def __getitem__(self, index: slice) -> Sequence["User"]: ...
 
     def __getitem__(self, index):
-        model = self._api.list()[index]
-        return self._from_model(model)
-
-    def __len__(self) -> int:
-        return len(self._api.list())
+        return super().__getitem__(index)
 
     def add(self, user: "User") -> "User":
         """Add a new user to the Argilla platform.
@@ -150,77 +252,62 @@ class Users(Sequence["User"], ResourceHTMLReprMixin):
         return user.create()
 
     @overload
-    def list(self) -> List["User"]:
-        ...
+    def list(self) -> List["User"]: ...
 
     @overload
-    def list(self, workspace: "Workspace") -> List["User"]:
-        ...
+    def list(self, workspace: "Workspace") -> List["User"]: ...
 
     def list(self, workspace: Optional["Workspace"] = None) -> List["User"]:
         """List all users."""
         if workspace is not None:
-            models = self._api.list_by_workspace_id(workspace.id)
-        else:
-            models = self._api.list()
-
-        return [self._from_model(model) for model in models]
+            return [self._from_model(model) for model in self._api.list_by_workspace_id(workspace.id)]
+        return super().list()
 
     ############################
     # Private methods
     ############################
 
-    def _repr_html_(self) -> "HTML":
-        return self._represent_as_html(resources=self.list())
-
     def _from_model(self, model: UserModel) -> "User":
         from argilla_sdk.users import User
 
         return User(client=self._client, _model=model)
 
+    @staticmethod
+    def _name_key(model: UserModel) -> str:
+        return model.username
+
 
-class Workspaces(Sequence["Workspace"], ResourceHTMLReprMixin):
+class Workspaces(_CachedCollection, Sequence["Workspace"]):
     """A collection of workspaces. It can be used to create a new workspace or to get an existing one."""
 
     class _Iterator(GenericIterator["Workspace"]):
         pass
 
-    def __init__(self, client: "Argilla") -> None:
-        self._client = client
-        self._api = client.api.workspaces
+    @property
+    def _api(self) -> "WorkspacesAPI":
+        return self._client.api.workspaces
 
     def __call__(self, name: str, **kwargs) -> "Workspace":
         from argilla_sdk.workspaces import Workspace
 
-        workspace_models = self._api.list()
-
-        for model in workspace_models:
-            if model.name == name:
-                return Workspace(_model=model, client=self._client)
+        model = self._snapshot.get_by_name(name)
+        if model is not None:
+            return Workspace(_model=model, client=self._client)
         warnings.warn(
             f"Workspace {name} not found. Creating a new workspace. Do `workspace.create()` to create the workspace."
         )
         return Workspace(name=name, client=self._client, **kwargs)
 
-    def __iter__(self):
-        return self._Iterator(self.list())
-
     @overload
     @abstractmethod
-    def __getitem__(self, index: int) -> "Workspace":
-        ...
+    def __getitem__(self, index: int) -> "Workspace": ...
 
     @overload
     @abstractmethod
-    def __getitem__(self, index: slice) -> Sequence["Workspace"]:
-        ...
+    def __getitem__(self, index: slice) -> Sequence["Workspace"]: ...
 
     def __getitem__(self, index) -> "Workspace":
-        model = self._api.list()[index]
-        return self._from_model(model)
-
-    def __len__(self) -> int:
-        return len(self._api.list())
+        return super().__getitem__(index)
 
     def add(self, workspace: "Workspace") -> "Workspace":
         """Add a new workspace to the Argilla platform.
@@ -234,7 +321,7 @@ class Workspaces(Sequence["Workspace"], ResourceHTMLReprMixin):
         return workspace.create()
 
     def list(self) -> List["Workspace"]:
-        return [self._from_model(model) for model in self._api.list()]
+        return super().list()
 
     ############################
     # Properties
@@ -249,58 +336,42 @@ class Workspaces(Sequence["Workspace"], ResourceHTMLReprMixin):
     # Private methods
     ############################
 
-    def _repr_html_(self) -> "HTML":
-        return self._represent_as_html(resources=self.list())
-
     def _from_model(self, model: WorkspaceModel) -> "Workspace":
         from argilla_sdk.workspaces import Workspace
 
         return Workspace(client=self._client, _model=model)
 
 
-class Datasets(Sequence["Dataset"], ResourceHTMLReprMixin):
+class Datasets(_CachedCollection, Sequence["Dataset"]):
     """A collection of datasets. It can be used to create a new dataset or to get an existing one."""
 
     class _Iterator(GenericIterator["Dataset"]):
         pass
 
-    def __init__(self, client: "Argilla") -> None:
-        self._client = client
-        self._api = client.api.datasets
+    @property
+    def _api(self) -> "DatasetsAPI":
+        return self._client.api.datasets
 
     def __call__(self, name: str, workspace: Optional[Union["Workspace", str]] = None, **kwargs) -> "Dataset":
         from argilla_sdk.datasets import Dataset
 
-        if isinstance(workspace, str):
-            workspace = self._client.workspaces(workspace)
-        elif workspace is None:
-            workspace = self._client.workspaces[0]
-
-        for dataset in workspace.datasets:
-            if dataset.name == name:
-                return dataset
+        workspace_id = self._workspace_id(workspace)
+        model = self._api.get_by_name_and_workspace_id(name=name, workspace_id=workspace_id) if workspace_id else None
+        if model is not None:
+            return self._from_model(model)
         warnings.warn(f"Dataset {name} not found. Creating a new dataset. Do `dataset.create()` to create the dataset.")
         return Dataset(name=name, workspace=workspace, client=self._client, **kwargs)
 
-    def __iter__(self):
-        return self._Iterator(self.list())
-
     @overload
     @abstractmethod
-    def __getitem__(self, index: int) -> "Dataset":
-        ...
+    def __getitem__(self, index: int) -> "Dataset": ...
 
     @overload
     @abstractmethod
-    def __getitem__(self, index: slice) -> Sequence["Dataset"]:
-        ...
+    def __getitem__(self, index: slice) -> Sequence["Dataset"]: ...
 
     def __getitem__(self, index) -> "Dataset":
-        model = self._api.list()[index]
-        return self._from_model(model)
-
-    def __len__(self) -> int:
-        return len(self._api.list())
+        return super().__getitem__(index)
 
     def add(self, dataset: "Dataset") -> "Dataset":
         """
@@ -318,16 +389,27 @@ class Datasets(Sequence["Dataset"], ResourceHTMLReprMixin):
         return dataset
 
     def list(self) -> List["Dataset"]:
-        return [self._from_model(model) for model in self._api.list()]
+        return super().list()
 
     ############################
     # Private methods
     ############################
 
-    def _repr_html_(self) -> "HTML":
-        return self._represent_as_html(resources=self.list())
-
     def _from_model(self, model: DatasetModel) -> "Dataset":
         from argilla_sdk.datasets import Dataset
 
         return Dataset(client=self._client, _model=model)
+
+    def _workspace_id(self, workspace: Optional[Union["Workspace", str]]) -> Optional[UUID]:
+        """Returns the id of the workspace of a dataset lookup, which is only listed for workspace names and the
+        default workspace, and None for workspaces that don't exist."""
+        if isinstance(workspace, str):
+            model = self._client.workspaces._snapshot.get_by_name(workspace)
+            return model.id if model is not None else None
+        if workspace is None:
+            return self._client.workspaces.default.id
+        return workspace.id
+
+    @staticmethod
+    def _name_key(model: DatasetModel) -> Tuple[UUID, str]:
+        return model.workspace_id, model.name
@@ -21,12 +21,12 @@ import warnings
 from typing import Optional, Union, TYPE_CHECKING, Tuple, Type
 from uuid import uuid4
 
+from argilla_sdk._helpers import ProgressCallback, trace_span, track_progress
 from argilla_sdk._models import DatasetModel
 from argilla_sdk.client import Argilla
 from argilla_sdk.settings import Settings
 from argilla_sdk.workspaces._resource import Workspace
 
-
 if TYPE_CHECKING:
     from argilla_sdk import Dataset
 
@@ -39,22 +39,24 @@ class DiskImportExportMixin(ABC):
     _default_records_path = "records.json"
     _default_dataset_path = "dataset.json"
 
-    def to_disk(self: "Dataset", path: str) -> str:
+    def to_disk(self: "Dataset", path: str, progress: Optional[ProgressCallback] = None) -> str:
         """Exports the dataset to disk in the given path. The dataset is exported as a directory containing the dataset model, settings and records as json files.
 
         Args:
             path (str): The path to export the dataset to. Must be an empty directory.
+            progress (ProgressCallback, optional): A function receiving the progress of the records export.
         """
-        dataset_path, settings_path, records_path = self._define_child_paths(path=path)
-        logging.info(f"Loading dataset from {dataset_path}")
-        logging.info(f"Loading settings from {settings_path}")
-        logging.info(f"Loading records from {records_path}")
-        # Export the dataset model, settings and records
-        self._persist_dataset_model(path=dataset_path)
-        self.settings.to_json(path=settings_path)
-        if self.exists():
-            self.records.to_json(path=records_path)
-        return path
+        with trace_span(self._client.tracer, "Dataset.to_disk", {"argilla.dataset.name": self.name}):
+            dataset_path, settings_path, records_path = self._define_child_paths(path=path)
+            logging.info(f"Loading dataset from {dataset_path}")
+            logging.info(f"Loading settings from {settings_path}")
+            logging.info(f"Loading records from {records_path}")
+            # Export the dataset model, settings and records
+            self._persist_dataset_model(path=dataset_path)
+            self.settings.to_json(path=settings_path)
+            if self.exists():
+                self.records.to_json(path=records_path, progress=progress)
+            return path
 
     @classmethod
     def from_disk(
@@ -63,6 +65,7 @@ class DiskImportExportMixin(ABC):
         target_workspace: Optional[Union["Workspace", str]] = None,
         target_name: Optional[str] = None,
         client: Optional["Argilla"] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> "Dataset":
         """Imports a dataset from disk as a directory containing the dataset model, settings and records.
         The directory should be defined using the `to_disk` method.
@@ -72,41 +75,43 @@ class DiskImportExportMixin(ABC):
         target_workspace (Union[Workspace, str], optional): The workspace to import the dataset to. Defaults to None and default workspace is used.
         target_name (str, optional): The name to assign to the new dataset. Defaults to None and the dataset's source name is used, unless it already exists, in which case a unique UUID is appended.
         client (Argilla, optional): The client to use for the import. Defaults to None and the default client is used.
+        progress (ProgressCallback, optional): A function receiving the progress of the records import, like `rg.TqdmProgress()`.
         """
 
         client = client or Argilla._get_default()
 
-        dataset_path, settings_path, records_path = cls._define_child_paths(path=path)
-        logging.info(f"Loading dataset from {dataset_path}")
-        logging.info(f"Loading settings from {settings_path}")
-        logging.info(f"Loading records from {records_path}")
-        dataset_model = cls._load_dataset_model(path=dataset_path)
-
-        # Get the relevant workspace_id of the incoming dataset
-        if isinstance(target_workspace, str):
-            workspace_id = client.workspaces(target_workspace).id
-        elif isinstance(target_workspace, Workspace):
-            workspace_id = target_workspace.id
-        else:
-            warnings.warn("Workspace not provided. Using default workspace.")
-            workspace_id = client.workspaces.default.id
-        dataset_model.workspace_id = workspace_id
-
-        # Get a relevant and unique name for the incoming dataset.
-        if target_name:
-            logging.warning(f"Changing dataset name from {dataset_model.name} to {target_name}")
-            dataset_model.name = target_name
-        elif client.api.datasets.name_exists(name=dataset_model.name, workspace_id=workspace_id):
-            logging.warning(f"Loaded dataset name {dataset_model.name} already exists. Changing to unique UUID.")
-            dataset_model.name = f"{dataset_model.name}_{uuid4()}"
-
-        # Create the dataset and load the settings and records
-        dataset = cls.from_model(model=dataset_model, client=client)
-        dataset.settings = Settings.from_json(path=settings_path)
-        dataset.create()
-        if os.path.exists(records_path):
-            dataset.records.from_json(path=records_path)
-        return dataset
+        with trace_span(client.tracer, "Dataset.from_disk"), track_progress(progress, "Dataset.from_disk"):
+            dataset_path, settings_path, records_path = cls._define_child_paths(path=path)
+            logging.info(f"Loading dataset from {dataset_path}")
+            logging.info(f"Loading settings from {settings_path}")
+            logging.info(f"Loading records from {records_path}")
+            dataset_model = cls._load_dataset_model(path=dataset_path)
+
+            # Get the relevant workspace_id of the incoming dataset
+            if isinstance(target_workspace, str):
+                workspace_id = client.workspaces(target_workspace).id
+            elif isinstance(target_workspace, Workspace):
+                workspace_id = target_workspace.id
+            else:
+                warnings.warn("Workspace not provided. Using default workspace.")
+                workspace_id = client.workspaces.default.id
+            dataset_model.workspace_id = workspace_id
+
+            # Get a relevant and unique name for the incoming dataset.
+            if target_name:
+                logging.warning(f"Changing dataset name from {dataset_model.name} to {target_name}")
+                dataset_model.name = target_name
+            elif client.api.datasets.name_exists(name=dataset_model.name, workspace_id=workspace_id):
+                logging.warning(f"Loaded dataset name {dataset_model.name} already exists. Changing to unique UUID.")
+                dataset_model.name = f"{dataset_model.name}_{uuid4()}"
+
+            # Create the dataset and load the settings and records
+            dataset = cls.from_model(model=dataset_model, client=client)
+            dataset.settings = Settings.from_json(path=settings_path)
+            dataset.create()
+            if os.path.exists(records_path):
+                dataset.records.from_json(path=records_path)
+            return dataset
 
     ############################
     # Utility methods
@@ -18,7 +18,7 @@ from uuid import UUID, uuid4
 
 from argilla_sdk._api import DatasetsAPI
 from argilla_sdk._exceptions import NotFoundError, SettingsError
-from argilla_sdk._helpers import UUIDUtilities
+from argilla_sdk._helpers import UUIDUtilities, trace_span
 from argilla_sdk._models import DatasetModel
 from argilla_sdk._resource import Resource
 from argilla_sdk.client import Argilla
@@ -48,6 +48,7 @@ class Dataset(Resource, DiskImportExportMixin):
 
     _api: "DatasetsAPI"
     _model: "DatasetModel"
+    _collection_name = "datasets"
 
     def __init__(
         self,
@@ -81,8 +82,11 @@ class Dataset(Resource, DiskImportExportMixin):
             name=name,
             workspace_id=UUIDUtilities.convert_optional_uuid(uuid=self.workspace_id),
         )
-        self._settings = self.__configure_settings_for_dataset(settings=settings)
-        self.__records = DatasetRecords(client=self._client, dataset=self)
+        # Datasets built from a listed model are only configured when their settings or records are used
+        self._settings = (
+            None if settings is None and _model is not None else self.__configure_settings_for_dataset(settings)
+        )
+        self.__records = None
 
     #####################
     #  Properties       #
@@ -98,11 +102,15 @@ class Dataset(Resource, DiskImportExportMixin):
 
     @property
     def records(self) -> "DatasetRecords":
+        if self.__records is None:
+            self.__records = DatasetRecords(client=self._client, dataset=self)
         return self.__records
 
     @property
     def settings(self) -> Settings:
-        if self.__is_published() and self._settings.is_outdated:
+        if self._settings is None:
+            self._settings = Settings(_dataset=self)
+        if self._settings.is_outdated and self.__is_published():
             self._settings.get()
         return self._settings
 
@@ -156,13 +164,14 @@ class Dataset(Resource, DiskImportExportMixin):
         Returns:
             Dataset: The created dataset object.
         """
-        super().create()
-        try:
-            return self._publish()
-        except Exception as e:
-            self._log_message(message=f"Error creating dataset: {e}", level="error")
-            self.__rollback_dataset_creation()
-            raise SettingsError from e
+        with trace_span(self._client.tracer, "Dataset.create", {"argilla.dataset.name": self.name}):
+            super().create()
+            try:
+                return self._publish()
+            except Exception as e:
+                self._log_message(message=f"Error creating dataset: {e}", level="error")
+                self.__rollback_dataset_creation()
+                raise SettingsError from e
 
     def update(self) -> "Dataset":
         """Updates the dataset on the server with the current settings.
@@ -182,10 +191,11 @@ class Dataset(Resource, DiskImportExportMixin):
     #####################
 
     def _publish(self) -> "Dataset":
-        self._settings.create()
-        self._api.publish(dataset_id=self._model.id)
+        with trace_span(self._client.tracer, "Dataset.publish", {"argilla.dataset.name": self.name}):
+            self.settings.create()
+            self._api.publish(dataset_id=self._model.id)
 
-        return self.get()  # type: ignore
+            return self.get()  # type: ignore
 
     def __configure_settings_for_dataset(
         self,
@@ -12,31 +12,58 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import warnings
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Union
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
 from argilla_sdk._api import RecordsAPI
-from argilla_sdk._helpers import LoggingMixin
-from argilla_sdk._models import RecordModel, MetadataValue
+from argilla_sdk._exceptions import BadRequestError, UnprocessableEntityError
+from argilla_sdk._helpers import (
+    DEFAULT_MAX_WORKERS,
+    LoggingMixin,
+    ProgressCallback,
+    ProgressTracker,
+    current_progress,
+    map_concurrently,
+    trace_span,
+    track_progress,
+)
+from argilla_sdk._models import (
+    RecordModel,
+    ResponseStatus,
+    UserResponseModel,
+)
 from argilla_sdk.client import Argilla
-from argilla_sdk.records._io import GenericIO, HFDataset, HFDatasetsIO, JsonIO
+from argilla_sdk.records._hashing import RecordHashStore, record_content_hash
+from argilla_sdk.records._ingestion import DatasetSchemaSnapshot, serialize_records_batch
+from argilla_sdk.records._io import GenericIO, HFDatasetsIO, JsonIO
 from argilla_sdk.records._resource import Record
-from argilla_sdk.records._search import Query
-from argilla_sdk.responses import Response
-from argilla_sdk.settings import TextField, VectorField
-from argilla_sdk.settings._metadata import MetadataPropertyBase
+from argilla_sdk.records._search import Condition, Filter, Query
+from argilla_sdk.records._writer import RecordsWriter
+from argilla_sdk.settings._metadata import TermsMetadataProperty
 from argilla_sdk.settings._question import QuestionPropertyBase
 from argilla_sdk.suggestions import Suggestion
-from argilla_sdk.vectors import Vector
 
 if TYPE_CHECKING:
+    from datasets import Dataset as HFDataset
+
     from argilla_sdk.datasets import Dataset
 
 
 class DatasetRecordsIterator:
-    """This class is used to iterate over records in a dataset"""
+    """This class is used to iterate over records in a dataset.
+
+    By default, records are paged by offset. In stable mode, records are sorted by insertion time and the
+    iterator keeps track of the last seen sort key, so that records are neither skipped nor duplicated when
+    records are added or deleted during the scan. If the server does not support sorting the records, the
+    iterator falls back to offset paging and discards already seen records by id.
+    """
+
+    _STABLE_SCAN_SORT_BY = ["inserted_at:asc"]
+    _STABLE_SCAN_OVERLAP = 32
 
     def __init__(
         self,
@@ -48,17 +75,33 @@ class DatasetRecordsIterator:
         with_suggestions: bool = False,
         with_responses: bool = False,
         with_vectors: Optional[Union[str, List[str], bool]] = None,
+        stable: bool = False,
+        progress: Optional[ProgressTracker] = None,
     ):
         self.__dataset = dataset
         self.__client = client
         self.__query = query or Query()
-        self.__offset = start_offset or 0
+        self.__start_offset = start_offset or 0
+        self.__offset = self.__start_offset
         self.__batch_size = batch_size or 100
         self.__with_suggestions = with_suggestions
         self.__with_responses = with_responses
         self.__with_vectors = with_vectors
         self.__records_batch = []
 
+        self.__stable = stable
+        if stable:
+            # Stable scans need pages of at least two records to overlap consecutive pages
+            self.__batch_size = max(self.__batch_size, 2)
+        self.__sort_by = self._STABLE_SCAN_SORT_BY if stable else None
+        self.__last_inserted_at = None
+        self.__last_inserted_ids = set()
+        self.__seen_ids = set()
+
+        self.__progress = progress or ProgressTracker(callback=None, operation="DatasetRecords.iterate")
+        # The trackers of running operations, like `DatasetRecords.to_json`, are finished by the operation
+        self.__finish_progress = progress is not None and progress is not current_progress()
+
     def __iter__(self):
         return self
 
@@ -76,44 +119,224 @@ class DatasetRecordsIterator:
         return len(self.__records_batch) > 0
 
     def _fetch_next_batch(self) -> None:
-        self.__records_batch = list(self._list())
-        self.__offset += len(self.__records_batch)
+        attributes = {
+            "argilla.dataset.name": self.__dataset.name,
+            "argilla.records.offset": self.__offset,
+            "argilla.records.batch_size": self.__batch_size,
+        }
+        with trace_span(self.__client.tracer, "DatasetRecords.iterate_page", attributes) as span:
+            with self.__progress.activate():
+                if self.__stable:
+                    self.__records_batch = list(self._list_stable())
+                else:
+                    self.__records_batch = list(self._list())
+                    self.__offset += len(self.__records_batch)
+            span.set_attribute("argilla.records.count", len(self.__records_batch))
+
+        if self.__records_batch:
+            self.__progress.advance(len(self.__records_batch))
+        elif self.__finish_progress:
+            self.__progress.finish()
 
     def _list(self) -> Sequence[Record]:
         for record_model in self._fetch_from_server():
             yield Record.from_model(model=record_model, dataset=self.__dataset)
 
-    def _fetch_from_server(self) -> List[RecordModel]:
+    def _list_stable(self) -> Sequence[Record]:
+        for record_model in self._fetch_next_unseen_from_server():
+            yield Record.from_model(model=record_model, dataset=self.__dataset)
+
+    def _fetch_next_unseen_from_server(self) -> List[RecordModel]:
+        """Fetches the next page of records that have not been returned yet. Every page overlaps with the
+        previous one, so that records shifted by concurrent deletions are not skipped. When the sort key of
+        the last returned record is not found in the page, the overlap is widened until it is."""
+        # The overlap is kept below the batch size, so that every page of already seen records moves forward
+        overlap = max(min(self._STABLE_SCAN_OVERLAP, self.__batch_size // 2), 1)
+        is_first_page = self.__last_inserted_at is None and not self.__seen_ids
+        step_back = 0 if is_first_page else min(overlap, self.__offset)
+
+        while True:
+            offset = self.__offset - step_back
+            record_models = self._fetch_from_server(offset=offset)
+
+            if offset > 0 and not self._is_anchored_page(record_models):
+                step_back = min(max(step_back * 2, self.__batch_size), self.__offset)
+                continue
+
+            self.__offset = offset + len(record_models)
+            unseen_models = [model for model in record_models if self._is_unseen(model)]
+            for model in unseen_models:
+                self._mark_as_seen(model)
+
+            if unseen_models or len(record_models) < self.__batch_size:
+                return unseen_models
+            step_back = min(overlap, self.__offset)
+
+    def _is_anchored_page(self, record_models: List[RecordModel]) -> bool:
+        """Whether the page starts at or before the last returned record, so no unseen record was skipped"""
+        if not self.__sort_by:
+            # Without sorting, there is no sort key to anchor the page and only the seen ids are used
+            return True
+        if self.__last_inserted_at is None:
+            return True
+        return len(record_models) > 0 and record_models[0].inserted_at <= self.__last_inserted_at
+
+    def _is_unseen(self, model: RecordModel) -> bool:
+        if not self.__sort_by:
+            return model.id not in self.__seen_ids
+        if self.__last_inserted_at is None or model.inserted_at > self.__last_inserted_at:
+            return True
+        return model.inserted_at == self.__last_inserted_at and model.id not in self.__last_inserted_ids
+
+    def _mark_as_seen(self, model: RecordModel) -> None:
+        if not self.__sort_by:
+            self.__seen_ids.add(model.id)
+        elif self.__last_inserted_at is None or model.inserted_at > self.__last_inserted_at:
+            self.__last_inserted_at = model.inserted_at
+            self.__last_inserted_ids = {model.id}
+        else:
+            self.__last_inserted_ids.add(model.id)
+
+    def _fetch_from_server(self, offset: Optional[int] = None) -> List[RecordModel]:
         if not self.__dataset.exists():
             raise ValueError(f"Dataset {self.__dataset.name} does not exist on the server.")
-        if self._is_search_query():
-            return self._fetch_from_server_with_search()
-        return self._fetch_from_server_with_list()
+        offset = self.__offset if offset is None else offset
+        try:
+            if self._is_search_query():
+                return self._fetch_from_server_with_search(offset=offset)
+            return self._fetch_from_server_with_list(offset=offset)
+        except (BadRequestError, UnprocessableEntityError):
+            if not self.__sort_by:
+                raise
+            warnings.warn(
+                message="Sorting records is not supported by the server. Falling back to offset pagination "
+                "and discarding already seen records by id."
+            )
+            self.__sort_by = None
+            return self._fetch_from_server(offset=offset)
 
-    def _fetch_from_server_with_list(self) -> List[RecordModel]:
+    def _fetch_from_server_with_list(self, offset: int) -> List[RecordModel]:
         return self.__client.api.records.list(
             dataset_id=self.__dataset.id,
             limit=self.__batch_size,
-            offset=self.__offset,
+            offset=offset,
             with_responses=self.__with_responses,
             with_suggestions=self.__with_suggestions,
             with_vectors=self.__with_vectors,
+            sort_by=self.__sort_by,
         )
 
-    def _fetch_from_server_with_search(self) -> List[RecordModel]:
+    def _fetch_from_server_with_search(self, offset: int) -> List[RecordModel]:
         search_items, total = self.__client.api.records.search(
             dataset_id=self.__dataset.id,
             query=self.__query.model,
             limit=self.__batch_size,
-            offset=self.__offset,
+            offset=offset,
             with_responses=self.__with_responses,
             with_suggestions=self.__with_suggestions,
+            sort_by=self.__sort_by,
         )
+        if self.__progress.total is None:
+            self.__progress.set_total(max(total - self.__start_offset, 0))
         return [record_model for record_model, _ in search_items]
 
     def _is_search_query(self) -> bool:
         return bool(self.__query and (self.__query.query or self.__query.filter))
 
+    def map(
+        self,
+        fn: Callable[[List[Union[Record, Dict[str, Any]]]], List[Any]],
+        batch_size: int = 64,
+        workers: int = 4,
+        as_suggestion: Optional[str] = None,
+        use_processes: bool = False,
+        max_in_flight: Optional[int] = None,
+    ) -> int:
+        """Applies a function to batches of records and optionally writes the results back to the records
+        as suggestions. Fetching the records, running the function and writing the suggestions are pipelined,
+        so the overall rate is set by the slowest stage. Every batch is released once its suggestions are
+        written, so the memory used does not grow with the number of records.
+
+        Parameters:
+            fn: A function receiving a batch of records and returning one result per record. With processes,
+                the function must be picklable and receives the records as dictionaries, like `Record.to_dict`.
+            batch_size: The number of records passed to every function call. The default is 64.
+            workers: The number of threads or processes running the function. The default is 4.
+            as_suggestion: The name of a question to write the results as suggestions for. A result can be
+                the suggestion value, a dictionary with the `value`, `score` and `agent` of the suggestion, a
+                `Suggestion` object, or None to skip the record. If not provided, nothing is written.
+            use_processes: Whether to run the function in a pool of processes instead of threads, for CPU-bound
+                functions. The default is False.
+            max_in_flight: The maximum number of batches being processed or written at a time, which bounds the
+                memory used by the pipeline. The default is twice the number of workers.
+
+        Returns:
+            The number of records passed to the function.
+        """
+        if as_suggestion is not None and as_suggestion not in self.__dataset.schema:
+            raise ValueError(f"Question {as_suggestion} not found in dataset schema.")
+        max_in_flight = max_in_flight or 2 * workers
+        processed = 0
+
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=workers) as executor, ThreadPoolExecutor(max_workers=1) as writer:
+            processing, writing = deque(), deque()
+
+            def complete_oldest_batch() -> None:
+                nonlocal processed
+                batch, future = processing.popleft()
+                batch_results = list(future.result())
+                if len(batch_results) != len(batch):
+                    raise ValueError(
+                        f"The function returned {len(batch_results)} results for a batch of {len(batch)} records."
+                    )
+                processed += len(batch)
+                if as_suggestion is not None:
+                    writing.append(writer.submit(self._write_suggestions, batch, batch_results, as_suggestion))
+                    while len(writing) > max_in_flight:
+                        writing.popleft().result()
+
+            for batch in self._batches(batch_size=batch_size):
+                fn_input = [record.to_dict() for record in batch] if use_processes else batch
+                processing.append((batch, executor.submit(fn, fn_input)))
+                while len(processing) >= max_in_flight:
+                    complete_oldest_batch()
+
+            while processing:
+                complete_oldest_batch()
+            while writing:
+                writing.popleft().result()
+
+        return processed
+
+    def _batches(self, batch_size: int) -> Iterator[List[Record]]:
+        batch = []
+        for record in self:
+            batch.append(record)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _write_suggestions(self, batch: List[Record], batch_results: List[Any], question_name: str) -> None:
+        records = []
+        for record, result in zip(batch, batch_results):
+            if result is None:
+                continue
+            if isinstance(result, Suggestion):
+                result.question_name = question_name
+                suggestion = result
+            elif isinstance(result, dict):
+                suggestion = Suggestion(question_name=question_name, **result)
+            else:
+                suggestion = Suggestion(question_name=question_name, value=result)
+            record.suggestions.add(suggestion)
+            records.append(record)
+
+        if records:
+            self.__dataset.records.update_suggestions(records=records, batch_size=len(records))
+
 
 class DatasetRecords(Iterable[Record], LoggingMixin):
     """This class is used to work with records from a dataset and is accessed via `Dataset.records`.
@@ -129,6 +352,8 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
 
     DEFAULT_BATCH_SIZE = 256
 
+    _RESPONSE_STATUSES = ["pending", "draft", "submitted", "discarded"]
+
     def __init__(self, client: "Argilla", dataset: "Dataset"):
         """Initializes a DatasetRecords object with a client and a dataset.
         Args:
@@ -150,6 +375,8 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
         with_suggestions: bool = True,
         with_responses: bool = True,
         with_vectors: Optional[Union[List, bool, str]] = None,
+        stable: bool = False,
+        progress: Optional[ProgressCallback] = None,
     ) -> DatasetRecordsIterator:
         """Returns an iterator over the records in the dataset on the server.
 
@@ -162,6 +389,11 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
             with_vectors: A list of vector names to include in the records. The default is None.
                 If a list is provided, only the specified vectors will be included.
                 If True is provided, all vectors will be included.
+            stable: Whether to page the records by insertion time instead of by offset, so that records
+                are neither skipped nor duplicated when the dataset is modified during the iteration.
+                The default is False.
+            progress: A function receiving the progress of the iteration after every fetched page, like
+                `rg.TqdmProgress()`. See `rg.Progress` for the reported values. The default is None.
 
         Returns:
             An iterator over the records in the dataset on the server.
@@ -173,6 +405,13 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
         if with_vectors:
             self._validate_vector_names(vector_names=with_vectors)
 
+        tracker = None
+        if progress is not None:
+            # Search queries return the number of matching records with the first page
+            is_search = query and (query.query or query.filter)
+            total = None if is_search else max(self.count() - start_offset, 0)
+            tracker = ProgressTracker(callback=progress, operation="DatasetRecords.iterate", total=total)
+
         return DatasetRecordsIterator(
             self.__dataset,
             self.__client,
@@ -182,6 +421,8 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
             with_suggestions=with_suggestions,
             with_responses=with_responses,
             with_vectors=with_vectors,
+            stable=stable,
+            progress=tracker,
         )
 
     def __repr__(self) -> str:
@@ -193,10 +434,15 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
 
     def log(
         self,
-        records: Union[List[dict], List[Record], HFDataset],
+        records: Union[List[dict], List[Record], "HFDataset"],
         mapping: Optional[Dict[str, str]] = None,
         user_id: Optional[UUID] = None,
         batch_size: int = DEFAULT_BATCH_SIZE,
+        skip_unchanged: bool = False,
+        hash_store: Optional[Union[Path, str]] = None,
+        processes: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+        only_modified: bool = True,
     ) -> List[Record]:
         """Add or update records in a dataset on the server using the provided records.
         If the record includes a known `id` field, the record will be updated.
@@ -210,34 +456,432 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
             mapping: A dictionary that maps the keys/ column names in the records to the fields or questions in the Argilla dataset.
             user_id: The user id to be associated with the records' response. If not provided, the current user id is used.
             batch_size: The number of records to send in each batch. The default is 256.
+            skip_unchanged: Whether to skip the records whose content is identical to the content of the
+                record with the same `id` in the dataset. The content is compared by hash. The default is False.
+            hash_store: The path to a local JSON file with the content hashes of the logged records, which is
+                updated after logging. If not provided, the hashes are computed with a scan of the dataset.
+            processes: The number of worker processes used to convert record dictionaries or Hugging Face
+                dataset rows to request bodies, while the current process sends them to the server. Use it for
+                large CPU-bound ingestions. Ignored for `Record` objects. By default, records are converted
+                in the current process.
+            progress: A function receiving the progress of the logging after every sent batch, like
+                `rg.TqdmProgress()`. See `rg.Progress` for the reported values. The default is None.
+            only_modified: Whether to skip the `Record` objects fetched from the dataset that were not modified,
+                and to send only the modified attributes of the others. Changes made in place to mutable values,
+                like `record.vectors.embedding[0] = 0.5`, are not tracked, so set it to False to send the whole
+                fetched records. Records built locally are always sent. The default is True.
 
         Returns:
-            A list of Record objects representing the updated records.
+            A list of Record objects representing the updated records, in the same order as the provided records.
 
         """
+        attributes = {
+            "argilla.dataset.name": self.__dataset.name,
+            "argilla.records.count": len(records) if hasattr(records, "__len__") else None,
+            "argilla.records.batch_size": batch_size,
+        }
+        with trace_span(self.__client.tracer, "DatasetRecords.log", attributes):
+            with track_progress(progress, "DatasetRecords.log", total=attributes["argilla.records.count"]):
+                return self._log(
+                    records=records,
+                    mapping=mapping,
+                    user_id=user_id,
+                    batch_size=batch_size,
+                    skip_unchanged=skip_unchanged,
+                    hash_store=hash_store,
+                    processes=processes,
+                    only_modified=only_modified,
+                )
+
+    def _log(
+        self,
+        records: Union[List[dict], List[Record], "HFDataset"],
+        mapping: Optional[Dict[str, str]],
+        user_id: Optional[UUID],
+        batch_size: int,
+        skip_unchanged: bool,
+        hash_store: Optional[Union[Path, str]],
+        processes: Optional[int],
+        only_modified: bool,
+    ) -> List[Record]:
+        if skip_unchanged:
+            return self._log_changed_records(
+                records=records,
+                mapping=mapping,
+                user_id=user_id,
+                batch_size=batch_size,
+                hash_store=hash_store,
+            )
+        if self._is_records_list(records):
+            return self._log_records(records=records, batch_size=batch_size, only_modified=only_modified)
+        if processes:
+            return self._log_with_processes(
+                records=records,
+                mapping=mapping,
+                user_id=user_id or self.__client.me.id,
+                batch_size=batch_size,
+                processes=processes,
+            )
+
         record_models = self._ingest_records(records=records, mapping=mapping, user_id=user_id or self.__client.me.id)
+        return self._upsert_record_models(record_models=record_models, batch_size=batch_size)
+
+    def writer(
+        self,
+        max_batch: int = 500,
+        max_latency: float = 2.0,
+        max_queue_size: int = 10_000,
+        mapping: Optional[Dict[str, str]] = None,
+        user_id: Optional[UUID] = None,
+    ) -> RecordsWriter:
+        """Creates a buffered writer to log records one at a time from any thread. Records are sent to the
+        server in batches by a background thread. See `RecordsWriter` for more information.
+
+        Parameters:
+            max_batch: The maximum number of records to send in each batch. The default is 500.
+            max_latency: The maximum number of seconds a record waits in the writer before being sent. The default is 2.
+            max_queue_size: The maximum number of queued records. Writing blocks while the queue is full.
+                The default is 10000.
+            mapping: A dictionary that maps the keys in the record dictionaries to the fields or questions in the dataset.
+            user_id: The user id to be associated with the records' responses. If not provided, the current user id is used.
+
+        Returns:
+            A RecordsWriter object that should be closed after writing the records.
+        """
+        return RecordsWriter(
+            records=self,
+            dataset=self.__dataset,
+            client=self.__client,
+            max_batch=max_batch,
+            max_latency=max_latency,
+            max_queue_size=max_queue_size,
+            mapping=mapping,
+            user_id=user_id,
+        )
+
+    def update_suggestions(
+        self,
+        records: Union[List[dict], List[Record], "HFDataset"],
+        mapping: Optional[Dict[str, str]] = None,
+        use_server_ids: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Record]:
+        """Updates only the suggestions of existing records on the server. The fields, metadata, vectors
+        and responses of the records are neither sent nor modified.
+
+        Parameters:
+            records: A list of `Record` objects, a Hugging Face Dataset, or a list of dictionaries with the record
+                `id` and the suggestions to update, like in the `log` method.
+            mapping: A dictionary that maps the keys/ column names in the records to the questions in the dataset.
+            use_server_ids: Whether the record ids are the ids assigned by the server instead of the ids provided
+                when logging the records. The default is False.
+            batch_size: The number of records to send in each batch. The default is 256.
+
+        Returns:
+            A list of Record objects representing the updated records.
+        """
+        return self._update_records_partially(
+            records=records,
+            attributes=["suggestions"],
+            mapping=mapping,
+            use_server_ids=use_server_ids,
+            batch_size=batch_size,
+        )
+
+    def update_vectors(
+        self,
+        records: Union[List[dict], List[Record], "HFDataset"],
+        mapping: Optional[Dict[str, str]] = None,
+        use_server_ids: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Record]:
+        """Updates only the vectors of existing records on the server. See `update_suggestions` for more information.
+
+        Parameters:
+            records: A list of `Record` objects, a Hugging Face Dataset, or a list of dictionaries with the record
+                `id` and the vectors to update, like in the `log` method.
+            mapping: A dictionary that maps the keys/ column names in the records to the vectors in the dataset.
+            use_server_ids: Whether the record ids are the ids assigned by the server. The default is False.
+            batch_size: The number of records to send in each batch. The default is 256.
+
+        Returns:
+            A list of Record objects representing the updated records.
+        """
+        return self._update_records_partially(
+            records=records,
+            attributes=["vectors"],
+            mapping=mapping,
+            use_server_ids=use_server_ids,
+            batch_size=batch_size,
+        )
+
+    def update_metadata(
+        self,
+        records: Union[List[dict], List[Record], "HFDataset"],
+        mapping: Optional[Dict[str, str]] = None,
+        use_server_ids: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Record]:
+        """Updates only the metadata of existing records on the server. See `update_suggestions` for more information.
+
+        Parameters:
+            records: A list of `Record` objects, a Hugging Face Dataset, or a list of dictionaries with the record
+                `id` and the metadata to update, like in the `log` method.
+            mapping: A dictionary that maps the keys/ column names in the records to the metadata in the dataset.
+            use_server_ids: Whether the record ids are the ids assigned by the server. The default is False.
+            batch_size: The number of records to send in each batch. The default is 256.
+
+        Returns:
+            A list of Record objects representing the updated records.
+        """
+        return self._update_records_partially(
+            records=records,
+            attributes=["metadata"],
+            mapping=mapping,
+            use_server_ids=use_server_ids,
+            batch_size=batch_size,
+        )
+
+    def log_responses(
+        self,
+        records: List[Record],
+        status: Optional[Union[ResponseStatus, str]] = None,
+        batch_size: int = 100,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Dict[str, List[str]]:
+        """Submits the responses of many records on the server as the current user, in batches sent
+        concurrently. The records must already exist in the dataset on the server, and their responses must
+        have no `user_id` or the id of the current user, since the server creates them for the current user.
+
+        Parameters:
+            records: The records with the responses to submit.
+            status: The status of the submitted responses, overriding the status of the record responses.
+                One of "draft", "submitted" or "discarded".
+            batch_size: The number of responses to send in each request. The default is 100.
+            max_workers: The maximum number of concurrent requests. The default is 8.
+
+        Returns:
+            A dictionary mapping the id of every record with failed responses to the error details.
+        """
+        responses = []
+        for record in records:
+            if record._server_id is None:
+                raise ValueError(f"Record {record.id} does not exist on the server. Log the record first.")
+            for user_response in record.responses.api_models():
+                if status is not None:
+                    user_response = user_response.model_copy(update={"status": ResponseStatus(status)})
+                responses.append((record, user_response))
+        if not responses:
+            return {}
+        self._validate_responses_authorship(responses=responses)
+
         batch_size = self._normalize_batch_size(
             batch_size=batch_size,
-            records_length=len(record_models),
-            max_value=self._api.MAX_RECORDS_PER_UPSERT_BULK,
+            records_length=len(responses),
+            max_value=self._api.MAX_RESPONSES_PER_CREATE_BULK,
+        )
+        batches = [responses[batch : batch + batch_size] for batch in range(0, len(responses), batch_size)]
+        batches_errors = map_concurrently(
+            lambda batch: self._api.bulk_create_responses(
+                responses=[(record._server_id, user_response) for record, user_response in batch]
+            ),
+            batches,
+            max_workers=max_workers,
         )
 
-        created_or_updated = []
-        records_updated = 0
-        for batch in range(0, len(records), batch_size):
-            self._log_message(message=f"Sending records from {batch} to {batch + batch_size}.")
-            batch_records = record_models[batch : batch + batch_size]
-            models, updated = self._api.bulk_upsert(dataset_id=self.__dataset.id, records=batch_records)
-            created_or_updated.extend([Record.from_model(model=model, dataset=self.__dataset) for model in models])
-            records_updated += updated
+        errors = defaultdict(list)
+        for batch, batch_errors in zip(batches, batches_errors):
+            for (record, _), error in zip(batch, batch_errors):
+                if error:
+                    errors[str(record.id)].append(error)
 
-        records_created = len(created_or_updated) - records_updated
         self._log_message(
-            message=f"Updated {records_updated} records and added {records_created} records to dataset {self.__dataset.name}",
+            message=f"Submitted {len(responses) - sum(map(len, errors.values()))} of {len(responses)} responses "
+            f"to dataset {self.__dataset.name}",
             level="info",
         )
+        return dict(errors)
 
-        return created_or_updated
+    def delete(
+        self,
+        records: Optional[Sequence[Union[Record, UUID, str]]] = None,
+        query: Optional[Union[str, Query]] = None,
+        batch_size: int = 100,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
+        """Deletes records from the dataset on the server, in batches sent concurrently.
+
+        Parameters:
+            records: The records to delete, as `Record` objects or as record ids assigned by the server.
+            query: A string or a Query object matching the records to delete. The matching record ids are
+                collected with a scan of the dataset before deleting them. Empty queries are rejected.
+            batch_size: The number of records to delete in each request. The default is 100.
+            max_workers: The maximum number of concurrent delete requests. The default is 8.
+            progress: A function receiving the progress of the deletion after every deleted batch, like
+                `rg.TqdmProgress()`. The default is None.
+
+        Returns:
+            The number of deleted records.
+        """
+        if (records is None) == (query is None):
+            raise ValueError("Either records or query must be provided to delete records.")
+        if isinstance(query, str):
+            query = Query(query=query)
+        if query is not None and not (query.query or query.filter):
+            # An empty query matches every record, so deleting all the records must be explicit
+            raise ValueError("The query to delete records cannot be empty. Provide a query text or a filter.")
+
+        if query is not None:
+            records_ids = [
+                record._server_id for record in self(query=query, with_suggestions=False, with_responses=False)
+            ]
+        else:
+            records_ids = [self._server_id_to_delete(record) for record in records]
+        records_ids = list(dict.fromkeys(records_ids))
+        if not records_ids:
+            return 0
+
+        batch_size = self._normalize_batch_size(
+            batch_size=batch_size,
+            records_length=len(records_ids),
+            max_value=self._api.MAX_RECORDS_PER_DELETE_BULK,
+        )
+        batches = [records_ids[batch : batch + batch_size] for batch in range(0, len(records_ids), batch_size)]
+
+        deleted = 0
+        deleted_lock = Lock()
+
+        def delete_batch(batch_ids: List[UUID]) -> None:
+            nonlocal deleted
+            self._api.delete_many(dataset_id=self.__dataset.id, records_ids=batch_ids)
+            with deleted_lock:
+                deleted += len(batch_ids)
+            current_progress().advance(len(batch_ids))
+
+        with track_progress(progress, "DatasetRecords.delete", total=len(records_ids)):
+            map_concurrently(delete_batch, batches, max_workers=max_workers)
+        self._log_message(
+            message=f"Deleted {deleted} records from dataset {self.__dataset.name}",
+            level="info",
+        )
+        return deleted
+
+    def get_many(
+        self,
+        ids: Sequence[Union[str, UUID]],
+        use_server_ids: bool = False,
+        with_suggestions: bool = True,
+        with_responses: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[Optional[Record]]:
+        """Fetches records from the server by their ids. The records are returned in the same order as the
+        provided ids, with `None` for the ids that are not found, which are also reported with a warning.
+
+        Parameters:
+            ids: The ids of the records to fetch.
+            use_server_ids: Whether the ids are the record ids assigned by the server. If False, the ids are
+                the record ids provided when logging the records. The default is False.
+            with_suggestions: Whether to include suggestions in the records. The default is True.
+            with_responses: Whether to include responses in the records. The default is True.
+            batch_size: The number of records to fetch in each request. The default is 256.
+            max_workers: The maximum number of concurrent requests. The default is 8.
+
+        The server cannot filter records by their ids, so the records of the dataset are fetched in pages of
+        `batch_size` records, with up to `max_workers` pages fetched concurrently, until all the ids are found.
+        Every record of the dataset is fetched when some ids are missing.
+
+        Returns:
+            A list of records aligned with the provided ids.
+        """
+        found = self._get_many_by_ids(
+            ids=ids,
+            use_server_ids=use_server_ids,
+            with_suggestions=with_suggestions,
+            with_responses=with_responses,
+            batch_size=batch_size,
+            max_workers=max_workers,
+        )
+
+        missing_ids = [str(record_id) for record_id in ids if str(record_id) not in found]
+        if missing_ids:
+            self._log_message(
+                message=f"{len(missing_ids)} records were not found in dataset {self.__dataset.name}: {missing_ids}",
+                level="warning",
+            )
+        return [found.get(str(record_id)) for record_id in ids]
+
+    def count(self, query: Optional[Union[str, Query]] = None) -> int:
+        """Counts the records in the dataset on the server matching an optional query, without fetching them.
+
+        Parameters:
+            query: A string or a Query object to filter the records. If not provided, all records are counted.
+
+        Returns:
+            The number of records matching the query.
+        """
+        if isinstance(query, str):
+            query = Query(query=query)
+        query = query or Query()
+
+        _, total = self._api.search(
+            dataset_id=self.__dataset.id,
+            query=query.model,
+            limit=1,
+            with_suggestions=False,
+            with_responses=False,
+        )
+        return total
+
+    def facets(
+        self,
+        terms: Union[List[str], Dict[str, List[Any]]],
+        query: Optional[Union[str, Query]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Dict[str, Dict[Any, int]]:
+        """Computes the distribution of records over the values of one or more terms, like the suggested labels,
+        the values of a terms metadata property or the response status. One count query is sent to the server
+        for every term value, concurrently.
+
+        Parameters:
+            terms: The terms to compute, using the same notation as the filter conditions. For example
+                `["label.suggestion", "metadata.source", "status"]`. The term values are inferred from the
+                dataset settings, or can be provided as a dictionary mapping every term to its values.
+            query: A string or a Query object to restrict the records that are counted.
+            max_workers: The maximum number of concurrent count queries. The default is 8.
+
+        Returns:
+            A dictionary mapping every term to a dictionary with the number of records for every term value.
+        """
+        if isinstance(query, str):
+            query = Query(query=query)
+        query = query or Query()
+
+        if not isinstance(terms, dict):
+            terms = {term: self._infer_facet_values(term=term) for term in terms}
+
+        base_conditions = list(query.filter.conditions) if query.filter else []
+        facet_queries = [
+            (
+                term,
+                value,
+                Query(query=query.query, filter=Filter(base_conditions + [self._facet_condition(term, value)])),
+            )
+            for term, values in terms.items()
+            for value in values
+        ]
+        self._log_message(message=f"Computing {len(facet_queries)} facet counts for terms {list(terms)}")
+        counts = map_concurrently(
+            lambda facet_query: self.count(query=facet_query[2]),
+            facet_queries,
+            max_workers=max_workers,
+        )
+
+        facets = {term: {} for term in terms}
+        for (term, value, _), count in zip(facet_queries, counts):
+            facets[term][value] = count
+        return facets
 
     def to_dict(self, flatten: bool = False, orient: str = "names") -> Dict[str, Any]:
         """
@@ -272,43 +916,57 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
         data = GenericIO.to_list(records=records, flatten=flatten)
         return data
 
-    def to_json(self, path: Union[Path, str]) -> Path:
+    def to_json(self, path: Union[Path, str], progress: Optional[ProgressCallback] = None) -> Path:
         """
         Export the records to a file on disk.
 
         Parameters:
             path (str): The path to the file to save the records.
+            progress (ProgressCallback): A function receiving the progress of the export after every fetched page.
 
         Returns:
             The path to the file where the records were saved.
 
         """
-        records = list(self(with_suggestions=True, with_responses=True))
-        return JsonIO.to_json(records=records, path=path)
+        with trace_span(self.__client.tracer, "DatasetRecords.to_json", {"argilla.dataset.name": self.__dataset.name}):
+            total = self.count() if progress else None
+            with track_progress(progress, "DatasetRecords.to_json", total=total) as tracker:
+                records = list(self._iterate_for_export(progress=tracker))
+            return JsonIO.to_json(records=records, path=path)
 
-    def from_json(self, path: Union[Path, str]) -> List[Record]:
+    def from_json(self, path: Union[Path, str], progress: Optional[ProgressCallback] = None) -> List[Record]:
         """Creates a DatasetRecords object from a disk path to a JSON file.
             The JSON file should be defined by `DatasetRecords.to_json`.
 
         Args:
             path (str): The path to the file containing the records.
+            progress (ProgressCallback): A function receiving the progress of the import after every sent batch.
 
         Returns:
             DatasetRecords: The DatasetRecords object created from the disk path.
 
         """
-        records = JsonIO._records_from_json(path=path)
-        return self.log(records=records)
+        with trace_span(
+            self.__client.tracer, "DatasetRecords.from_json", {"argilla.dataset.name": self.__dataset.name}
+        ):
+            records = JsonIO._records_from_json(path=path)
+            return self.log(records=records, progress=progress)
 
-    def to_datasets(self) -> HFDataset:
+    def to_datasets(self, progress: Optional[ProgressCallback] = None) -> "HFDataset":
         """
         Export the records to a HFDataset.
 
+        Parameters:
+            progress (ProgressCallback): A function receiving the progress of the export after every fetched page.
+
         Returns:
             The dataset containing the records.
 
         """
-        records = list(self(with_suggestions=True, with_responses=True))
+        with track_progress(
+            progress, "DatasetRecords.to_datasets", total=self.count() if progress else None
+        ) as tracker:
+            records = list(self._iterate_for_export(progress=tracker))
         return HFDatasetsIO.to_datasets(records=records)
 
     ############################
@@ -317,17 +975,31 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
 
     def _ingest_records(
         self,
-        records: Union[List[Dict[str, Any]], Dict[str, Any], List[Record], Record, HFDataset],
+        records: Union[List[Dict[str, Any]], Dict[str, Any], List[Record], Record, "HFDataset"],
         mapping: Optional[Dict[str, str]] = None,
         user_id: Optional[UUID] = None,
     ) -> List[RecordModel]:
         if len(records) == 0:
             raise ValueError("No records provided to ingest.")
+        attributes = {"argilla.dataset.name": self.__dataset.name, "argilla.records.count": len(records)}
+        with trace_span(self.__client.tracer, "DatasetRecords.ingest", attributes):
+            return self.__ingest_records(records=records, mapping=mapping, user_id=user_id)
+
+    def __ingest_records(
+        self,
+        records: Union[List[Dict[str, Any]], Dict[str, Any], List[Record], Record, "HFDataset"],
+        mapping: Optional[Dict[str, str]],
+        user_id: Optional[UUID],
+    ) -> List[RecordModel]:
         if HFDatasetsIO._is_hf_dataset(dataset=records):
             records = HFDatasetsIO._record_dicts_from_datasets(dataset=records)
         if all(map(lambda r: isinstance(r, dict), records)):
             # Records as flat dicts of values to be matched to questions as suggestion or response
-            records = [self._infer_record_from_mapping(data=r, mapping=mapping, user_id=user_id) for r in records]  # type: ignore
+            schema = DatasetSchemaSnapshot.from_dataset(self.__dataset)
+            records = [
+                self._infer_record_from_mapping(data=r, mapping=mapping, user_id=user_id, schema=schema)  # type: ignore
+                for r in records
+            ]
         elif all(map(lambda r: isinstance(r, Record), records)):
             for record in records:
                 record.dataset = self.__dataset
@@ -338,6 +1010,307 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
             )
         return [record.api_model() for record in records]
 
+    def _iterate_for_export(self, progress: ProgressTracker) -> DatasetRecordsIterator:
+        return DatasetRecordsIterator(
+            self.__dataset,
+            self.__client,
+            batch_size=self.DEFAULT_BATCH_SIZE,
+            with_suggestions=True,
+            with_responses=True,
+            progress=progress,
+        )
+
+    @staticmethod
+    def _is_records_list(records: Any) -> bool:
+        if HFDatasetsIO._is_hf_dataset(dataset=records) or not isinstance(records, (list, tuple)):
+            return False
+        return len(records) > 0 and all(isinstance(record, Record) for record in records)
+
+    def _log_records(self, records: List[Record], batch_size: int, only_modified: bool = True) -> List[Record]:
+        """Logs Record objects. With `only_modified`, the records fetched from the dataset that were not modified
+        are skipped and only the modified attributes of the other fetched records are sent."""
+        new_records_indexes, new_record_models = [], []
+        modified_records_indexes, modified_record_models = [], []
+
+        for index, record in enumerate(records):
+            if only_modified and self._is_fetched_from_dataset(record):
+                if not record.is_modified:
+                    continue
+                modified_records_indexes.append(index)
+                modified_record_models.append(
+                    self._partial_record_model(
+                        record=record,
+                        attributes=sorted(record._modified_attributes),
+                        use_server_ids=True,
+                    )
+                )
+            else:
+                record.dataset = self.__dataset
+                new_records_indexes.append(index)
+                new_record_models.append(record.api_model())
+
+        skipped = len(records) - len(new_records_indexes) - len(modified_records_indexes)
+        if skipped:
+            self._log_message(message=f"Skipping {skipped} records that were not modified.")
+            current_progress().advance(skipped)
+
+        logged_records = list(records)
+        for indexes, record_models, partial in [
+            (new_records_indexes, new_record_models, False),
+            (modified_records_indexes, modified_record_models, True),
+        ]:
+            if not record_models:
+                continue
+            upserted_records = self._upsert_record_models(
+                record_models=record_models,
+                batch_size=batch_size,
+                partial=partial,
+            )
+            for index, upserted_record in zip(indexes, upserted_records):
+                records[index]._reset_modified_attributes()
+                logged_records[index] = upserted_record
+
+        return logged_records
+
+    def _log_changed_records(
+        self,
+        records: Union[List[dict], List[Record], "HFDataset"],
+        mapping: Optional[Dict[str, str]],
+        user_id: Optional[UUID],
+        batch_size: int,
+        hash_store: Optional[Union[Path, str]],
+    ) -> List[Record]:
+        if len(records) == 0:
+            raise ValueError("No records provided to ingest.")
+        if not self._is_records_list(records):
+            if HFDatasetsIO._is_hf_dataset(dataset=records):
+                records = HFDatasetsIO._record_dicts_from_datasets(dataset=records)
+            user_id = user_id or self.__client.me.id
+            schema = DatasetSchemaSnapshot.from_dataset(self.__dataset)
+            records = [
+                self._infer_record_from_mapping(data=r, mapping=mapping, user_id=user_id, schema=schema)
+                for r in records
+            ]
+
+        store = RecordHashStore(path=hash_store) if hash_store else None
+        known_hashes = store.load() if store else self._fetch_record_hashes()
+
+        records_hashes = [record_content_hash(record) for record in records]
+        changed_indexes = [
+            index
+            for index, (record, record_hash) in enumerate(zip(records, records_hashes))
+            if known_hashes.get(str(record.id)) != record_hash
+        ]
+        self._log_message(
+            message=f"Skipping {len(records) - len(changed_indexes)} unchanged records of {len(records)} records.",
+            level="info",
+        )
+        current_progress().advance(len(records) - len(changed_indexes))
+
+        logged_records = list(records)
+        if changed_indexes:
+            record_models = []
+            for index in changed_indexes:
+                records[index].dataset = self.__dataset
+                record_models.append(records[index].api_model())
+            changed_records = self._upsert_record_models(record_models=record_models, batch_size=batch_size)
+            for index, record in zip(changed_indexes, changed_records):
+                records[index]._reset_modified_attributes()
+                logged_records[index] = record
+
+        if store:
+            known_hashes.update({str(records[index].id): records_hashes[index] for index in changed_indexes})
+            store.save(known_hashes)
+
+        return logged_records
+
+    def _fetch_record_hashes(self) -> Dict[str, str]:
+        """Computes the content hashes of the records in the dataset on the server, by record id"""
+        records = self(
+            with_suggestions=True,
+            with_responses=True,
+            with_vectors=True if self.__dataset.settings.vectors else None,
+        )
+        return {str(record.id): record_content_hash(record) for record in records}
+
+    def _validate_responses_authorship(self, responses: List[Tuple[Record, UserResponseModel]]) -> None:
+        """Rejects the responses of other users, which the bulk endpoint would create for the current user."""
+        users_ids = {user_response.user_id for _, user_response in responses} - {None}
+        if not users_ids:
+            return
+        current_user_id = self.__client.me.id
+        other_users_records = [
+            str(record.id)
+            for record, user_response in responses
+            if user_response.user_id not in (None, current_user_id)
+        ]
+        if other_users_records:
+            raise ValueError(
+                f"Cannot submit the responses of other users as the current user, in records {other_users_records}. "
+                "Submit them with the client of their user."
+            )
+
+    def _is_fetched_from_dataset(self, record: Record) -> bool:
+        return (
+            record._modified_attributes is not None
+            and record._server_id is not None
+            and record.dataset is not None
+            and record.dataset.id == self.__dataset.id
+        )
+
+    def _upsert_record_models(
+        self,
+        record_models: List[RecordModel],
+        batch_size: int,
+        partial: bool = False,
+    ) -> List[Record]:
+        batch_size = self._normalize_batch_size(
+            batch_size=batch_size,
+            records_length=len(record_models),
+            max_value=self._api.MAX_RECORDS_PER_UPSERT_BULK,
+        )
+
+        created_or_updated = []
+        records_updated = 0
+        for batch in range(0, len(record_models), batch_size):
+            self._log_message(message=f"Sending records from {batch} to {batch + batch_size}.")
+            batch_records = record_models[batch : batch + batch_size]
+            models, updated = self._api.bulk_upsert(
+                dataset_id=self.__dataset.id,
+                records=batch_records,
+                partial=partial,
+            )
+            created_or_updated.extend([Record.from_model(model=model, dataset=self.__dataset) for model in models])
+            records_updated += updated
+            current_progress().advance(len(batch_records))
+
+        records_created = len(created_or_updated) - records_updated
+        self._log_message(
+            message=f"Updated {records_updated} records and added {records_created} records to dataset {self.__dataset.name}",
+            level="info",
+        )
+
+        return created_or_updated
+
+    def _log_with_processes(
+        self,
+        records: Union[List[dict], "HFDataset"],
+        mapping: Optional[Dict[str, str]],
+        user_id: UUID,
+        batch_size: int,
+        processes: int,
+    ) -> List[Record]:
+        """Converts batches of record dictionaries to request bodies in a process pool, and sends the bodies
+        to the server from the current process in the order of the batches."""
+        if len(records) == 0:
+            raise ValueError("No records provided to ingest.")
+        if HFDatasetsIO._is_hf_dataset(dataset=records):
+            records = HFDatasetsIO._record_dicts_from_datasets(dataset=records)
+        if not all(isinstance(record, dict) for record in records):
+            raise ValueError(
+                "Records should be a a list Record instances, "
+                "a Hugging Face Dataset, or a list of dictionaries representing the records."
+            )
+
+        batch_size = self._normalize_batch_size(
+            batch_size=batch_size,
+            records_length=len(records),
+            max_value=self._api.MAX_RECORDS_PER_UPSERT_BULK,
+        )
+        schema = DatasetSchemaSnapshot.from_dataset(self.__dataset)
+        # Keep a bounded number of serialized batches in memory while they wait to be sent
+        max_pending = 2 * processes
+
+        created_or_updated = []
+        records_updated = 0
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending = deque()
+            for batch in range(0, len(records), batch_size):
+                if len(pending) >= max_pending:
+                    models, updated = self._send_serialized_batch(pending.popleft())
+                    created_or_updated.extend(models)
+                    records_updated += updated
+                pending.append(
+                    executor.submit(
+                        serialize_records_batch,
+                        schema,
+                        list(records[batch : batch + batch_size]),
+                        mapping,
+                        user_id,
+                    )
+                )
+            while pending:
+                models, updated = self._send_serialized_batch(pending.popleft())
+                created_or_updated.extend(models)
+                records_updated += updated
+
+        records_created = len(created_or_updated) - records_updated
+        self._log_message(
+            message=f"Updated {records_updated} records and added {records_created} records to dataset {self.__dataset.name}",
+            level="info",
+        )
+        return created_or_updated
+
+    def _send_serialized_batch(self, future: Future) -> Tuple[List[Record], int]:
+        models, updated = self._api.bulk_upsert_serialized(dataset_id=self.__dataset.id, content=future.result())
+        self._log_message(message=f"Sent a batch of {len(models)} records prepared in a worker process.")
+        current_progress().advance(len(models))
+        return [Record.from_model(model=model, dataset=self.__dataset) for model in models], updated
+
+    def _update_records_partially(
+        self,
+        records: Union[List[dict], List[Record], "HFDataset"],
+        attributes: List[str],
+        mapping: Optional[Dict[str, str]],
+        use_server_ids: bool,
+        batch_size: int,
+    ) -> List[Record]:
+        if len(records) == 0:
+            raise ValueError("No records provided to update.")
+        if HFDatasetsIO._is_hf_dataset(dataset=records):
+            records = HFDatasetsIO._record_dicts_from_datasets(dataset=records)
+
+        id_keys = ["id"] + [key for key, value in (mapping or {}).items() if value == "id"]
+        schema = DatasetSchemaSnapshot.from_dataset(self.__dataset)
+        updated_records = []
+        for record in records:
+            if isinstance(record, dict):
+                if not any(key in record for key in id_keys):
+                    raise ValueError("Records must include an `id` to be updated.")
+                record = self._infer_record_from_mapping(data=record, mapping=mapping, schema=schema)
+            elif not isinstance(record, Record):
+                raise ValueError(
+                    "Records should be a a list Record instances, "
+                    "a Hugging Face Dataset, or a list of dictionaries representing the records."
+                )
+            updated_records.append(record)
+
+        record_models = [
+            self._partial_record_model(record=record, attributes=attributes, use_server_ids=use_server_ids)
+            for record in updated_records
+        ]
+        return self._upsert_record_models(record_models=record_models, batch_size=batch_size, partial=True)
+
+    @staticmethod
+    def _partial_record_model(record: Record, attributes: List[str], use_server_ids: bool) -> RecordModel:
+        """Builds a record model with the record id and only the given attributes set, to be sent as a partial update"""
+        record_attributes = {
+            "suggestions": lambda: record.suggestions.api_models(),
+            "vectors": lambda: record.vectors.models,
+            "metadata": lambda: record.metadata.models,
+            "responses": lambda: record.responses.api_models(),
+            "fields": lambda: record.fields.to_dict(),
+            "external_id": lambda: record.id,
+        }
+        partial_attributes = {attribute: record_attributes[attribute]() for attribute in attributes}
+
+        if record._server_id is not None:
+            return RecordModel(id=record._server_id, **partial_attributes)
+        if use_server_ids:
+            record_id = record.id if isinstance(record.id, UUID) else UUID(str(record.id))
+            return RecordModel(id=record_id, **partial_attributes)
+        return RecordModel(external_id=record.id, **partial_attributes)
+
     def _normalize_batch_size(self, batch_size: int, records_length, max_value: int):
         norm_batch_size = min(batch_size, records_length, max_value)
 
@@ -349,6 +1322,83 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
 
         return norm_batch_size
 
+    @staticmethod
+    def _server_id_to_delete(record: Union[Record, UUID, str]) -> UUID:
+        if isinstance(record, Record):
+            if record._server_id is None:
+                raise ValueError(f"Record {record.id} cannot be deleted because it does not exist on the server.")
+            return record._server_id
+        return record if isinstance(record, UUID) else UUID(record)
+
+    def _get_many_by_ids(
+        self,
+        ids: Sequence[Union[str, UUID]],
+        use_server_ids: bool,
+        with_suggestions: bool,
+        with_responses: bool,
+        batch_size: int,
+        max_workers: int,
+    ) -> Dict[str, Record]:
+        # Search filters cannot match record ids, so the pages of the dataset are fetched concurrently, in rounds
+        # of `max_workers` pages, until all the ids are found
+        pending_ids = {str(record_id) for record_id in ids}
+        found = {}
+        if not pending_ids:
+            return found
+
+        batch_size = max(1, batch_size)
+        max_workers = max(1, max_workers)
+        offsets = list(range(0, self.count(), batch_size))
+
+        def list_record_models(offset: int) -> List[RecordModel]:
+            return self._api.list(
+                dataset_id=self.__dataset.id,
+                offset=offset,
+                limit=batch_size,
+                with_suggestions=with_suggestions,
+                with_responses=with_responses,
+            )
+
+        for round_start in range(0, len(offsets), max_workers):
+            round_offsets = offsets[round_start : round_start + max_workers]
+            for record_models in map_concurrently(list_record_models, round_offsets, max_workers=max_workers):
+                for model in record_models:
+                    record = Record.from_model(model=model, dataset=self.__dataset)
+                    record_id = str(record._server_id if use_server_ids else record.id)
+                    if record_id in pending_ids:
+                        found[record_id] = record
+                        pending_ids.remove(record_id)
+            if not pending_ids:
+                break
+        return found
+
+    def _infer_facet_values(self, term: str) -> List[Any]:
+        """Infers the values of a facet term from the dataset settings"""
+        term = term.strip()
+        if term == "status":
+            return list(self._RESPONSE_STATUSES)
+
+        name = term.split(".")[1] if term.startswith("metadata.") else term.split(".")[0]
+        schema_item = self.__dataset.schema.get(name)
+
+        values = None
+        if isinstance(schema_item, TermsMetadataProperty):
+            values = schema_item.options
+        elif isinstance(schema_item, QuestionPropertyBase):
+            values = getattr(schema_item, "labels", None) or getattr(schema_item, "values", None)
+
+        if not values:
+            raise ValueError(
+                f"Cannot infer the values of the term {term!r} from the dataset settings. "
+                "Provide the term values explicitly as a dictionary."
+            )
+        return list(values)
+
+    @staticmethod
+    def _facet_condition(term: str, value: Any) -> Condition:
+        # Terms filters are defined over string values
+        return Condition((term, "==", value if isinstance(value, str) else str(value)))
+
     def _validate_vector_names(self, vector_names: Union[List[str], str]) -> None:
         if not isinstance(vector_names, list):
             vector_names = [vector_names]
@@ -363,6 +1413,7 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
         data: dict,
         mapping: Optional[Dict[str, str]] = None,
         user_id: Optional[UUID] = None,
+        schema: Optional[DatasetSchemaSnapshot] = None,
     ) -> "Record":
         """Converts a mapped record dictionary to a Record object for use by the add or update methods.
         Args:
@@ -370,85 +1421,9 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
             data: A dictionary representing the record.
             mapping: A dictionary mapping source data keys to Argilla fields, questions, and ids.
             user_id: The user id to associate with the record responses.
+            schema: The schema of the dataset, taken once for a batch of records. Taken from the dataset if None.
         Returns:
             A Record object.
         """
-        fields: Dict[str, str] = {}
-        responses: List[Response] = []
-        record_id: Optional[str] = None
-        suggestion_values = defaultdict(dict)
-        vectors: List[Vector] = []
-        metadata: Dict[str, MetadataValue] = {}
-
-        schema = self.__dataset.schema
-
-        for attribute, value in data.items():
-            schema_item = schema.get(attribute)
-            attribute_type = None
-            sub_attribute = None
-
-            # Map source data keys using the mapping
-            if mapping and attribute in mapping:
-                attribute_mapping = mapping.get(attribute)
-                attribute_mapping = attribute_mapping.split(".")
-                attribute = attribute_mapping[0]
-                schema_item = schema.get(attribute)
-                if len(attribute_mapping) > 1:
-                    attribute_type = attribute_mapping[1]
-                if len(attribute_mapping) > 2:
-                    sub_attribute = attribute_mapping[2]
-            elif schema_item is mapping is None and attribute != "id":
-                warnings.warn(
-                    message=f"""Record attribute {attribute} is not in the schema so skipping.
-                        Define a mapping to map source data fields to Argilla Fields, Questions, and ids
-                        """
-                )
-                continue
-
-            if attribute == "id":
-                record_id = value
-                continue
-
-            # Add suggestion values to the suggestions
-            if attribute_type == "suggestion":
-                if sub_attribute in ["score", "agent"]:
-                    suggestion_values[attribute][sub_attribute] = value
-
-                elif sub_attribute is None:
-                    suggestion_values[attribute].update(
-                        {"value": value, "question_name": attribute, "question_id": schema_item.id}
-                    )
-                else:
-                    warnings.warn(
-                        message=f"Record attribute {sub_attribute} is not a valid suggestion sub_attribute so skipping."
-                    )
-                continue
-
-            # Assign the value to question, field, or response based on schema item
-            if isinstance(schema_item, TextField):
-                fields[attribute] = value
-            elif isinstance(schema_item, QuestionPropertyBase) and attribute_type == "response":
-                responses.append(Response(question_name=attribute, value=value, user_id=user_id))
-            elif isinstance(schema_item, QuestionPropertyBase) and attribute_type is None:
-                suggestion_values[attribute].update(
-                    {"value": value, "question_name": attribute, "question_id": schema_item.id}
-                )
-            elif isinstance(schema_item, VectorField):
-                vectors.append(Vector(name=attribute, values=value))
-            elif isinstance(schema_item, MetadataPropertyBase):
-                metadata[attribute] = value
-            else:
-                warnings.warn(message=f"Record attribute {attribute} is not in the schema or mapping so skipping.")
-                continue
-
-        suggestions = [Suggestion(**suggestion_dict) for suggestion_dict in suggestion_values.values()]
-
-        return Record(
-            id=record_id,
-            fields=fields,
-            suggestions=suggestions,
-            responses=responses,
-            vectors=vectors,
-            metadata=metadata,
-            _dataset=self.__dataset,
-        )
+        schema = schema or DatasetSchemaSnapshot.from_dataset(self.__dataset)
+        return schema.record(data=data, mapping=mapping, user_id=user_id, dataset=self.__dataset)
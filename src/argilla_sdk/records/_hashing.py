@@ -0,0 +1,78 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Union
+
+from argilla_sdk._models import ResponseStatus
+
+if TYPE_CHECKING:
+    from argilla_sdk.records._resource import Record
+
+__all__ = ["RecordHashStore", "record_content_hash"]
+
+
+def record_content_hash(record: "Record") -> str:
+    """Computes a stable hash of the content of a record. The record ids and the server timestamps are not
+    part of the hash, so a local record and the same record fetched from the server have the same hash.
+
+    Args:
+        record (Record): The record to hash.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest of the canonical record content.
+    """
+    payload = json.dumps(_canonical_record_content(record), sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _canonical_record_content(record: "Record") -> Dict[str, Any]:
+    responses = [
+        {
+            "question_name": response.question_name,
+            "value": response.value,
+            "user_id": str(response.user_id) if response.user_id else None,
+            "status": ResponseStatus(response.status or ResponseStatus.draft).value,
+        }
+        for response in record.responses
+    ]
+    return {
+        "fields": record.fields.to_dict(),
+        "metadata": dict(record.metadata),
+        "vectors": record.vectors.to_dict(),
+        "suggestions": record.suggestions.to_dict(),
+        "responses": sorted(responses, key=lambda response: json.dumps(response, sort_keys=True, default=str)),
+    }
+
+
+class RecordHashStore:
+    """A local JSON file storing the content hash of the records logged to a dataset, by record id."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def load(self) -> Dict[str, str]:
+        if not self.path.exists():
+            return {}
+        with open(self.path, "r") as f:
+            return json.load(f)
+
+    def save(self, hashes: Dict[str, str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(hashes, f)
+        tmp_path.replace(self.path)
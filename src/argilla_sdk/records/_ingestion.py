@@ -0,0 +1,211 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import warnings
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from argilla_sdk._models import MetadataValue
+from argilla_sdk.records._resource import Record
+from argilla_sdk.responses import Response
+from argilla_sdk.settings import TextField, VectorField
+from argilla_sdk.settings._metadata import MetadataPropertyBase
+from argilla_sdk.settings._question import QuestionPropertyBase, QuestionType
+from argilla_sdk.suggestions import Suggestion
+from argilla_sdk.vectors import Vector
+
+if TYPE_CHECKING:
+    from argilla_sdk.datasets import Dataset
+
+__all__ = ["DatasetSchemaSnapshot", "MappedRecord", "serialize_records_batch"]
+
+
+@dataclass
+class MappedRecord:
+    """The attributes of a record dictionary, resolved against the schema of a dataset."""
+
+    id: Optional[Any] = None
+    fields: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, MetadataValue] = field(default_factory=dict)
+    vectors: Dict[str, List[float]] = field(default_factory=dict)
+    responses: List[Tuple[str, Any]] = field(default_factory=list)
+    suggestions: Dict[str, Dict[str, Any]] = field(default_factory=lambda: defaultdict(dict))
+
+
+class DatasetSchemaSnapshot:
+    """A picklable snapshot of the schema of a dataset, holding the kind and the id of every field, question,
+    vector and metadata property by name, and the questions. It maps record dictionaries to records without a
+    client, so records can be prepared in worker processes. There, the snapshot stands in for the dataset of the
+    records, providing the questions to `Record.api_model` like the dataset settings do."""
+
+    FIELD = "field"
+    QUESTION = "question"
+    VECTOR = "vector"
+    METADATA = "metadata"
+
+    def __init__(
+        self,
+        properties: Dict[str, Tuple[str, Optional[UUID]]],
+        questions: Optional[Dict[str, QuestionType]] = None,
+    ):
+        self.properties = properties
+        self.questions = questions or {}
+
+    @classmethod
+    def from_dataset(cls, dataset: "Dataset") -> "DatasetSchemaSnapshot":
+        properties = {}
+        questions = {}
+        for name, schema_item in dataset.schema.items():
+            if isinstance(schema_item, TextField):
+                properties[name] = (cls.FIELD, schema_item.id)
+            elif isinstance(schema_item, QuestionPropertyBase):
+                properties[name] = (cls.QUESTION, schema_item.id)
+                questions[name] = schema_item
+            elif isinstance(schema_item, VectorField):
+                properties[name] = (cls.VECTOR, schema_item.id)
+            elif isinstance(schema_item, MetadataPropertyBase):
+                properties[name] = (cls.METADATA, schema_item.id)
+        return cls(properties=properties, questions=questions)
+
+    @property
+    def settings(self) -> "DatasetSchemaSnapshot":
+        return self
+
+    def question_by_name(self, question_name: str) -> QuestionType:
+        if question_name not in self.questions:
+            raise ValueError(f"Question with name {question_name} not found")
+        return self.questions[question_name]
+
+    def map_record(self, data: Dict[str, Any], mapping: Optional[Dict[str, str]] = None) -> MappedRecord:
+        """Resolves the attributes of a record dictionary to fields, suggestions, responses, vectors and metadata.
+
+        Args:
+            data: A dictionary representing the record.
+            mapping: A dictionary mapping source data keys to Argilla fields, questions, and ids.
+
+        Returns:
+            A MappedRecord with the resolved attributes.
+        """
+        record = MappedRecord()
+
+        for attribute, value in data.items():
+            kind, property_id = self.properties.get(attribute, (None, None))
+            attribute_type = None
+            sub_attribute = None
+
+            # Map source data keys using the mapping
+            if mapping and attribute in mapping:
+                attribute_mapping = mapping.get(attribute)
+                attribute_mapping = attribute_mapping.split(".")
+                attribute = attribute_mapping[0]
+                kind, property_id = self.properties.get(attribute, (None, None))
+                if len(attribute_mapping) > 1:
+                    attribute_type = attribute_mapping[1]
+                if len(attribute_mapping) > 2:
+                    sub_attribute = attribute_mapping[2]
+            elif kind is mapping is None and attribute != "id":
+                warnings.warn(message=f"""Record attribute {attribute} is not in the schema so skipping.
+                        Define a mapping to map source data fields to Argilla Fields, Questions, and ids
+                        """)
+                continue
+
+            if attribute == "id":
+                record.id = value
+                continue
+
+            # Add suggestion values to the suggestions
+            if attribute_type == "suggestion":
+                if sub_attribute in ["score", "agent"]:
+                    record.suggestions[attribute][sub_attribute] = value
+
+                elif sub_attribute is None:
+                    record.suggestions[attribute].update(
+                        {"value": value, "question_name": attribute, "question_id": property_id}
+                    )
+                else:
+                    warnings.warn(
+                        message=f"Record attribute {sub_attribute} is not a valid suggestion sub_attribute so skipping."
+                    )
+                continue
+
+            # Assign the value to question, field, or response based on schema item
+            if kind == self.FIELD:
+                record.fields[attribute] = value
+            elif kind == self.QUESTION and attribute_type == "response":
+                record.responses.append((attribute, value))
+            elif kind == self.QUESTION and attribute_type is None:
+                record.suggestions[attribute].update(
+                    {"value": value, "question_name": attribute, "question_id": property_id}
+                )
+            elif kind == self.VECTOR:
+                record.vectors[attribute] = value
+            elif kind == self.METADATA:
+                record.metadata[attribute] = value
+            else:
+                warnings.warn(message=f"Record attribute {attribute} is not in the schema or mapping so skipping.")
+                continue
+
+        return record
+
+    def record(
+        self,
+        data: Dict[str, Any],
+        mapping: Optional[Dict[str, str]] = None,
+        user_id: Optional[UUID] = None,
+        dataset: Optional["Dataset"] = None,
+    ) -> Record:
+        """Converts a record dictionary to a Record, like `DatasetRecords.log` does.
+
+        Args:
+            data: A dictionary representing the record.
+            mapping: A dictionary mapping source data keys to Argilla fields, questions, and ids.
+            user_id: The user id to associate with the record responses.
+            dataset: The dataset of the record. If None, the snapshot stands in for the dataset.
+
+        Returns:
+            A Record object.
+        """
+        mapped_record = self.map_record(data=data, mapping=mapping)
+
+        suggestions = [Suggestion(**suggestion_dict) for suggestion_dict in mapped_record.suggestions.values()]
+        responses = [
+            Response(question_name=question_name, value=value, user_id=user_id)
+            for question_name, value in mapped_record.responses
+        ]
+        vectors = [Vector(name=name, values=values) for name, values in mapped_record.vectors.items()]
+
+        return Record(
+            id=mapped_record.id,
+            fields=mapped_record.fields,
+            suggestions=suggestions,
+            responses=responses,
+            vectors=vectors,
+            metadata=mapped_record.metadata,
+            _dataset=dataset or self,
+        )
+
+
+def serialize_records_batch(
+    schema: DatasetSchemaSnapshot,
+    records: List[Dict[str, Any]],
+    mapping: Optional[Dict[str, str]] = None,
+    user_id: Optional[UUID] = None,
+) -> bytes:
+    """Converts a batch of record dictionaries to the JSON body of a bulk upsert request. This function
+    runs in worker processes, so it only depends on picklable arguments."""
+    items = [schema.record(data=data, mapping=mapping, user_id=user_id).api_model().model_dump() for data in records]
+    return json.dumps({"items": items}).encode("utf-8")
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Union, Optional, Type
+import sys
+from typing import TYPE_CHECKING, Dict, List, Union, Optional, Type
 
 from argilla_sdk.records._io._generic import GenericIO
 
+if TYPE_CHECKING:
+    from datasets import Dataset as HFDataset
+
 
 def _resolve_hf_datasets_type() -> Optional[Type]:
     """This function resolves the `datasets.Dataset` type safely in case the datasets package is not installed.
@@ -31,12 +35,9 @@ def _resolve_hf_datasets_type() -> Optional[Type]:
         return None
 
 
-HFDataset = _resolve_hf_datasets_type()
-
-
 class HFDatasetsIO:
     @staticmethod
-    def _is_hf_dataset(dataset: HFDataset) -> bool:
+    def _is_hf_dataset(dataset: "HFDataset") -> bool:
         """Check if the object is a Hugging Face dataset.
 
         Parameters:
@@ -45,11 +46,14 @@ class HFDatasetsIO:
         Returns:
             bool: True if the object is a Hugging Face dataset, False otherwise.
         """
+        # A Hugging Face dataset can only exist once the datasets package is imported, so it is not imported here
+        if "datasets" not in sys.modules:
+            return False
         HFDataset = _resolve_hf_datasets_type()
-        return isinstance(dataset, HFDataset)
+        return HFDataset is not None and isinstance(dataset, HFDataset)
 
     @staticmethod
-    def to_datasets(records: List["Record"]) -> HFDataset:
+    def to_datasets(records: List["Record"]) -> "HFDataset":
         """
         Export the records to a Hugging Face dataset.
 
@@ -64,7 +68,7 @@ class HFDatasetsIO:
         return dataset
 
     @staticmethod
-    def _record_dicts_from_datasets(dataset: HFDataset) -> List[Dict[str, Union[str, float, int, list]]]:
+    def _record_dicts_from_datasets(dataset: "HFDataset") -> List[Dict[str, Union[str, float, int, list]]]:
         """Creates a dictionaries from a HF dataset that can be passed to DatasetRecords.add or DatasetRecords.update.
 
         Parameters:
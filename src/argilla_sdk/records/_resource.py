@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, Iterable
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, Iterable
 from uuid import UUID, uuid4
 
 from argilla_sdk._models import (
@@ -23,6 +23,7 @@ from argilla_sdk._models import (
     SuggestionModel,
     VectorModel,
     MetadataValue,
+    ResponseStatus,
 )
 from argilla_sdk._resource import Resource
 from argilla_sdk.responses import Response, UserResponse
@@ -83,6 +84,9 @@ class Record(Resource):
         if fields == {} and id is None:
             raise ValueError("If fields are an empty dictionary, an id must be provided.")
         self._dataset = _dataset
+        # The names of the attributes modified since the record was fetched from the server.
+        # None for records that have not been fetched from the server.
+        self._modified_attributes: Optional[Set[str]] = None
 
         self._model = RecordModel(
             fields=fields,
@@ -95,7 +99,7 @@ class Record(Resource):
         # Initialize the vectors
         self.__vectors = RecordVectors(vectors=vectors, record=self)
         # Initialize the metadata
-        self.__metadata = RecordMetadata(metadata=metadata)
+        self.__metadata = RecordMetadata(metadata=metadata, record=self)
         self.__responses = RecordResponses(responses=responses, record=self)
         self.__suggestions = RecordSuggestions(suggestions=suggestions, record=self)
 
@@ -116,6 +120,7 @@ class Record(Resource):
     @id.setter
     def id(self, value: str) -> None:
         self._model.external_id = value
+        self._mark_as_modified("external_id")
 
     @property
     def dataset(self) -> "Dataset":
@@ -149,6 +154,11 @@ class Record(Resource):
     def _server_id(self) -> Optional[UUID]:
         return self._model.id
 
+    @property
+    def is_modified(self) -> bool:
+        """Whether the record has not been fetched from the server or has been modified since it was fetched."""
+        return self._modified_attributes is None or len(self._modified_attributes) > 0
+
     ############################
     # Public methods
     ############################
@@ -241,7 +251,7 @@ class Record(Resource):
         Returns:
             A Record object.
         """
-        return cls(
+        record = cls(
             id=model.external_id,
             fields=model.fields,
             metadata={meta.name: meta.value for meta in model.metadata},
@@ -256,6 +266,21 @@ class Record(Resource):
             _dataset=dataset,
             _server_id=model.id,
         )
+        record._reset_modified_attributes()
+        return record
+
+    ############################
+    # Private methods
+    ############################
+
+    def _mark_as_modified(self, attribute: str) -> None:
+        """Marks an attribute of a record fetched from the server as modified"""
+        if self._modified_attributes is not None:
+            self._modified_attributes.add(attribute)
+
+    def _reset_modified_attributes(self) -> None:
+        """Marks the record as in sync with the server"""
+        self._modified_attributes = set()
 
 
 class RecordFields:
@@ -305,7 +330,12 @@ class RecordResponses(Iterable[Response]):
             responses_by_user_id[response.user_id].append(response)
 
         return [
-            UserResponse(user_id=user_id, answers=responses, _record=self.record).api_model()
+            UserResponse(
+                user_id=user_id,
+                answers=responses,
+                status=self.__status_from_responses(responses),
+                _record=self.record,
+            ).api_model()
             for user_id, responses in responses_by_user_id.items()
         ]
 
@@ -315,6 +345,17 @@ class RecordResponses(Iterable[Response]):
     def __getitem__(self, index: int):
         return self.__responses[index]
 
+    def add(self, response: Response) -> None:
+        """Adds a response to the record.
+
+        Args:
+            response: The response to add.
+        """
+        response.record = self.record
+        self.__responses.append(response)
+        self.__responses_by_question_name[response.question_name].append(response)
+        self.record._mark_as_modified("responses")
+
     def __getattr__(self, name) -> List[Response]:
         return self.__responses_by_question_name[name]
 
@@ -331,6 +372,14 @@ class RecordResponses(Iterable[Response]):
     def __repr__(self) -> str:
         return {k: [{"value": v["value"]} for v in values] for k, values in self.to_dict().items()}.__repr__()
 
+    @staticmethod
+    def __status_from_responses(responses: List[Response]) -> ResponseStatus:
+        """Returns the status shared by the responses of a user, defaulting to draft when none is defined."""
+        for response in responses:
+            if response.status is not None:
+                return response.status
+        return ResponseStatus.draft
+
 
 class RecordSuggestions(Iterable[Suggestion]):
     """This is a container class for the suggestions of a Record.
@@ -354,6 +403,18 @@ class RecordSuggestions(Iterable[Suggestion]):
     def __getitem__(self, index: int):
         return self.__suggestions[index]
 
+    def add(self, suggestion: Suggestion) -> None:
+        """Adds a suggestion to the record, replacing the suggestion for the same question if any.
+
+        Args:
+            suggestion: The suggestion to add.
+        """
+        suggestion.record = self.record
+        self.__suggestions = [s for s in self.__suggestions if s.question_name != suggestion.question_name]
+        self.__suggestions.append(suggestion)
+        setattr(self, suggestion.question_name, suggestion)
+        self.record._mark_as_modified("suggestions")
+
     def to_dict(self) -> Dict[str, List[str]]:
         """Converts the suggestions to a dictionary.
         Returns:
@@ -381,7 +442,14 @@ class RecordVectors:
         self.__vectors = vectors or []
         self.record = record
         for vector in self.__vectors:
-            setattr(self, vector.name, vector.values)
+            object.__setattr__(self, vector.name, vector.values)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_") or name == "record":
+            object.__setattr__(self, name, value)
+        else:
+            # Assigning a vector by name, as in `record.vectors.embedding = [...]`, replaces the vector
+            self.add(Vector(name=name, values=value))
 
     def __repr__(self) -> str:
         return {vector.name: f"{len(vector.values)}" for vector in self.__vectors}.__repr__()
@@ -390,6 +458,17 @@ class RecordVectors:
     def models(self) -> List[VectorModel]:
         return [vector.api_model() for vector in self.__vectors]
 
+    def add(self, vector: Vector) -> None:
+        """Adds a vector to the record, replacing the vector with the same name if any.
+
+        Args:
+            vector: The vector to add.
+        """
+        self.__vectors = [v for v in self.__vectors if v.name != vector.name]
+        self.__vectors.append(vector)
+        object.__setattr__(self, vector.name, vector.values)
+        self.record._mark_as_modified("vectors")
+
     def to_dict(self) -> Dict[str, List[float]]:
         """Converts the vectors to a dictionary.
         Returns:
@@ -401,8 +480,9 @@ class RecordVectors:
 class RecordMetadata(dict):
     """This is a container class for the metadata of a Record."""
 
-    def __init__(self, metadata: Optional[Dict[str, MetadataValue]] = None) -> None:
+    def __init__(self, metadata: Optional[Dict[str, MetadataValue]] = None, record: Optional[Record] = None) -> None:
         super().__init__(metadata or {})
+        object.__setattr__(self, "_record", record)
 
     def __getattr__(self, item: str):
         return self[item]
@@ -410,6 +490,41 @@ class RecordMetadata(dict):
     def __setattr__(self, key: str, value: MetadataValue):
         self[key] = value
 
+    def __setitem__(self, key: str, value: MetadataValue) -> None:
+        super().__setitem__(key, value)
+        self.__mark_as_modified()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.__mark_as_modified()
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.__mark_as_modified()
+
+    def setdefault(self, key: str, default: MetadataValue = None) -> MetadataValue:
+        if key not in self:
+            self.__mark_as_modified()
+        return super().setdefault(key, default)
+
+    def pop(self, *args) -> MetadataValue:
+        value = super().pop(*args)
+        self.__mark_as_modified()
+        return value
+
+    def popitem(self) -> Tuple[str, MetadataValue]:
+        item = super().popitem()
+        self.__mark_as_modified()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self.__mark_as_modified()
+
+    def __mark_as_modified(self) -> None:
+        if self._record is not None:
+            self._record._mark_as_modified("metadata")
+
     @property
     def models(self) -> List[MetadataModel]:
         return [MetadataModel(name=key, value=value) for key, value in self.items()]
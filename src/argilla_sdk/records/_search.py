@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, List, Any, Union, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 from argilla_sdk._models import SearchQueryModel
 from argilla_sdk._models._search import (
@@ -28,6 +28,13 @@ from argilla_sdk._models._search import (
     QueryModel,
 )
 
+if TYPE_CHECKING:
+    import numpy
+
+    from argilla_sdk.records._resource import Record
+
+LocalRecord = Union["Record", Dict[str, Any]]
+
 
 class Condition(Tuple[str, str, Any]):
     """This class is used to map user conditions to the internal filter models"""
@@ -51,6 +58,18 @@ class Condition(Tuple[str, str, Any]):
         else:
             raise ValueError(f"Unknown operator: {operator}")
 
+    def evaluate(self, record: LocalRecord) -> bool:
+        """Evaluates the condition locally against a `Record` or an exported record dictionary,
+        as produced by `Record.to_dict` or `dataset.records.to_list(flatten=True)`.
+
+        Parameters:
+            record (Union[Record, Dict[str, Any]]): The record to evaluate.
+
+        Returns:
+            bool: True if the record matches the condition, False otherwise.
+        """
+        return _LocalCondition(self).evaluate(record)
+
     @staticmethod
     def _extract_filter_scope(field: str) -> ScopeModel:
         field = field.strip()
@@ -95,6 +114,23 @@ class Filter:
     def model(self) -> AndFilterModel:
         return AndFilterModel.model_validate({"and": [condition.model for condition in self.conditions]})
 
+    def evaluate(self, record: LocalRecord) -> bool:
+        """Evaluates all the filter conditions locally against a `Record` or an exported record dictionary.
+
+        Parameters:
+            record (Union[Record, Dict[str, Any]]): The record to evaluate.
+
+        Returns:
+            bool: True if the record matches all the conditions, False otherwise.
+        """
+        return _LocalQuery(filter=self).evaluate(record)
+
+    def evaluate_batch(self, batch: Mapping[str, Sequence[Any]]) -> Union[List[bool], "numpy.ndarray"]:
+        """Evaluates all the filter conditions locally against a columnar batch of flattened records.
+        See `Query.evaluate_batch` for more information.
+        """
+        return _LocalQuery(filter=self).evaluate_batch(batch)
+
 
 class Query:
     """This class is used to map user queries to the internal query models"""
@@ -125,5 +161,299 @@ class Query:
 
         return model
 
+    def evaluate(self, record: LocalRecord) -> bool:
+        """Evaluates the query locally against a `Record` or an exported record dictionary, without a
+        round trip to the server. Text queries are evaluated by checking that every search term appears
+        in the text of the record, which is an approximation of the server side search.
+
+        Parameters:
+            record (Union[Record, Dict[str, Any]]): The record to evaluate. Exported dictionaries can be
+                nested, as produced by `Record.to_dict`, or flattened, as produced by `to_list(flatten=True)`.
+
+        Returns:
+            bool: True if the record matches the query, False otherwise.
+        """
+        return self.to_predicate()(record)
+
+    def evaluate_batch(self, batch: Mapping[str, Sequence[Any]]) -> Union[List[bool], "numpy.ndarray"]:
+        """Evaluates the query locally against a columnar batch of flattened records, like the ones produced by
+        `to_dict(flatten=True)`, a `pandas.DataFrame` or a batch from `datasets.Dataset.filter(..., batched=True)`.
+        The evaluation is vectorized when NumPy is installed.
+
+        Parameters:
+            batch (Mapping[str, Sequence[Any]]): A mapping from column names to column values.
+
+        Returns:
+            A boolean mask with one value per row. A NumPy array if NumPy is installed, otherwise a list.
+        """
+        return _LocalQuery(filter=self.filter, query=self.query).evaluate_batch(batch)
+
+    def to_predicate(self) -> Callable[[LocalRecord], bool]:
+        """Compiles the query into a local predicate that can be reused over many records.
+
+        Returns:
+            Callable[[Union[Record, Dict[str, Any]]], bool]: A predicate returning True for matching records.
+        """
+        return _LocalQuery(filter=self.filter, query=self.query).evaluate
+
+    def filter_records(self, records: Iterable[LocalRecord]) -> List[LocalRecord]:
+        """Filters a local collection of records, like the records of a previous `dataset.records(...)` call
+        or the exported records loaded from a JSON file.
+
+        Parameters:
+            records (Iterable[Union[Record, Dict[str, Any]]]): The records to filter.
+
+        Returns:
+            List[Union[Record, Dict[str, Any]]]: The records matching the query.
+        """
+        predicate = self.to_predicate()
+        return [record for record in records if predicate(record)]
+
+
+class _LocalCondition:
+    """A condition compiled for local evaluation over records, exported records and columnar batches"""
+
+    _STATUS_PENDING = "pending"
+    _STATUS_DEFAULT = "draft"
+
+    def __init__(self, condition: Condition):
+        field, operator, value = condition
+
+        self.scope = Condition._extract_filter_scope(field)
+        self.operator = operator.strip()
+
+        if self.operator == "==":
+            self.terms = [value]
+        elif self.operator == "in":
+            self.terms = list(value)
+        elif self.operator in [">=", "<="]:
+            self.bound = value
+        else:
+            raise ValueError(f"Unknown operator: {self.operator}")
+
+    ############################
+    # Record evaluation
+    ############################
+
+    def evaluate(self, record: LocalRecord) -> bool:
+        return any(self._match(value) for value in self._values(record))
+
+    def _match(self, value: Any) -> bool:
+        if value is None:
+            return False
+        if self.operator in ["==", "in"]:
+            return value in self.terms
+        try:
+            return value >= self.bound if self.operator == ">=" else value <= self.bound
+        except TypeError:
+            return False
+
+    def _values(self, record: LocalRecord) -> List[Any]:
+        if isinstance(record, dict):
+            if isinstance(record.get("fields"), dict):
+                values = self._values_from_nested_dict(record)
+            else:
+                values = self._values_from_flat_dict(record)
+        else:
+            values = self._values_from_record(record)
+        return self._flatten(values)
+
+    def _values_from_record(self, record: "Record") -> List[Any]:
+        scope = self.scope
+        if isinstance(scope, MetadataFilterScopeModel):
+            return [record.metadata.get(scope.metadata_property)]
+        elif isinstance(scope, SuggestionFilterScopeModel):
+            return [
+                getattr(suggestion, scope.property)
+                for suggestion in record.suggestions
+                if suggestion.question_name == scope.question
+            ]
+        elif scope.property == "status":
+            statuses = [response.status or self._STATUS_DEFAULT for response in record.responses]
+            return statuses or [self._STATUS_PENDING]
+        return [response.value for response in record.responses if response.question_name == scope.question]
+
+    def _values_from_nested_dict(self, record: Dict[str, Any]) -> List[Any]:
+        scope = self.scope
+        if isinstance(scope, MetadataFilterScopeModel):
+            return [(record.get("metadata") or {}).get(scope.metadata_property)]
+        elif isinstance(scope, SuggestionFilterScopeModel):
+            suggestion = (record.get("suggestions") or {}).get(scope.question) or {}
+            return [suggestion.get(scope.property)]
+
+        responses = record.get("responses") or {}
+        if scope.property == "status":
+            statuses = [
+                response.get("status") or self._STATUS_DEFAULT
+                for question_responses in responses.values()
+                for response in question_responses
+            ]
+            return statuses or [self._STATUS_PENDING]
+        return [response.get("value") for response in responses.get(scope.question, [])]
+
+    def _values_from_flat_dict(self, record: Dict[str, Any]) -> List[Any]:
+        columns = self._resolve_columns(record.keys())
+        if self.scope.entity == "response" and self.scope.property == "status":
+            return self._status_from_flat_values(
+                values=[record[column] for column in columns],
+                statuses=[record.get(f"{column}.status") for column in columns],
+            )
+        return [record.get(column) for column in columns]
+
+    ############################
+    # Columnar evaluation
+    ############################
+
+    def evaluate_batch(self, batch: Mapping[str, Sequence[Any]], num_rows: int, np: Optional[Any]) -> Any:
+        columns = self._resolve_columns(batch.keys())
+        is_status = self.scope.entity == "response" and self.scope.property == "status"
+
+        if is_status:
+            values = zip(*[batch[column] for column in columns]) if columns else [()] * num_rows
+            statuses = (
+                zip(*[batch.get(f"{column}.status", [None] * num_rows) for column in columns])
+                if columns
+                else [()] * num_rows
+            )
+            mask = [
+                any(self._match(status) for status in self._status_from_flat_values(row_values, row_statuses))
+                for row_values, row_statuses in zip(values, statuses)
+            ]
+            return np.asarray(mask, dtype=bool) if np else mask
+
+        masks = [self._evaluate_column(batch.get(column), num_rows=num_rows, np=np) for column in columns]
+        if not masks:
+            return np.zeros(num_rows, dtype=bool) if np else [False] * num_rows
+        if np:
+            return np.logical_or.reduce(masks)
+        return [any(row) for row in zip(*masks)]
+
+    def _evaluate_column(self, column: Optional[Sequence[Any]], num_rows: int, np: Optional[Any]) -> Any:
+        if column is None:
+            return np.zeros(num_rows, dtype=bool) if np else [False] * num_rows
+        if np:
+            mask = self._evaluate_column_vectorized(column, np=np)
+            if mask is not None:
+                return mask
+        mask = [any(self._match(value) for value in self._flatten([value])) for value in column]
+        return np.asarray(mask, dtype=bool) if np else mask
+
+    def _evaluate_column_vectorized(self, column: Sequence[Any], np: Any) -> Optional[Any]:
+        """Evaluates a column of scalar values with NumPy. Returns None when the column cannot be vectorized."""
+        try:
+            if self.operator in ["==", "in"]:
+                array = np.asarray(column)
+                if array.ndim != 1 or any(isinstance(term, (list, tuple, dict)) for term in self.terms):
+                    return None
+                if array.dtype == object and any(isinstance(value, (list, tuple, dict)) for value in array):
+                    return None
+                return np.isin(array, np.asarray(self.terms, dtype=object if array.dtype == object else None))
+            array = np.asarray(column, dtype=float)
+            if array.ndim != 1:
+                return None
+            return array >= self.bound if self.operator == ">=" else array <= self.bound
+        except (TypeError, ValueError):
+            return None
+
+    ############################
+    # Flat records helpers
+    ############################
+
+    def _resolve_columns(self, keys: Iterable[str]) -> List[str]:
+        """Resolves the flattened export columns holding the values of the condition scope"""
+        scope = self.scope
+        if isinstance(scope, MetadataFilterScopeModel):
+            return [scope.metadata_property]
+        elif isinstance(scope, SuggestionFilterScopeModel):
+            if scope.property == "value":
+                return [f"{scope.question}.suggestion"]
+            return [f"{scope.question}.suggestion.{scope.property}"]
+        elif scope.property == "status":
+            return [key for key in keys if ".response." in key and "." not in key.split(".response.", 1)[1]]
+        prefix = f"{scope.question}.response."
+        return [key for key in keys if key.startswith(prefix) and "." not in key[len(prefix) :]]
+
+    def _status_from_flat_values(self, values: Sequence[Any], statuses: Sequence[Any]) -> List[str]:
+        """Returns the statuses of the responses of a flattened record, from the `<question>.response.<user>`
+        value columns and their `<question>.response.<user>.status` columns"""
+        record_statuses = [
+            status or self._STATUS_DEFAULT for value, status in zip(values, statuses) if value is not None
+        ]
+        return record_statuses or [self._STATUS_PENDING]
+
+    @staticmethod
+    def _flatten(values: List[Any]) -> List[Any]:
+        flattened = []
+        for value in values:
+            if isinstance(value, (list, tuple)):
+                flattened.extend(value)
+            else:
+                flattened.append(value)
+        return flattened
+
+
+class _LocalQuery:
+    """A query compiled for local evaluation over records, exported records and columnar batches"""
+
+    def __init__(self, filter: Optional[Filter] = None, query: Optional[str] = None):
+        self.conditions = [_LocalCondition(condition) for condition in (filter.conditions if filter else [])]
+        self.terms = query.lower().split() if query else []
+
+    def evaluate(self, record: LocalRecord) -> bool:
+        if self.terms and not self._match_text(self._text(record)):
+            return False
+        return all(condition.evaluate(record) for condition in self.conditions)
+
+    def evaluate_batch(self, batch: Mapping[str, Sequence[Any]]) -> Any:
+        np = _resolve_numpy_module()
+        num_rows = len(next(iter(batch.values()))) if len(batch) > 0 else 0
+
+        if "fields" in batch.keys():
+            # Nested records exported as columns are evaluated row by row
+            rows = [dict(zip(batch.keys(), values)) for values in zip(*batch.values())]
+            mask = [self.evaluate(row) for row in rows]
+            return np.asarray(mask, dtype=bool) if np else mask
+
+        masks = [condition.evaluate_batch(batch, num_rows=num_rows, np=np) for condition in self.conditions]
+        if self.terms:
+            rows = [dict(zip(batch.keys(), values)) for values in zip(*batch.values())]
+            text_mask = [self._match_text(self._text(row)) for row in rows]
+            masks.append(np.asarray(text_mask, dtype=bool) if np else text_mask)
+
+        if not masks:
+            return np.ones(num_rows, dtype=bool) if np else [True] * num_rows
+        if np:
+            return np.logical_and.reduce(masks)
+        return [all(row) for row in zip(*masks)]
+
+    def _match_text(self, text: str) -> bool:
+        text = text.lower()
+        return all(term in text for term in self.terms)
+
+    @staticmethod
+    def _text(record: LocalRecord) -> str:
+        if isinstance(record, dict):
+            fields = record.get("fields")
+            if not isinstance(fields, dict):
+                # Flattened records mix fields and metadata, so all top level text values are searched
+                fields = {key: value for key, value in record.items() if "." not in key}
+        else:
+            fields = record.fields.to_dict()
+        return " ".join(value for value in fields.values() if isinstance(value, str))
+
+
+def _resolve_numpy_module() -> Optional[Any]:
+    """This function resolves the `numpy` module safely in case the numpy package is not installed.
+
+    Returns:
+        Optional[Any]: The numpy module in case the numpy package is installed. Otherwise, None.
+    """
+    try:
+        import numpy
+
+        return numpy
+    except ImportError:
+        return None
+
 
 __all__ = ["Query", "Filter", "Condition"]
@@ -0,0 +1,225 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from uuid import UUID
+
+from argilla_sdk._helpers import LoggingMixin
+from argilla_sdk._models import RecordModel
+from argilla_sdk.records._ingestion import DatasetSchemaSnapshot
+from argilla_sdk.records._resource import Record
+
+if TYPE_CHECKING:
+    from argilla_sdk.client import Argilla
+    from argilla_sdk.datasets import Dataset
+    from argilla_sdk.records._dataset_records import DatasetRecords
+
+__all__ = ["RecordsWriter"]
+
+
+class RecordsWriter(LoggingMixin):
+    """A buffered sink to log records one at a time from any thread. Records are queued and sent to the
+    server in batches by a background thread, when a batch is full or when the oldest queued record has
+    waited for `max_latency` seconds. Writing blocks while the queue is full. Pending records are flushed
+    when the writer is closed or when the interpreter exits.
+
+    Use `Dataset.records.writer` to create a writer:
+
+    ```python
+    with dataset.records.writer(max_batch=500, max_latency=2) as writer:
+        for prediction in predictions:
+            writer.write({"text": prediction.text, "label": prediction.label})
+    ```
+
+    Attributes:
+        queued (int): The number of records written to the writer.
+        sent (int): The number of records sent to the server.
+        failed (int): The number of records that could not be sent to the server.
+        last_error (Optional[Exception]): The last error raised when sending records to the server.
+    """
+
+    def __init__(
+        self,
+        records: "DatasetRecords",
+        dataset: "Dataset",
+        client: "Argilla",
+        max_batch: int = 500,
+        max_latency: float = 2.0,
+        max_queue_size: int = 10_000,
+        mapping: Optional[Dict[str, str]] = None,
+        user_id: Optional[UUID] = None,
+    ):
+        self._records = records
+        self._dataset = dataset
+        self._client = client
+        self._max_batch = max(1, min(max_batch, records._api.MAX_RECORDS_PER_UPSERT_BULK))
+        self._max_latency = max_latency
+        self._mapping = mapping
+        self._user_id = user_id
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        # Held while a record is queued and while the writer is closed, so no record is queued after the
+        # background thread has drained the queue and stopped
+        self._write_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flushing = threading.Event()
+
+        self.queued = 0
+        self.sent = 0
+        self.failed = 0
+        self.last_error: Optional[Exception] = None
+
+        self._worker = threading.Thread(target=self._run, name="argilla-records-writer", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def __enter__(self) -> "RecordsWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(queued={self.queued}, sent={self.sent}, failed={self.failed})"
+
+    ############################
+    # Public methods
+    ############################
+
+    def write(self, record: Union[Record, Dict[str, Any]], timeout: Optional[float] = None) -> None:
+        """Queues a record to be sent to the server. Blocks while the queue is full.
+
+        Parameters:
+            record: A `Record` object or a dictionary representing the record, like in `Dataset.records.log`.
+            timeout: The maximum number of seconds to wait for space in the queue. If None, waits indefinitely.
+
+        Raises:
+            RuntimeError: If the writer is closed.
+            queue.Full: If there is no space in the queue after `timeout` seconds.
+        """
+        with self._write_lock:
+            if self._closed.is_set():
+                raise RuntimeError("Cannot write records to a closed writer.")
+            self._queue.put(record, timeout=timeout)
+            with self._lock:
+                self.queued += 1
+
+    def flush(self) -> None:
+        """Sends the queued records without waiting for `max_latency` and blocks until all the queued records
+        have been sent to the server or have failed."""
+        self._flushing.set()
+        try:
+            self._queue.join()
+        finally:
+            self._flushing.clear()
+
+    def close(self) -> None:
+        """Flushes the queued records and stops the background thread. Closing a closed writer has no effect."""
+        with self._write_lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+        self.flush()
+        self._worker.join()
+        atexit.unregister(self.close)
+        self._log_message(message=f"Closed records writer: {self.sent} records sent, {self.failed} failed.")
+
+    ############################
+    # Private methods
+    ############################
+
+    def _run(self) -> None:
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            try:
+                self._send_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _next_batch(self) -> List[Union[Record, Dict[str, Any]]]:
+        """Waits for the first record and collects records until the batch is full or the latency is reached"""
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self._max_latency
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                if self._flushing.is_set():
+                    batch.append(self._queue.get_nowait())
+                else:
+                    # Wake up regularly to check whether a flush was requested
+                    batch.append(self._queue.get(timeout=min(remaining, 0.1)))
+            except queue.Empty:
+                if self._flushing.is_set() or time.monotonic() >= deadline:
+                    break
+        return batch
+
+    def _send_batch(self, batch: List[Union[Record, Dict[str, Any]]]) -> None:
+        record_models = []
+        # The schema of the dataset is taken once for all the record dictionaries of the batch
+        schema = None
+        for record in batch:
+            try:
+                if isinstance(record, dict) and schema is None:
+                    schema = DatasetSchemaSnapshot.from_dataset(self._dataset)
+                record_models.append(self._record_model(record, schema=schema))
+            except Exception as e:
+                self._register_failure(count=1, error=e)
+
+        if not record_models:
+            return
+        try:
+            self._records._api.bulk_upsert(dataset_id=self._dataset.id, records=record_models)
+        except Exception as e:
+            self._register_failure(count=len(record_models), error=e)
+        else:
+            with self._lock:
+                self.sent += len(record_models)
+            self._log_message(message=f"Sent {len(record_models)} records from the records writer.")
+
+    def _record_model(
+        self, record: Union[Record, Dict[str, Any]], schema: Optional[DatasetSchemaSnapshot] = None
+    ) -> RecordModel:
+        if isinstance(record, Record):
+            record.dataset = self._dataset
+            return record.api_model()
+        if isinstance(record, dict):
+            if self._user_id is None:
+                self._user_id = self._client.me.id
+            return self._records._infer_record_from_mapping(
+                data=record,
+                mapping=self._mapping,
+                user_id=self._user_id,
+                schema=schema,
+            ).api_model()
+        raise ValueError(f"Records should be Record instances or dictionaries. Found {type(record)}.")
+
+    def _register_failure(self, count: int, error: Exception) -> None:
+        with self._lock:
+            self.failed += count
+            self.last_error = error
+        self._log_message(message=f"Failed to send {count} records from the records writer: {error}", level="error")
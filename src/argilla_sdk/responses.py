@@ -38,9 +38,10 @@ class Response:
         question_name: str,
         value: Any,
         user_id: UUID,
+        status: Optional[ResponseStatus] = None,
         _record: Optional["Record"] = None,
     ) -> None:
-        """Initializes a `Response` for a `Record` with a user_id and value"""
+        """Initializes a `Response` for a `Record` with a user_id, a value and an optional status"""
 
         if question_name is None:
             raise ValueError("question_name is required")
@@ -51,8 +52,29 @@ class Response:
 
         self.record = _record
         self.question_name = question_name
-        self.value = value
+        self._value = value
         self.user_id = user_id
+        self._status = status
+
+    @property
+    def value(self) -> Any:
+        """The value of the response"""
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+        self.__mark_record_as_modified()
+
+    @property
+    def status(self) -> Optional[ResponseStatus]:
+        """The status of the response"""
+        return self._status
+
+    @status.setter
+    def status(self, status: Optional[ResponseStatus]) -> None:
+        self._status = status
+        self.__mark_record_as_modified()
 
     def serialize(self) -> dict[str, Any]:
         """Serializes the Response to a dictionary. This is principally used for sending the response to the API, \
@@ -78,6 +100,10 @@ class Response:
     # Private Interface #
     #####################
 
+    def __mark_record_as_modified(self) -> None:
+        if self.record is not None:
+            self.record._mark_as_modified("responses")
+
 
 class UserResponse(Resource):
     """
@@ -180,7 +206,7 @@ class UserResponse(Resource):
     def __model_as_response_list(model: UserResponseModel) -> List[Response]:
         """Creates a list of Responses from a UserResponseModel"""
         return [
-            Response(question_name=question_name, value=value["value"], user_id=model.user_id)
+            Response(question_name=question_name, value=value["value"], user_id=model.user_id, status=model.status)
             for question_name, value in model.values.items()
         ]
 
@@ -14,12 +14,14 @@
 
 import json
 import os
+import dataclasses
 from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING, Dict, Union, Iterator, Sequence
+from typing import Any, List, Optional, TYPE_CHECKING, Dict, Union, Iterable, Iterator, Sequence
 from uuid import UUID
 
 from argilla_sdk._exceptions import SettingsError, ArgillaAPIError, ArgillaSerializeError
+from argilla_sdk._helpers import DEFAULT_MAX_WORKERS, map_concurrently, trace_span
 from argilla_sdk._models._dataset import DatasetModel
 from argilla_sdk._resource import Resource
 from argilla_sdk.settings._field import TextField
@@ -31,7 +33,28 @@ if TYPE_CHECKING:
     from argilla_sdk.datasets import Dataset
 
 
-__all__ = ["Settings"]
+__all__ = ["Settings", "SettingsChanges"]
+
+
+@dataclasses.dataclass
+class SettingsChanges:
+    """The changes sent to the server by `Settings.update`.
+
+    Attributes:
+        created (List[str]): The names of the properties created on the server.
+        updated (List[str]): The names of the properties updated on the server.
+        unchanged (List[str]): The names of the properties left as they were on the server.
+        dataset_updated (bool): Whether the guidelines, `allow_extra_metadata` or the name of the dataset were updated.
+    """
+
+    created: List[str] = dataclasses.field(default_factory=list)
+    updated: List[str] = dataclasses.field(default_factory=list)
+    unchanged: List[str] = dataclasses.field(default_factory=list)
+    dataset_updated: bool = False
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.created or self.updated or self.dataset_updated)
 
 
 class Settings(Resource):
@@ -72,6 +95,11 @@ class Settings(Resource):
 
         self._dataset = _dataset
 
+        # What the server is known to hold, as of the last `get`, `create` or `update`. `update` diffs against it
+        self.__remote_properties: Optional[Dict[str, dict]] = None
+        self.__remote_dataset_attributes: Optional[Dict[str, Any]] = None
+        self.__last_changes: Optional[SettingsChanges] = None
+
     #####################
     # Properties        #
     #####################
@@ -124,6 +152,11 @@ class Settings(Resource):
     def allow_extra_metadata(self, value: bool):
         self.__allow_extra_metadata = value
 
+    @property
+    def last_changes(self) -> Optional[SettingsChanges]:
+        """The changes sent to the server by the last call to `update`, or None if it was not called."""
+        return self.__last_changes
+
     @property
     def dataset(self) -> "Dataset":
         return self._dataset
@@ -164,11 +197,30 @@ class Settings(Resource):
     #####################
 
     def get(self) -> "Settings":
-        self.fields = self._fetch_fields()
-        self.questions = self._fetch_questions()
-        self.vectors = self._fetch_vectors()
-        self.metadata = self._fetch_metadata()
-        self.__get_dataset_related_attributes()
+        # The properties and the dataset are independent resources, so they are fetched concurrently
+        fetches = [
+            self._fetch_fields,
+            self._fetch_questions,
+            self._fetch_vectors,
+            self._fetch_metadata,
+            self.__fetch_dataset_model,
+        ]
+        fields, questions, vectors, metadata, dataset_model = map_concurrently(lambda fetch: fetch(), fetches)
+
+        self.fields = fields
+        self.questions = questions
+        self.vectors = vectors
+        self.metadata = metadata
+        self.guidelines = dataset_model.guidelines
+        self.allow_extra_metadata = dataset_model.allow_extra_metadata
+
+        self.__remote_properties = {}
+        self.__snapshot_properties([*self.__fields, *self.__vectors, *self.__metadata])
+        self.__remote_dataset_attributes = {
+            "name": dataset_model.name,
+            "guidelines": dataset_model.guidelines,
+            "allow_extra_metadata": dataset_model.allow_extra_metadata,
+        }
 
         self._update_last_api_call()
         return self
@@ -176,23 +228,36 @@ class Settings(Resource):
     def create(self) -> "Settings":
         self.validate()
 
-        self._update_dataset_related_attributes()
-        self.__fields.create()
-        self._create_questions()
-        self.__vectors.create()
-        self.__metadata.create()
+        property_groups = [self.__fields, self.__questions, self.__vectors, self.__metadata]
+        properties = sum(len(group) for group in property_groups)
+        attributes = {"argilla.dataset.name": self._dataset.name, "argilla.settings.properties": properties}
+        with trace_span(self._client.tracer, "Settings.create", attributes):
+            self._update_dataset_related_attributes()
+            self._create_properties(property_groups)
+
+        self.__remote_properties = {}
+        self.__snapshot_properties([*self.__fields, *self.__vectors, *self.__metadata])
 
         self._update_last_api_call()
         return self
 
-    def update(self) -> "Resource":
+    def update(self) -> "Settings":
+        """Sends the changes made to the settings since they were last fetched, created or updated. New fields,
+        vectors and metadata properties are created, modified ones are updated, and the others are not sent.
+        Questions cannot be updated and are left as they are. The changes sent are available in `last_changes`.
+
+        Returns:
+            Settings: The updated settings.
+        """
         self.validate()
 
-        self._update_dataset_related_attributes()
-        self.__fields.update()
-        self.__vectors.update()
-        self.__metadata.update()
-        # self.questions.update()
+        dataset_updated = self.__remote_dataset_attributes != self.__dataset_attributes()
+        if dataset_updated:
+            self._update_dataset_related_attributes()
+
+        changes = self._update_properties([self.__fields, self.__vectors, self.__metadata])
+        changes.dataset_updated = dataset_updated
+        self.__last_changes = changes
 
         self._update_last_api_call()
         return self
@@ -295,7 +360,7 @@ class Settings(Resource):
         models = self._client.api.metadata.list(dataset_id=self._dataset.id)
         return [MetadataField.from_model(model) for model in models]
 
-    def __get_dataset_related_attributes(self):
+    def __fetch_dataset_model(self) -> DatasetModel:
         # This flow may be a bit weird, but it's the only way to update the dataset related attributes
         # Everything is point that we should have several settings-related endpoints in the API to handle this.
         # POST /api/v1/datasets/{dataset_id}/settings
@@ -303,11 +368,8 @@ class Settings(Resource):
         #   "guidelines": ....,
         #   "allow_extra_metadata": ....,
         # }
-        # But this is not implemented yet, so we need to update the dataset model directly
-        dataset_model = self._client.api.datasets.get(self._dataset.id)
-
-        self.guidelines = dataset_model.guidelines
-        self.allow_extra_metadata = dataset_model.allow_extra_metadata
+        # But this is not implemented yet, so we need to read the dataset model directly
+        return self._client.api.datasets.get(self._dataset.id)
 
     def _update_dataset_related_attributes(self):
         # This flow may be a bit weird, but it's the only way to update the dataset related attributes
@@ -325,16 +387,129 @@ class Settings(Resource):
             allow_extra_metadata=self.allow_extra_metadata,
         )
         self._client.api.datasets.update(dataset_model)
+        self.__remote_dataset_attributes = self.__dataset_attributes()
+
+    def _create_properties(
+        self, property_groups: List[Iterable["Property"]], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
+        """Creates the properties of each group one after another in their declared order, which is the order shown
+        in the UI. The first group is created before the others, which are created concurrently, since questions
+        like `SpanQuestion` refer to fields that must exist on the server. When some of them fail, the properties
+        created by this call are deleted again and a single error listing every failed property is raised."""
 
-    def _create_questions(self) -> None:
-        for question in self.__questions:
+        def create_property(prop: "Property") -> Optional[ArgillaAPIError]:
             try:
-                question_model = self._client.api.questions.create(
-                    dataset_id=self._dataset.id, question=question._model
-                )
-                question._model = question_model
+                self._create_property(prop)
             except ArgillaAPIError as e:
-                raise SettingsError(f"Failed to create question {question.name}") from e
+                return e
+
+        def create_group(group: Iterable["Property"]) -> List[Optional[ArgillaAPIError]]:
+            return [create_property(prop) for prop in group]
+
+        if not property_groups:
+            return
+        first_group, *other_groups = property_groups
+        group_errors = [create_group(first_group)]
+        if not any(group_errors[0]):
+            group_errors.extend(map_concurrently(create_group, other_groups, max_workers))
+
+        # The groups after a failed first group are not sent
+        attempted = [prop for group in property_groups[: len(group_errors)] for prop in group]
+        errors = [error for group in group_errors for error in group]
+        failures = [(prop, error) for prop, error in zip(attempted, errors) if error is not None]
+        if not failures:
+            return
+
+        created = [prop for prop, error in zip(attempted, errors) if error is None]
+        map_concurrently(self._rollback_property, created, max_workers=max_workers)
+
+        total = sum(len(list(group)) for group in property_groups)
+        details = "; ".join(f"{prop.name!r}: {error.message}" for prop, error in failures)
+        message = f"Failed to create {len(failures)} of {total} properties. {details}"
+        raise SettingsError(message) from failures[0][1]
+
+    def _create_property(self, prop: "Property") -> None:
+        if isinstance(prop, QuestionPropertyBase):
+            prop._model = self._client.api.questions.create(dataset_id=self._dataset.id, question=prop._model)
+        else:
+            prop.dataset = self._dataset
+            prop.create()
+
+    def _update_properties(
+        self, property_groups: List[Iterable["Property"]], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> SettingsChanges:
+        """Creates the new properties and updates the ones changed since the last snapshot. The groups are sent
+        concurrently, and the properties of each group one after another in their declared order. When some of
+        them fail, a single error listing every failed property is raised."""
+        changes = SettingsChanges()
+        pending_groups = []
+        for group in property_groups:
+            pending = []
+            for prop in group:
+                if prop.id is None:
+                    changes.created.append(prop.name)
+                    pending.append(prop)
+                elif self.__is_changed(prop):
+                    changes.updated.append(prop.name)
+                    pending.append(prop)
+                else:
+                    changes.unchanged.append(prop.name)
+            pending_groups.append(pending)
+
+        def update_property(prop: "Property") -> Optional[ArgillaAPIError]:
+            try:
+                prop.dataset = self._dataset
+                prop.update() if prop.id else prop.create()
+            except ArgillaAPIError as e:
+                return e
+
+        def update_group(group: Iterable["Property"]) -> List[Optional[ArgillaAPIError]]:
+            return [update_property(prop) for prop in group]
+
+        pending = [prop for group in pending_groups for prop in group]
+        errors = [error for group in map_concurrently(update_group, pending_groups, max_workers) for error in group]
+        self.__snapshot_properties([prop for prop, error in zip(pending, errors) if error is None])
+
+        failures = [(prop, error) for prop, error in zip(pending, errors) if error is not None]
+        if failures:
+            details = "; ".join(f"{prop.name!r}: {error.message}" for prop, error in failures)
+            message = f"Failed to update {len(failures)} of {len(pending)} properties. {details}"
+            raise SettingsError(message) from failures[0][1]
+
+        return changes
+
+    def __is_changed(self, prop: "Property") -> bool:
+        if self.__remote_properties is None:
+            # Nothing is known about the server, so every property is sent
+            return True
+        return self.__remote_properties.get(prop.name) != self.__property_state(prop)
+
+    def __snapshot_properties(self, properties: List["Property"]) -> None:
+        if self.__remote_properties is None:
+            self.__remote_properties = {}
+        for prop in properties:
+            self.__remote_properties[prop.name] = self.__property_state(prop)
+
+    @staticmethod
+    def __property_state(prop: "Property") -> dict:
+        return prop.api_model().model_dump(warnings=False)
+
+    def __dataset_attributes(self) -> Dict[str, Any]:
+        return {
+            "name": self._dataset.name,
+            "guidelines": self.guidelines,
+            "allow_extra_metadata": self.allow_extra_metadata,
+        }
+
+    def _rollback_property(self, prop: "Property") -> None:
+        try:
+            if isinstance(prop, QuestionPropertyBase):
+                self._client.api.questions.delete(prop.id)
+            else:
+                prop.delete()
+            prop.id = None
+        except ArgillaAPIError as e:
+            self._log_message(f"Failed to roll back the creation of {prop.name!r}: {e.message}", level="warning")
 
     def _validate_empty_settings(self):
         if not all([self.fields, self.questions]):
@@ -410,20 +585,10 @@ class SettingsProperties(Sequence[Property]):
         return property
 
     def create(self):
-        for property in self:
-            try:
-                property.dataset = self._settings.dataset
-                property.create()
-            except ArgillaAPIError as e:
-                raise SettingsError(f"Failed to create property {property.name!r}: {e.message}") from e
+        self._settings._create_properties([list(self)])
 
-    def update(self):
-        for item in self:
-            try:
-                item.dataset = self._settings.dataset
-                item.update() if item.id else item.create()
-            except ArgillaAPIError as e:
-                raise SettingsError(f"Failed to update {item.name!r}: {e.message}") from e
+    def update(self) -> "SettingsChanges":
+        return self._settings._update_properties([list(self)])
 
     def serialize(self) -> List[dict]:
         return [property.serialize() for property in self]
@@ -78,6 +78,11 @@ class Suggestion(Resource):
         """The value of the suggestion."""
         return self._model.value
 
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._model.value = value
+        self.__mark_record_as_modified()
+
     @property
     def question_name(self) -> Optional[str]:
         """The name of the question that the suggestion is for."""
@@ -109,6 +114,7 @@ class Suggestion(Resource):
     @score.setter
     def score(self, value: float) -> None:
         self._model.score = value
+        self.__mark_record_as_modified()
 
     @property
     def agent(self) -> Optional[str]:
@@ -118,6 +124,7 @@ class Suggestion(Resource):
     @agent.setter
     def agent(self, value: str) -> None:
         self._model.agent = value
+        self.__mark_record_as_modified()
 
     @classmethod
     def from_model(cls, model: SuggestionModel, dataset: "Dataset") -> "Suggestion":
@@ -142,6 +149,10 @@ class Suggestion(Resource):
             id=self._model.id,
         )
 
+    def __mark_record_as_modified(self) -> None:
+        if self.record is not None:
+            self.record._mark_as_modified("suggestions")
+
     @classmethod
     def __to_model_value(cls, value: Any, question: "QuestionType") -> Any:
         if isinstance(question, RankingQuestion):
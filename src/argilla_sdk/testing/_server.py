@@ -0,0 +1,599 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import re
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import httpx
+
+from argilla_sdk.client import Argilla
+
+__all__ = ["FakeArgillaServer"]
+
+_ID = r"(?P<{}>[^/]+)"
+
+
+class FakeArgillaServer:
+    """An in-memory implementation of the subset of the Argilla API used by the SDK, for offline development
+    and tests. Requests are served through an `httpx.MockTransport`, so no network or search engine is needed.
+
+    The server starts with an owner user, which is the current user, and a workspace named "argilla":
+
+    ```python
+    from argilla_sdk.testing import FakeArgillaServer
+
+    server = FakeArgillaServer()
+    client = rg.Argilla(api_url=server.api_url, transport=server.transport)
+    ```
+
+    Records support bulk upserts by server id or external id, listing with includes and sorting, and search
+    with text queries and terms or range filters over metadata, suggestions and responses.
+
+    Attributes:
+        api_url (str): The URL to use in the clients of the server.
+        user (Dict[str, Any]): The current user.
+        workspace (Dict[str, Any]): The default workspace.
+    """
+
+    api_url = "http://argilla.fake"
+
+    def __init__(self):
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.workspaces: Dict[str, Dict[str, Any]] = {}
+        self.workspace_users: Dict[str, List[str]] = {}
+        self.datasets: Dict[str, Dict[str, Any]] = {}
+        self.settings: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self.records: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.external_ids: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.RLock()
+
+        self.user = self._new_resource({"username": "argilla", "role": "owner", "first_name": "Argilla"})
+        self.users[self.user["id"]] = self.user
+        self.workspace = self._new_resource({"name": "argilla"})
+        self.workspaces[self.workspace["id"]] = self.workspace
+        self.workspace_users[self.workspace["id"]] = [self.user["id"]]
+
+        routes = [
+            # Users
+            ("GET", r"/api/me", self._get_me),
+            ("GET", r"/api/users", self._list_users),
+            ("POST", r"/api/users", self._create_user),
+            ("GET", r"/api/v1/users/{user_id}", self._get_user),
+            ("DELETE", r"/api/users/{user_id}", self._delete_user),
+            ("GET", r"/api/workspaces/{workspace_id}/users", self._list_workspace_users),
+            ("POST", r"/api/(v1/)?workspaces/{workspace_id}/users/{user_id}", self._add_workspace_user),
+            ("DELETE", r"/api/(v1/)?workspaces/{workspace_id}/users/{user_id}", self._remove_workspace_user),
+            # Workspaces
+            ("GET", r"/api/v1/me/workspaces", self._list_workspaces),
+            ("GET", r"/api/v1/users/{user_id}/workspaces", self._list_user_workspaces),
+            ("POST", r"/api/workspaces", self._create_workspace),
+            ("GET", r"/api/v1/workspaces/{workspace_id}", self._get_workspace),
+            ("DELETE", r"/api/v1/workspaces/{workspace_id}", self._delete_workspace),
+            # Datasets and settings
+            ("GET", r"/api/v1/me/datasets", self._list_datasets),
+            ("POST", r"/api/v1/datasets", self._create_dataset),
+            ("GET", r"/api/v1/datasets/{dataset_id}", self._get_dataset),
+            ("PATCH", r"/api/v1/datasets/{dataset_id}", self._update_dataset),
+            ("DELETE", r"/api/v1/datasets/{dataset_id}", self._delete_dataset),
+            ("PUT", r"/api/v1/datasets/{dataset_id}/publish", self._publish_dataset),
+            (
+                "POST",
+                r"/api/v1/datasets/{dataset_id}/(?P<kind>fields|questions|vectors-settings)",
+                self._create_property,
+            ),
+            (
+                "GET",
+                r"/api/v1/datasets/{dataset_id}/(?P<kind>fields|questions|vectors-settings)",
+                self._list_properties,
+            ),
+            ("POST", r"/api/v1/datasets/{dataset_id}/(?P<kind>metadata-properties)", self._create_property),
+            ("GET", r"/api/v1/me/datasets/{dataset_id}/(?P<kind>metadata-properties)", self._list_properties),
+            (
+                "PATCH",
+                r"/api/v1/(?P<kind>fields|vectors-settings|metadata-properties)/{property_id}",
+                self._update_property,
+            ),
+            (
+                "DELETE",
+                r"/api/v1/(?P<kind>fields|questions|vectors-settings|metadata-properties)/{property_id}",
+                self._delete_property,
+            ),
+            # Records
+            ("GET", r"/api/v1/datasets/{dataset_id}/records", self._list_records),
+            ("POST", r"/api/v1/datasets/{dataset_id}/records", self._create_records),
+            ("PATCH", r"/api/v1/datasets/{dataset_id}/records", self._update_records),
+            ("DELETE", r"/api/v1/datasets/{dataset_id}/records", self._delete_records),
+            ("POST", r"/api/v1/datasets/{dataset_id}/records/bulk", self._bulk_create_records),
+            ("PUT", r"/api/v1/datasets/{dataset_id}/records/bulk", self._bulk_upsert_records),
+            ("POST", r"/api/v1/datasets/{dataset_id}/records/search", self._search_records),
+            ("GET", r"/api/v1/records/{record_id}", self._get_record),
+            ("PATCH", r"/api/v1/records/{record_id}", self._update_record),
+            ("DELETE", r"/api/v1/records/{record_id}", self._delete_record),
+            # Responses
+            ("POST", r"/api/v1/records/{record_id}/responses", self._create_response),
+            ("POST", r"/api/v1/me/responses/bulk", self._bulk_create_responses),
+        ]
+        self._routes: List[Tuple[str, re.Pattern, Callable]] = [
+            (method, re.compile("^" + self._route_pattern(path) + "$"), handler) for method, path, handler in routes
+        ]
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        """A transport serving the requests of an `httpx` client from the server."""
+        return httpx.MockTransport(self.handle)
+
+    def client(self, **http_client_args) -> Argilla:
+        """Creates an Argilla client connected to the server. The client becomes the default client, so create
+        it before the resources and settings that should use it."""
+        http_client_args.setdefault("transport", self.transport)
+        return Argilla(api_url=self.api_url, api_key="argilla.apikey", **http_client_args)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Serves a request, returning a 404 response for the paths and methods that are not implemented."""
+        for method, pattern, handler in self._routes:
+            match = pattern.match(request.url.path)
+            if method == request.method and match:
+                with self._lock:
+                    return handler(request, **match.groupdict())
+        return self._error(404, f"No route for {request.method} {request.url.path}")
+
+    ############################
+    # Users
+    ############################
+
+    def _get_me(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=self.user)
+
+    def _list_users(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=list(self.users.values()))
+
+    def _create_user(self, request: httpx.Request) -> httpx.Response:
+        body = self._json(request)
+        if any(user["username"] == body["username"] for user in self.users.values()):
+            return self._error(409, f"User {body['username']} already exists")
+        body.pop("password", None)
+        user = self._new_resource({"role": "annotator", **body})
+        self.users[user["id"]] = user
+        return httpx.Response(201, json=user)
+
+    def _get_user(self, request: httpx.Request, user_id: str) -> httpx.Response:
+        if user_id not in self.users:
+            return self._error(404, f"User {user_id} not found")
+        return httpx.Response(200, json=self.users[user_id])
+
+    def _delete_user(self, request: httpx.Request, user_id: str) -> httpx.Response:
+        if user_id not in self.users:
+            return self._error(404, f"User {user_id} not found")
+        for user_ids in self.workspace_users.values():
+            if user_id in user_ids:
+                user_ids.remove(user_id)
+        return httpx.Response(200, json=self.users.pop(user_id))
+
+    def _list_workspace_users(self, request: httpx.Request, workspace_id: str) -> httpx.Response:
+        if workspace_id not in self.workspaces:
+            return self._error(404, f"Workspace {workspace_id} not found")
+        return httpx.Response(200, json=[self.users[user_id] for user_id in self.workspace_users[workspace_id]])
+
+    def _add_workspace_user(self, request: httpx.Request, workspace_id: str, user_id: str) -> httpx.Response:
+        if workspace_id not in self.workspaces or user_id not in self.users:
+            return self._error(404, f"Workspace {workspace_id} or user {user_id} not found")
+        if user_id in self.workspace_users[workspace_id]:
+            return self._error(409, f"User {user_id} already belongs to workspace {workspace_id}")
+        self.workspace_users[workspace_id].append(user_id)
+        return httpx.Response(200, json=self.users[user_id])
+
+    def _remove_workspace_user(self, request: httpx.Request, workspace_id: str, user_id: str) -> httpx.Response:
+        if workspace_id not in self.workspaces or user_id not in self.workspace_users[workspace_id]:
+            return self._error(404, f"User {user_id} not found in workspace {workspace_id}")
+        self.workspace_users[workspace_id].remove(user_id)
+        return httpx.Response(200, json=self.users[user_id])
+
+    ############################
+    # Workspaces
+    ############################
+
+    def _list_workspaces(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"items": list(self.workspaces.values())})
+
+    def _list_user_workspaces(self, request: httpx.Request, user_id: str) -> httpx.Response:
+        if user_id not in self.users:
+            return self._error(404, f"User {user_id} not found")
+        workspaces = [self.workspaces[ws_id] for ws_id, user_ids in self.workspace_users.items() if user_id in user_ids]
+        return httpx.Response(200, json={"items": workspaces})
+
+    def _create_workspace(self, request: httpx.Request) -> httpx.Response:
+        body = self._json(request)
+        if any(workspace["name"] == body["name"] for workspace in self.workspaces.values()):
+            return self._error(409, f"Workspace {body['name']} already exists")
+        workspace = self._new_resource({"name": body["name"]})
+        self.workspaces[workspace["id"]] = workspace
+        self.workspace_users[workspace["id"]] = []
+        return httpx.Response(200, json=workspace)
+
+    def _get_workspace(self, request: httpx.Request, workspace_id: str) -> httpx.Response:
+        if workspace_id not in self.workspaces:
+            return self._error(404, f"Workspace {workspace_id} not found")
+        return httpx.Response(200, json=self.workspaces[workspace_id])
+
+    def _delete_workspace(self, request: httpx.Request, workspace_id: str) -> httpx.Response:
+        if workspace_id not in self.workspaces:
+            return self._error(404, f"Workspace {workspace_id} not found")
+        if any(dataset["workspace_id"] == workspace_id for dataset in self.datasets.values()):
+            return self._error(409, f"Workspace {workspace_id} has datasets")
+        self.workspace_users.pop(workspace_id)
+        return httpx.Response(200, json=self.workspaces.pop(workspace_id))
+
+    ############################
+    # Datasets and settings
+    ############################
+
+    def _list_datasets(self, request: httpx.Request) -> httpx.Response:
+        datasets = list(self.datasets.values())
+        workspace_id = request.url.params.get("workspace_id")
+        if workspace_id:
+            datasets = [dataset for dataset in datasets if dataset["workspace_id"] == workspace_id]
+        return httpx.Response(200, json={"items": datasets})
+
+    def _create_dataset(self, request: httpx.Request) -> httpx.Response:
+        body = self._json(request)
+        if body.get("workspace_id") not in self.workspaces:
+            return self._error(422, f"Workspace {body.get('workspace_id')} not found")
+        for dataset in self.datasets.values():
+            if dataset["name"] == body["name"] and dataset["workspace_id"] == body["workspace_id"]:
+                return self._error(409, f"Dataset {body['name']} already exists")
+        dataset = self._new_resource({**body, "status": "draft"})
+        self.datasets[dataset["id"]] = dataset
+        self.settings[dataset["id"]] = {kind: [] for kind in self._PROPERTY_KINDS}
+        self.records[dataset["id"]] = {}
+        self.external_ids[dataset["id"]] = {}
+        return httpx.Response(201, json=dataset)
+
+    def _get_dataset(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        return httpx.Response(200, json=self.datasets[dataset_id])
+
+    def _update_dataset(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        body = self._json(request)
+        dataset = self.datasets[dataset_id]
+        dataset.update({key: body[key] for key in ["name", "guidelines", "allow_extra_metadata"] if key in body})
+        dataset["updated_at"] = self._now()
+        return httpx.Response(200, json=dataset)
+
+    def _delete_dataset(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        self.settings.pop(dataset_id)
+        self.records.pop(dataset_id)
+        self.external_ids.pop(dataset_id)
+        return httpx.Response(200, json=self.datasets.pop(dataset_id))
+
+    def _publish_dataset(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        settings = self.settings[dataset_id]
+        if not settings["fields"] or not settings["questions"]:
+            return self._error(422, "Datasets need at least one field and one question to be published")
+        self.datasets[dataset_id]["status"] = "ready"
+        return httpx.Response(200, json=self.datasets[dataset_id])
+
+    _PROPERTY_KINDS = ["fields", "questions", "vectors-settings", "metadata-properties"]
+
+    def _create_property(self, request: httpx.Request, dataset_id: str, kind: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        body = self._json(request)
+        properties = self.settings[dataset_id][kind]
+        if any(existing["name"] == body["name"] for existing in properties):
+            return self._error(409, f"Property {body['name']} already exists")
+        created = self._new_resource({**body, "dataset_id": dataset_id})
+        properties.append(created)
+        return httpx.Response(201, json=created)
+
+    def _list_properties(self, request: httpx.Request, dataset_id: str, kind: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        return httpx.Response(200, json={"items": self.settings[dataset_id][kind]})
+
+    def _update_property(self, request: httpx.Request, kind: str, property_id: str) -> httpx.Response:
+        dataset_property = self._find_property(kind, property_id)
+        if dataset_property is None:
+            return self._error(404, f"Property {property_id} not found")
+        body = self._json(request)
+        dataset_property.update(
+            {key: body[key] for key in ["title", "settings", "visible_for_annotators"] if key in body}
+        )
+        dataset_property["updated_at"] = self._now()
+        return httpx.Response(200, json=dataset_property)
+
+    def _delete_property(self, request: httpx.Request, kind: str, property_id: str) -> httpx.Response:
+        dataset_property = self._find_property(kind, property_id)
+        if dataset_property is None:
+            return self._error(404, f"Property {property_id} not found")
+        self.settings[dataset_property["dataset_id"]][kind].remove(dataset_property)
+        return httpx.Response(200, json=dataset_property)
+
+    def _find_property(self, kind: str, property_id: str) -> Optional[Dict[str, Any]]:
+        for settings in self.settings.values():
+            for dataset_property in settings[kind]:
+                if dataset_property["id"] == property_id:
+                    return dataset_property
+
+    ############################
+    # Records
+    ############################
+
+    def _list_records(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        records = self._sorted_records(dataset_id, request.url.params.get_list("sort_by"))
+        page = self._page(request, records)
+        include = request.url.params.get_list("include")
+        return httpx.Response(200, json={"items": [self._record_response(record, include) for record in page]})
+
+    def _create_records(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        response = self._bulk_create_records(request, dataset_id)
+        return response if response.is_error else httpx.Response(204)
+
+    def _update_records(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        items = self._json(request)["items"]
+        if any(item.get("id") not in self.records[dataset_id] for item in items):
+            return self._error(422, "Records to update must exist in the dataset")
+        for item in items:
+            self._upsert_record(dataset_id, item)
+        return httpx.Response(204)
+
+    def _delete_records(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        for record_id in request.url.params.get("ids", "").split(","):
+            self._remove_record(dataset_id, record_id)
+        return httpx.Response(204)
+
+    def _bulk_create_records(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        items = self._json(request)["items"]
+        external_ids = self.external_ids[dataset_id]
+        if any(str(item.get("external_id")) in external_ids for item in items if item.get("external_id") is not None):
+            return self._error(422, "Records with the same external id already exist in the dataset")
+        records = [
+            self._upsert_record(dataset_id, {key: value for key, value in item.items() if key != "id"})[0]
+            for item in items
+        ]
+        return httpx.Response(201, json={"items": records})
+
+    def _bulk_upsert_records(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        items, updated_ids = [], []
+        for item in self._json(request)["items"]:
+            record, updated = self._upsert_record(dataset_id, item)
+            if updated:
+                updated_ids.append(record["id"])
+            items.append(record)
+        return httpx.Response(200, json={"items": items, "updated_item_ids": updated_ids})
+
+    def _search_records(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        if dataset_id not in self.datasets:
+            return self._error(404, f"Dataset {dataset_id} not found")
+        body = self._json(request)
+        records = self._sorted_records(dataset_id, request.url.params.get_list("sort_by"))
+        text_query = (body.get("query") or {}).get("text")
+        if text_query:
+            records = [record for record in records if self._matches_text(record, text_query)]
+        filters = (body.get("filters") or {}).get("and", [])
+        records = [record for record in records if all(self._matches_filter(record, f) for f in filters)]
+        page = self._page(request, records)
+        include = request.url.params.get_list("include")
+        items = [{"record": self._record_response(record, include), "query_score": 1.0} for record in page]
+        return httpx.Response(200, json={"items": items, "total": len(records)})
+
+    def _get_record(self, request: httpx.Request, record_id: str) -> httpx.Response:
+        record = self._find_record(record_id)
+        if record is None:
+            return self._error(404, f"Record {record_id} not found")
+        return httpx.Response(200, json=record)
+
+    def _update_record(self, request: httpx.Request, record_id: str) -> httpx.Response:
+        record = self._find_record(record_id)
+        if record is None:
+            return self._error(404, f"Record {record_id} not found")
+        record, _ = self._upsert_record(record["dataset_id"], {**self._json(request), "id": record_id})
+        return httpx.Response(200, json=record)
+
+    def _delete_record(self, request: httpx.Request, record_id: str) -> httpx.Response:
+        record = self._find_record(record_id)
+        if record is None:
+            return self._error(404, f"Record {record_id} not found")
+        self._remove_record(record["dataset_id"], record_id)
+        return httpx.Response(200, json=record)
+
+    def _upsert_record(self, dataset_id: str, item: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Updates the record with the id or the external id of the item, or creates a new record. Only the
+        attributes in the item are updated, so partial items leave the other attributes untouched."""
+        records = self.records[dataset_id]
+        external_ids = self.external_ids[dataset_id]
+        record_id = item.get("id") or external_ids.get(str(item.get("external_id")))
+
+        updated = record_id in records
+        if updated:
+            record = records[record_id]
+            record.update({key: value for key, value in item.items() if key != "id" and value is not None})
+            record["updated_at"] = self._now()
+        else:
+            record = self._new_resource(
+                {
+                    **{key: value for key, value in item.items() if value is not None},
+                    "dataset_id": dataset_id,
+                    "fields": item.get("fields") or {},
+                    "metadata": item.get("metadata") or {},
+                    "vectors": item.get("vectors") or {},
+                    "suggestions": item.get("suggestions") or [],
+                    "responses": item.get("responses") or [],
+                }
+            )
+            records[record["id"]] = record
+        if record.get("external_id") is not None:
+            external_ids[str(record["external_id"])] = record["id"]
+        for suggestion in record["suggestions"]:
+            suggestion["id"] = suggestion.get("id") or str(uuid4())
+        for response in record["responses"]:
+            response["user_id"] = response.get("user_id") or self.user["id"]
+        return record, updated
+
+    def _remove_record(self, dataset_id: str, record_id: str) -> None:
+        record = self.records[dataset_id].pop(record_id, None)
+        if record is not None and record.get("external_id") is not None:
+            self.external_ids[dataset_id].pop(str(record["external_id"]), None)
+
+    def _find_record(self, record_id: str) -> Optional[Dict[str, Any]]:
+        for records in self.records.values():
+            if record_id in records:
+                return records[record_id]
+
+    ############################
+    # Responses
+    ############################
+
+    def _create_response(self, request: httpx.Request, record_id: str) -> httpx.Response:
+        record = self._find_record(record_id)
+        if record is None:
+            return self._error(404, f"Record {record_id} not found")
+        response = self._set_response(record, self._json(request))
+        return httpx.Response(201, json=response)
+
+    def _bulk_create_responses(self, request: httpx.Request) -> httpx.Response:
+        items = []
+        for item in self._json(request)["items"]:
+            record = self._find_record(item.pop("record_id"))
+            if record is None:
+                items.append({"item": None, "error": {"detail": "Record not found"}})
+            else:
+                items.append({"item": self._set_response(record, item), "error": None})
+        return httpx.Response(200, json={"items": items})
+
+    def _set_response(self, record: Dict[str, Any], response: Dict[str, Any]) -> Dict[str, Any]:
+        """Creates or replaces the response of the user in the record"""
+        response = self._new_resource({**response, "user_id": response.get("user_id") or self.user["id"]})
+        record["responses"] = [r for r in record["responses"] if r["user_id"] != response["user_id"]] + [response]
+        return response
+
+    ############################
+    # Search helpers
+    ############################
+
+    def _sorted_records(self, dataset_id: str, sort_by: List[str]) -> List[Dict[str, Any]]:
+        records = list(self.records[dataset_id].values())
+        for criteria in reversed(sort_by):
+            key, _, order = criteria.partition(":")
+            records.sort(key=lambda record: record.get(key) or "", reverse=order == "desc")
+        return records
+
+    @staticmethod
+    def _page(request: httpx.Request, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        offset = int(request.url.params.get("offset", 0))
+        limit = int(request.url.params.get("limit", 50))
+        return records[offset : offset + limit]
+
+    @staticmethod
+    def _matches_text(record: Dict[str, Any], text_query: Dict[str, Any]) -> bool:
+        fields = record["fields"]
+        values = [fields.get(text_query["field"])] if text_query.get("field") else fields.values()
+        text = " ".join(str(value) for value in values if value is not None).lower()
+        return all(term in text for term in text_query["q"].lower().split())
+
+    def _matches_filter(self, record: Dict[str, Any], record_filter: Dict[str, Any]) -> bool:
+        values = self._scope_values(record, record_filter["scope"])
+        if record_filter["type"] == "terms":
+            return any(str(value) in record_filter["values"] for value in values)
+        lower, upper = record_filter.get("ge"), record_filter.get("le")
+        for value in values:
+            try:
+                if (lower is None or value >= lower) and (upper is None or value <= upper):
+                    return True
+            except TypeError:
+                continue
+        return False
+
+    def _scope_values(self, record: Dict[str, Any], scope: Dict[str, Any]) -> List[Any]:
+        if scope["entity"] == "metadata":
+            values = [record["metadata"].get(scope["metadata_property"])]
+        elif scope["entity"] == "suggestion":
+            question_ids = {
+                q["id"] for q in self.settings[record["dataset_id"]]["questions"] if q["name"] == scope["question"]
+            }
+            values = [
+                suggestion.get(scope.get("property") or "value")
+                for suggestion in record["suggestions"]
+                if suggestion.get("question_name") == scope["question"] or suggestion.get("question_id") in question_ids
+            ]
+        elif scope.get("property") == "status":
+            values = [response["status"] for response in record["responses"]] or ["pending"]
+        else:
+            values = [
+                response["values"][scope["question"]]["value"]
+                for response in record["responses"]
+                if scope["question"] in (response.get("values") or {})
+            ]
+        flattened = []
+        for value in values:
+            flattened.extend(value if isinstance(value, list) else [value])
+        return [value for value in flattened if value is not None]
+
+    @staticmethod
+    def _record_response(record: Dict[str, Any], include: List[str]) -> Dict[str, Any]:
+        response = {key: value for key, value in record.items() if key not in ["suggestions", "responses", "vectors"]}
+        for attribute in ["suggestions", "responses"]:
+            if attribute in include:
+                response[attribute] = record[attribute]
+        for value in include:
+            if value == "vectors":
+                response["vectors"] = record["vectors"]
+            elif value.startswith("vectors:"):
+                names = value.split(":", 1)[1].split(",")
+                response["vectors"] = {name: record["vectors"][name] for name in names if name in record["vectors"]}
+        return response
+
+    ############################
+    # Helpers
+    ############################
+
+    @staticmethod
+    def _route_pattern(path: str) -> str:
+        return re.sub(r"\{(\w+)\}", lambda match: _ID.format(match.group(1)), path)
+
+    @staticmethod
+    def _json(request: httpx.Request) -> Dict[str, Any]:
+        return json.loads(request.content) if request.content else {}
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.utcnow().isoformat()
+
+    def _new_resource(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        now = self._now()
+        return {**body, "id": str(uuid4()), "inserted_at": now, "updated_at": now}
+
+    @staticmethod
+    def _error(status_code: int, detail: str) -> httpx.Response:
+        return httpx.Response(status_code, json={"detail": detail})
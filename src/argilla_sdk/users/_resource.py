@@ -37,6 +37,7 @@ class User(Resource):
 
     _model: UserModel
     _api: UsersAPI
+    _collection_name = "users"
 
     def __init__(
         self,
@@ -90,6 +91,7 @@ class User(Resource):
         # The password is not returned in the response
         model.password = model_create.password
         self._model = model
+        self._invalidate_collection()
         return self
 
     def delete(self) -> None:
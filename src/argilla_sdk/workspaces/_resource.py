@@ -39,6 +39,7 @@ class Workspace(Resource):
     name: Optional[str]
 
     _api: "WorkspacesAPI"
+    _collection_name = "workspaces"
 
     def __init__(
         self,
@@ -0,0 +1,156 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import pickle
+
+import httpx
+import pytest
+
+import argilla_sdk as rg
+from argilla_sdk._api import CachingTransport
+from argilla_sdk._api._http._cache import _reset_transports_after_fork
+from argilla_sdk.testing import FakeArgillaServer
+
+
+@pytest.fixture
+def server(mocker) -> FakeArgillaServer:
+    server = FakeArgillaServer()
+    mocker.spy(server, "handle")
+    return server
+
+
+def _requests(server: FakeArgillaServer) -> list:
+    return [(call.args[0].method, call.args[0].url.path) for call in server.handle.call_args_list]
+
+
+class TestCachingTransport:
+    def test_serve_settings_from_the_cache(self, server: FakeArgillaServer):
+        client = server.client(transport=CachingTransport(server.transport))
+        settings = rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="comment")])
+        dataset = rg.Dataset(name="reviews", workspace="argilla", settings=settings, client=client).create()
+
+        rg.Settings(_dataset=dataset).get()
+        server.handle.reset_mock()
+        fetched = rg.Settings(_dataset=dataset).get()
+
+        assert _requests(server) == []
+        assert [field.name for field in fetched.fields] == ["text"]
+
+    def test_writes_discard_the_cached_responses(self, server: FakeArgillaServer):
+        client = server.client(transport=CachingTransport(server.transport))
+
+        assert [workspace.name for workspace in client.api.workspaces.list()] == ["argilla"]
+        rg.Workspace(name="team", client=client).create()
+
+        assert sorted(workspace.name for workspace in client.api.workspaces.list()) == ["argilla", "team"]
+
+    def test_records_are_not_cached(self, server: FakeArgillaServer):
+        transport = CachingTransport(server.transport)
+        client = server.client(transport=transport)
+        settings = rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="comment")])
+        dataset = rg.Dataset(name="reviews", workspace="argilla", settings=settings, client=client).create()
+        transport.clear()
+
+        dataset.records.log(records=[{"text": "a great movie"}])
+        dataset.records.log(records=[{"text": "a terrible movie"}])
+
+        assert len(list(dataset.records)) == 2
+        assert not any("records" in key for key in transport._entries)
+
+    def test_expired_responses_are_revalidated_with_etag(self, mocker):
+        handler = mocker.Mock(
+            side_effect=[
+                httpx.Response(200, json={"items": []}, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+        transport = CachingTransport(httpx.MockTransport(handler), ttl=0)
+
+        with httpx.Client(base_url="http://argilla.fake", transport=transport) as client:
+            first = client.get("/api/v1/me/workspaces")
+            second = client.get("/api/v1/me/workspaces")
+
+        assert first.json() == second.json() == {"items": []}
+        assert handler.call_args_list[1].args[0].headers["If-None-Match"] == '"v1"'
+
+    def test_evict_least_recently_used_responses(self, mocker):
+        handler = mocker.Mock(side_effect=lambda request: httpx.Response(200, json={"path": request.url.path}))
+        transport = CachingTransport(httpx.MockTransport(handler), max_entries=2)
+
+        with httpx.Client(base_url="http://argilla.fake", transport=transport) as client:
+            for path in ["/api/v1/datasets/1", "/api/v1/datasets/2", "/api/v1/datasets/1", "/api/v1/datasets/3"]:
+                client.get(path)
+            client.get("/api/v1/datasets/1")
+            client.get("/api/v1/datasets/2")
+
+        paths = [call.args[0].url.path for call in handler.call_args_list]
+        assert paths == ["/api/v1/datasets/1", "/api/v1/datasets/2", "/api/v1/datasets/3", "/api/v1/datasets/2"]
+
+    def test_cache_responses_by_api_key(self, mocker):
+        handler = mocker.Mock(
+            side_effect=lambda request: httpx.Response(200, json={"api_key": request.headers["X-Argilla-Api-Key"]})
+        )
+        transport = CachingTransport(httpx.MockTransport(handler))
+
+        clients = {
+            api_key: httpx.Client(
+                base_url="http://argilla.fake", transport=transport, headers={"X-Argilla-Api-Key": api_key}
+            )
+            for api_key in ["owner.apikey", "annotator.apikey"]
+        }
+        responses = [
+            clients[api_key].get("/api/v1/me/workspaces").json()["api_key"]
+            for api_key in ["owner.apikey", "annotator.apikey", "owner.apikey"]
+        ]
+
+        assert responses == ["owner.apikey", "annotator.apikey", "owner.apikey"]
+        assert handler.call_count == 2
+        assert not any("apikey" in key for key in transport._entries)
+
+    def test_unknown_resource_ttls_are_rejected(self):
+        with pytest.raises(ValueError, match="Unknown cached resources"):
+            CachingTransport(ttls={"records": 10})
+
+    def test_pickle_transport_with_an_empty_cache(self, server: FakeArgillaServer):
+        transport = CachingTransport(server.transport, ttl=10, ttls={"datasets": 5}, max_entries=8)
+        client = server.client(transport=transport)
+        client.api.workspaces.list()
+
+        unpickled = pickle.loads(pickle.dumps(transport))
+
+        assert len(transport) == 1
+        assert len(unpickled) == 0
+        assert (unpickled.ttl, unpickled.ttls, unpickled.max_entries) == (10, {"datasets": 5}, 8)
+        assert isinstance(unpickled._inner_transport(), httpx.HTTPTransport)
+
+    def test_pickle_transport_with_a_transport_function(self, server: FakeArgillaServer):
+        transport = CachingTransport(functools.partial(httpx.HTTPTransport, retries=3))
+
+        unpickled = pickle.loads(pickle.dumps(transport))
+
+        assert unpickled._inner_transport()._pool._retries == 3
+
+    def test_reset_transports_after_fork(self, server: FakeArgillaServer):
+        transport = CachingTransport(lambda: server.transport)
+        client = server.client(transport=transport)
+        client.api.workspaces.list()
+        inner_transport = transport._inner_transport()
+
+        _reset_transports_after_fork()
+
+        assert len(transport) == 0
+        assert transport._transport is None
+        assert [workspace.name for workspace in client.api.workspaces.list()] == ["argilla"]
+        assert transport._inner_transport() is not inner_transport
@@ -12,9 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
 from httpx import Timeout
 
 from argilla_sdk import Argilla
+from argilla_sdk._api import CachingTransport
+from argilla_sdk._api._client import _reset_clients_after_fork
+from argilla_sdk.testing import FakeArgillaServer
 
 
 class TestHTTPClient:
@@ -62,3 +73,138 @@ class TestHTTPClient:
         assert http_client.base_url == "http://localhost:6900"
         assert http_client.headers["X-Argilla-Api-Key"] == "argilla.apikey"
         assert http_client.cookies["session"] == "session_id"
+
+
+class TestClientConcurrency:
+    def test_reuse_http_client(self):
+        client = Argilla(api_url="http://localhost:8000")
+
+        assert client.http_client is client.http_client
+        assert client.api is client.api
+        assert client.api.records.http_client is client.http_client
+
+    def test_reuse_http_client_across_threads(self):
+        client = Argilla(api_url="http://localhost:8000")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            http_clients = list(executor.map(lambda _: client.http_client, range(8)))
+
+        assert all(http_client is http_clients[0] for http_client in http_clients)
+
+    def test_reset_http_client_after_fork(self):
+        client = Argilla(api_url="http://localhost:8000")
+        records_api = client.api.records
+        http_client = client.http_client
+
+        _reset_clients_after_fork()
+
+        assert not isinstance(records_api.http_client, httpx.Client)
+        assert client.http_client is not http_client
+        assert client.api.records is records_api
+        assert records_api.http_client is client.http_client
+
+    def test_open_http_client_on_first_request_after_fork(self, mocker):
+        server = FakeArgillaServer()
+        client = server.client(transport=lambda: server.transport)
+        records_api = client.api.records
+        create_http_client = mocker.spy(client, "_create_http_client")
+
+        _reset_clients_after_fork()
+        assert create_http_client.call_count == 0
+
+        assert records_api.http_client.get("/api/me").status_code == 200
+        assert create_http_client.call_count == 1
+        assert isinstance(records_api.http_client, httpx.Client)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+    def test_use_new_http_client_in_forked_process(self):
+        client = Argilla(api_url="http://localhost:8000")
+        parent_http_client = client.http_client
+
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if client.api.records.http_client is not parent_http_client else 1)
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert client.http_client is parent_http_client
+
+    def test_close_client(self):
+        client = Argilla(api_url="http://localhost:8000")
+        http_client = client.http_client
+
+        with client:
+            pass
+
+        assert http_client.is_closed
+        assert not client.http_client.is_closed
+
+    def test_pickle_client(self):
+        client = Argilla(api_url="http://localhost:8000", api_key="my.apikey", timeout=30, coalesce_requests=True)
+        client.http_client
+
+        unpickled_client = pickle.loads(pickle.dumps(client))
+
+        assert unpickled_client.api_url == "http://localhost:8000"
+        assert unpickled_client.http_client is not client.http_client
+        assert unpickled_client.http_client.timeout == Timeout(30)
+        assert unpickled_client.http_client.headers["X-Argilla-Api-Key"] == "my.apikey"
+        assert unpickled_client.api.records._single_flight is not None
+
+    def test_pickle_client_with_a_transport(self):
+        client = Argilla(api_url="http://localhost:8000", transport=httpx.HTTPTransport(retries=3))
+
+        unpickled_client = pickle.loads(pickle.dumps(client))
+
+        assert "transport" not in unpickled_client._http_client_args
+        assert unpickled_client.http_client.base_url == "http://localhost:8000"
+
+    def test_create_a_transport_for_every_http_client(self):
+        client = Argilla(api_url="http://localhost:8000", transport=CachingTransport)
+        transport = client.http_client._transport
+
+        unpickled_client = pickle.loads(pickle.dumps(client))
+        _reset_clients_after_fork()
+
+        assert isinstance(transport, CachingTransport)
+        assert isinstance(unpickled_client.http_client._transport, CachingTransport)
+        assert client.http_client._transport is not transport
+
+    def test_default_client_per_context(self):
+        default_client = Argilla(api_url="http://localhost:8000")
+        thread_client = Argilla(api_url="http://localhost:8001")
+        Argilla._set_default(default_client)
+
+        def get_default_client_in_context():
+            with thread_client.as_default():
+                return Argilla._get_default()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(get_default_client_in_context).result() is thread_client
+
+        assert Argilla._get_default() is default_client
+        with thread_client.as_default():
+            assert Argilla._get_default() is thread_client
+        assert Argilla._get_default() is default_client
+
+    def test_coalesce_concurrent_identical_requests(self, mocker):
+        server = FakeArgillaServer()
+        handle = server.handle
+
+        def slow_handle(request):
+            time.sleep(0.2)
+            return handle(request)
+
+        mocker.patch.object(server, "handle", side_effect=slow_handle)
+        client = server.client(coalesce_requests=True)
+        barrier = threading.Barrier(4)
+
+        def get_workspace(_):
+            barrier.wait()
+            return client.api.workspaces.get(server.workspace["id"])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            workspaces = list(executor.map(get_workspace, range(4)))
+
+        assert server.handle.call_count == 1
+        assert all(workspace == workspaces[0] for workspace in workspaces)
@@ -0,0 +1,82 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import uuid
+
+import pytest
+
+import argilla_sdk as rg
+from argilla_sdk._api import MetricsRegistry
+from argilla_sdk._exceptions import NotFoundError
+from argilla_sdk.testing import FakeArgillaServer
+
+
+@pytest.fixture
+def client() -> rg.Argilla:
+    return FakeArgillaServer().client()
+
+
+class TestMetricsRegistry:
+    def test_record_requests_and_operations(self, client: rg.Argilla):
+        settings = rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="comment")])
+        dataset = rg.Dataset(name="reviews", workspace="argilla", settings=settings, client=client).create()
+        client.metrics.reset()
+
+        dataset.records.log(records=[{"text": "a great movie"}, {"text": "a terrible movie"}])
+
+        metrics = client.metrics.to_dict()
+        bulk_requests = metrics["requests"]["PUT /api/v1/datasets/{id}/records/bulk"]
+        assert bulk_requests["count"] == 1
+        assert bulk_requests["errors"] == {}
+        assert bulk_requests["request_bytes"] > 0
+        assert bulk_requests["response_bytes"] > 0
+        assert bulk_requests["latency"]["p50"] <= bulk_requests["latency"]["p99"]
+        assert metrics["operations"]["RecordsAPI.bulk_upsert"]["count"] == 1
+
+    def test_record_errors(self, client: rg.Argilla):
+        with pytest.raises(NotFoundError):
+            client.api.datasets.get(uuid.uuid4())
+
+        metrics = client.metrics.to_dict()
+        assert metrics["requests"]["GET /api/v1/datasets/{id}"]["errors"] == {"404": 1}
+        assert metrics["operations"]["DatasetsAPI.get"]["errors"] == {"NotFoundError": 1}
+
+    def test_export_as_prometheus_text(self, client: rg.Argilla):
+        client.api.workspaces.list()
+
+        text = client.metrics.to_prometheus()
+
+        assert "# TYPE argilla_http_requests_total counter" in text
+        assert 'argilla_http_requests_total{method="GET",endpoint="/api/v1/me/workspaces"} 1' in text
+        assert 'argilla_http_request_duration_seconds_count{method="GET",endpoint="/api/v1/me/workspaces"} 1' in text
+        assert 'argilla_api_operations_total{operation="WorkspacesAPI.list"} 1' in text
+
+    def test_latency_quantiles(self):
+        metrics = MetricsRegistry()
+        for duration in range(1, 101):
+            metrics.observe_operation("RecordsAPI.search", duration=duration / 100)
+
+        latency = metrics.to_dict()["operations"]["RecordsAPI.search"]["latency"]
+
+        assert (latency["p50"], latency["p95"], latency["p99"]) == (0.5, 0.95, 0.99)
+
+    def test_keep_client_event_hooks(self, mocker):
+        server = FakeArgillaServer()
+        hook = mocker.Mock()
+        client = server.client(event_hooks={"response": [hook]})
+
+        client.api.workspaces.list()
+
+        assert hook.call_count == 1
+        assert client.metrics.to_dict()["requests"]["GET /api/v1/me/workspaces"]["count"] == 1
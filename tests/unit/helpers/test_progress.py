@@ -0,0 +1,103 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from typing import List
+
+import pytest
+
+import argilla_sdk as rg
+from argilla_sdk.testing import FakeArgillaServer
+
+
+@pytest.fixture
+def client() -> rg.Argilla:
+    return FakeArgillaServer().client()
+
+
+@pytest.fixture
+def dataset(client: rg.Argilla) -> rg.Dataset:
+    settings = rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="comment")])
+    return rg.Dataset(name="reviews", workspace="argilla", settings=settings, client=client).create()
+
+
+class TestProgress:
+    def test_throughput_and_eta(self):
+        progress = rg.Progress(operation="DatasetRecords.log", records=100, total=300, elapsed=2.0)
+
+        assert progress.records_per_second == 50
+        assert progress.eta == 4
+        assert rg.Progress(operation="DatasetRecords.log", records=100, elapsed=2.0).eta is None
+
+    def test_report_the_progress_of_log(self, dataset: rg.Dataset):
+        reports: List[rg.Progress] = []
+
+        dataset.records.log(records=[{"text": f"movie {i}"} for i in range(5)], batch_size=2, progress=reports.append)
+
+        assert [report.records for report in reports] == [2, 4, 5, 5]
+        assert [report.finished for report in reports] == [False, False, False, True]
+        assert all(report.total == 5 for report in reports)
+        assert reports[-1].bytes_sent > 0 and reports[-1].bytes_received > 0
+        assert reports[-1].operation == "DatasetRecords.log"
+
+    def test_report_the_progress_of_iteration(self, dataset: rg.Dataset):
+        dataset.records.log(records=[{"text": f"movie {i}"} for i in range(3)])
+        reports: List[rg.Progress] = []
+
+        records = list(dataset.records(batch_size=2, progress=reports.append))
+
+        assert len(records) == 3
+        assert [(report.records, report.total) for report in reports] == [(2, 3), (3, 3), (3, 3)]
+        assert reports[-1].finished
+
+    def test_report_the_progress_of_from_disk(self, client: rg.Argilla, dataset: rg.Dataset, tmp_path):
+        dataset.records.log(records=[{"text": f"movie {i}"} for i in range(3)])
+        dataset.to_disk(path=str(tmp_path))
+        reports: List[rg.Progress] = []
+
+        rg.Dataset.from_disk(path=str(tmp_path), target_name="copy", client=client, progress=reports.append)
+
+        assert reports[-1].operation == "Dataset.from_disk"
+        assert (reports[-1].records, reports[-1].total, reports[-1].finished) == (3, 3, True)
+
+    def test_report_the_progress_of_delete(self, dataset: rg.Dataset):
+        records = dataset.records.log(records=[{"text": f"movie {i}"} for i in range(5)])
+        reports: List[rg.Progress] = []
+
+        deleted = dataset.records.delete(records=records, batch_size=2, max_workers=1, progress=reports.append)
+
+        assert deleted == 5
+        assert [(report.records, report.total) for report in reports] == [(2, 5), (4, 5), (5, 5), (5, 5)]
+        assert reports[-1].operation == "DatasetRecords.delete"
+        assert reports[-1].finished
+
+    def test_tqdm_progress_requires_tqdm(self, mocker):
+        mocker.patch.dict(sys.modules, {"tqdm.auto": None})
+
+        with pytest.raises(ImportError, match="pip install tqdm"):
+            rg.TqdmProgress()(rg.Progress(operation="DatasetRecords.log"))
+
+    def test_tqdm_progress_updates_a_bar(self, mocker):
+        bar = mocker.MagicMock(n=0, total=None)
+        bar.update.side_effect = lambda n: setattr(bar, "n", bar.n + n)
+        tqdm = mocker.Mock(return_value=bar)
+        mocker.patch.dict(sys.modules, {"tqdm.auto": mocker.Mock(tqdm=tqdm)})
+
+        progress = rg.TqdmProgress(leave=False)
+        progress(rg.Progress(operation="DatasetRecords.log", records=2, total=5))
+        progress(rg.Progress(operation="DatasetRecords.log", records=5, total=5, finished=True))
+
+        tqdm.assert_called_once_with(total=5, desc="DatasetRecords.log", unit="records", leave=False)
+        assert bar.n == 5
+        bar.close.assert_called_once()
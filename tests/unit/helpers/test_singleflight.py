@@ -0,0 +1,69 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from argilla_sdk._helpers import SingleFlight
+
+
+def _run_concurrently(single_flight: SingleFlight, fn, callers: int) -> list:
+    """Starts one call, and the other ones while it is running"""
+    release = threading.Event()
+
+    def blocking_fn():
+        release.wait(timeout=5)
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        futures = [executor.submit(single_flight.do, "key", blocking_fn)]
+        while "key" not in single_flight._calls:
+            time.sleep(0.001)
+        futures += [executor.submit(single_flight.do, "key", blocking_fn) for _ in range(callers - 1)]
+        while single_flight._calls["key"].followers < callers - 1:
+            time.sleep(0.001)
+        release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_call(self, mocker):
+        fn = mocker.Mock(return_value={"name": "dataset"})
+
+        results = _run_concurrently(SingleFlight(), fn, callers=4)
+
+        assert fn.call_count == 1
+        assert results == [{"name": "dataset"}] * 4
+        assert len({id(result) for result in results}) == 4
+
+    def test_errors_are_raised_to_every_caller(self, mocker):
+        fn = mocker.Mock(side_effect=ValueError("failed"))
+
+        results = _run_concurrently(SingleFlight(), fn, callers=3)
+
+        assert fn.call_count == 1
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_sequential_calls_are_not_coalesced(self, mocker):
+        single_flight = SingleFlight()
+        fn = mocker.Mock(return_value=1)
+
+        assert single_flight.do("key", fn) == single_flight.do("key", fn) == 1
+        assert fn.call_count == 2
+
+        with pytest.raises(KeyError):
+            single_flight._calls["key"]
@@ -0,0 +1,71 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import uuid
+from types import SimpleNamespace
+
+from argilla_sdk._helpers import ModelsSnapshot
+
+
+def _model(name: str) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid.uuid4(), name=name)
+
+
+class TestModelsSnapshot:
+    def test_models_are_listed_once(self, mocker):
+        models = [_model("a"), _model("b")]
+        list_models = mocker.Mock(return_value=models)
+        snapshot = ModelsSnapshot(list_models=list_models, name_key=lambda model: model.name)
+
+        assert snapshot.models == models
+        assert snapshot.get_by_name("b") is models[1]
+        assert snapshot.get_by_id(models[0].id) is models[0]
+        assert list_models.call_count == 1
+
+    def test_models_are_listed_again_when_expired(self, mocker):
+        list_models = mocker.Mock(return_value=[_model("a")])
+        snapshot = ModelsSnapshot(list_models=list_models, name_key=lambda model: model.name, ttl=0)
+
+        snapshot.models
+        snapshot.models
+
+        assert list_models.call_count == 2
+
+    def test_models_are_listed_again_on_refresh_and_invalidate(self, mocker):
+        list_models = mocker.Mock(return_value=[_model("a")])
+        snapshot = ModelsSnapshot(list_models=list_models, name_key=lambda model: model.name, ttl=None)
+
+        snapshot.models
+        snapshot.refresh()
+        snapshot.invalidate()
+        snapshot.models
+
+        assert list_models.call_count == 3
+
+    def test_lookup_miss_lists_models_again(self, mocker):
+        created = _model("b")
+        list_models = mocker.Mock(side_effect=[[_model("a")], [_model("a"), created]])
+        snapshot = ModelsSnapshot(list_models=list_models, name_key=lambda model: model.name)
+        snapshot.models
+
+        assert snapshot.get_by_name("b") is created
+        assert list_models.call_count == 2
+
+    def test_lookup_miss_on_new_snapshot_lists_models_once(self, mocker):
+        list_models = mocker.Mock(return_value=[_model("a")])
+        snapshot = ModelsSnapshot(list_models=list_models, name_key=lambda model: model.name)
+
+        assert snapshot.get_by_name("b") is None
+        assert list_models.call_count == 1
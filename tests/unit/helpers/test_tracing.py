@@ -0,0 +1,155 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+import argilla_sdk as rg
+from argilla_sdk._exceptions import NotFoundError
+from argilla_sdk._helpers import current_span, trace_span
+from argilla_sdk.testing import FakeArgillaServer
+
+
+class RecordingSpan:
+    def __init__(self, name: str, attributes: Dict[str, Any], parent: Optional["RecordingSpan"]):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = parent
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class RecordingTracer:
+    """Records the spans with their parent, which is tracked by context like in OpenTelemetry"""
+
+    def __init__(self):
+        self.spans: List[RecordingSpan] = []
+        self._current: ContextVar[Optional[RecordingSpan]] = ContextVar("current", default=None)
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        span = RecordingSpan(name, attributes or {}, parent=self._current.get())
+        self.spans.append(span)
+        token = self._current.set(span)
+        try:
+            yield span
+        finally:
+            self._current.reset(token)
+
+    def named(self, name: str) -> List[RecordingSpan]:
+        return [span for span in self.spans if span.name == name]
+
+
+@pytest.fixture
+def tracer() -> RecordingTracer:
+    return RecordingTracer()
+
+
+@pytest.fixture
+def client(tracer: RecordingTracer) -> rg.Argilla:
+    return FakeArgillaServer().client(tracer=tracer)
+
+
+def _create_dataset(client: rg.Argilla) -> rg.Dataset:
+    settings = rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="comment")])
+    return rg.Dataset(name="reviews", workspace="argilla", settings=settings, client=client).create()
+
+
+class TestTracing:
+    def test_trace_span_without_tracer(self):
+        with trace_span(None, "DatasetRecords.log", {"argilla.records.count": 1}) as span:
+            span.set_attribute("argilla.records.count", 2)
+            assert current_span() is span
+
+    def test_log_records_in_nested_spans(self, client: rg.Argilla, tracer: RecordingTracer):
+        dataset = _create_dataset(client)
+        tracer.spans.clear()
+
+        dataset.records.log(records=[{"text": "a great movie"}, {"text": "a terrible movie"}])
+
+        (log_span,) = tracer.named("DatasetRecords.log")
+        assert log_span.parent is None
+        assert log_span.attributes["argilla.dataset.name"] == "reviews"
+        assert log_span.attributes["argilla.records.count"] == 2
+        assert tracer.named("DatasetRecords.ingest")[0].parent is log_span
+
+        (upsert_span,) = tracer.named("RecordsAPI.bulk_upsert")
+        assert upsert_span.parent is log_span
+        assert upsert_span.attributes["argilla.records.count"] == 2
+        assert upsert_span.attributes["http.request.method"] == "PUT"
+        assert upsert_span.attributes["http.response.status_code"] == 200
+        assert upsert_span.attributes["http.request.body.size"] > 0
+        assert upsert_span.attributes["http.response.body.size"] > 0
+
+    def test_create_dataset_in_nested_spans(self, client: rg.Argilla, tracer: RecordingTracer):
+        _create_dataset(client)
+
+        (create_span,) = tracer.named("Dataset.create")
+        (publish_span,) = tracer.named("Dataset.publish")
+        (settings_span,) = tracer.named("Settings.create")
+        assert publish_span.parent is create_span
+        assert settings_span.parent is publish_span
+        # The properties are created in spans of the settings span
+        assert {span.parent for span in tracer.named("FieldsAPI.create")} == {settings_span}
+        assert {span.parent for span in tracer.named("QuestionsAPI.create")} == {settings_span}
+
+    def test_iterate_records_in_page_spans(self, client: rg.Argilla, tracer: RecordingTracer):
+        dataset = _create_dataset(client)
+        dataset.records.log(records=[{"text": f"movie {i}"} for i in range(3)])
+        tracer.spans.clear()
+
+        assert len(list(dataset.records(batch_size=2))) == 3
+
+        pages = tracer.named("DatasetRecords.iterate_page")
+        assert [page.attributes["argilla.records.offset"] for page in pages] == [0, 2, 3]
+        assert [page.attributes["argilla.records.count"] for page in pages] == [2, 1, 0]
+        assert all(span.parent in pages for span in tracer.named("RecordsAPI.list"))
+
+    def test_record_the_error_status(self, client: rg.Argilla, tracer: RecordingTracer):
+        with pytest.raises(NotFoundError):
+            client.api.datasets.get(uuid.uuid4())
+
+        (span,) = tracer.named("DatasetsAPI.get")
+        assert span.attributes["http.response.status_code"] == 404
+
+    def test_requests_without_api_span_keep_the_parent_attributes(self, client: rg.Argilla, tracer: RecordingTracer):
+        dataset = _create_dataset(client)
+        tracer.spans.clear()
+
+        with trace_span(tracer, "Dataset.check", {"argilla.dataset.name": dataset.name}) as span:
+            assert client.api.datasets.exists(dataset.id)
+
+        assert span.attributes == {"argilla.dataset.name": "reviews"}
+
+    def test_trace_the_requests_of_to_disk(self, client: rg.Argilla, tracer: RecordingTracer, tmp_path):
+        dataset = _create_dataset(client)
+        tracer.spans.clear()
+
+        dataset.to_disk(path=str(tmp_path))
+
+        (to_disk_span,) = tracer.named("Dataset.to_disk")
+        assert not any(key.startswith(("http.", "url.")) for key in to_disk_span.attributes)
+
+    def test_replace_the_tracer(self, client: rg.Argilla, tracer: RecordingTracer):
+        client.api.workspaces.list()
+        client.tracer = None
+        client.api.workspaces.list()
+
+        assert isinstance(client.tracer, rg.NoOpTracer)
+        assert len(tracer.named("WorkspacesAPI.list")) == 1
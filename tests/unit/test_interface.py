@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
+import sys
 from unittest import mock
 
+import pytest
+
 import argilla_sdk as rg
 
 
@@ -34,3 +38,32 @@ class TestArgilla:
             remote_client = rg.Argilla(api_url="http://argilla.production.net", api_key="admin.apikey")
             assert local_client.api_url == "http://localhost:6900"
             assert remote_client.api_url == "http://argilla.production.net"
+
+
+class TestPackageImport:
+    @staticmethod
+    def _loaded_modules(code: str) -> set:
+        output = subprocess.check_output(
+            [sys.executable, "-W", "ignore", "-c", f"import sys; {code}; print(' '.join(sys.modules))"], text=True
+        )
+        return set(output.split())
+
+    def test_import_does_not_load_submodules_or_optional_dependencies(self):
+        modules = self._loaded_modules("import argilla_sdk")
+
+        assert "argilla_sdk.client" not in modules
+        assert not modules & {"IPython", "datasets", "httpx", "pydantic"}
+
+    def test_client_does_not_load_optional_dependencies(self):
+        modules = self._loaded_modules("import argilla_sdk as rg; rg.Argilla; rg.Dataset; rg.Settings")
+
+        assert not modules & {"IPython", "datasets"}
+
+    @pytest.mark.parametrize("name", rg.__all__)
+    def test_public_attributes_are_resolved_lazily(self, name: str):
+        assert getattr(rg, name) is not None
+        assert name in dir(rg)
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            rg.UnknownClass
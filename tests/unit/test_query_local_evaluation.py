@@ -0,0 +1,172 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from uuid import uuid4
+
+import pytest
+
+import argilla_sdk as rg
+from argilla_sdk.records._io import GenericIO
+
+
+@pytest.fixture
+def records():
+    user_id = uuid4()
+    return [
+        rg.Record(
+            fields={"text": "Paris is the capital of France"},
+            metadata={"score": 0.9, "source": "wiki"},
+            suggestions=[rg.Suggestion("label", "positive", score=0.8)],
+            responses=[rg.Response("label", "positive", user_id=user_id, status="submitted")],
+        ),
+        rg.Record(
+            fields={"text": "Berlin is the capital of Germany"},
+            metadata={"score": 0.2, "source": "news"},
+            suggestions=[rg.Suggestion("label", "negative", score=0.4)],
+        ),
+        rg.Record(
+            fields={"text": "Madrid is a city"},
+            metadata={"score": 0.5},
+            responses=[rg.Response("label", "negative", user_id=user_id)],
+        ),
+    ]
+
+
+class TestQueryLocalEvaluation:
+    @pytest.mark.parametrize(
+        "condition, expected",
+        [
+            (("label", "==", "positive"), [True, False, False]),
+            (("label.suggestion", "in", ["positive", "negative"]), [True, True, False]),
+            (("label.score", ">=", 0.5), [True, False, False]),
+            (("label.response", "==", "negative"), [False, False, True]),
+            (("metadata.score", "<=", 0.5), [False, True, True]),
+            (("metadata.source", "==", "wiki"), [True, False, False]),
+            (("status", "==", "pending"), [False, True, False]),
+            (("status", "in", ["submitted"]), [True, False, False]),
+            (("status", "==", "draft"), [False, False, True]),
+        ],
+    )
+    def test_evaluate_condition_over_records(self, records, condition, expected):
+        query = rg.Query(filter=rg.Filter(condition))
+
+        assert [query.evaluate(record) for record in records] == expected
+        if condition[0] != "status":
+            assert [query.evaluate(record.to_dict()) for record in records] == expected
+
+    def test_evaluate_response_status_of_exported_records(self, records):
+        exported_records = [record.to_dict() for record in records]
+        with_status = [
+            {
+                **exported,
+                "responses": {
+                    question: [{**response, "status": "submitted"} for response in responses]
+                    for question, responses in exported["responses"].items()
+                },
+            }
+            for exported in exported_records
+        ]
+
+        # The exported responses have no status, so the answered questions are evaluated as draft
+        assert rg.Query(filter=rg.Filter(("status", "==", "draft"))).filter_records(exported_records) == [
+            exported_records[0],
+            exported_records[2],
+        ]
+        assert rg.Query(filter=rg.Filter(("status", "==", "pending"))).filter_records(exported_records) == [
+            exported_records[1]
+        ]
+        assert rg.Query(filter=rg.Filter(("status", "==", "submitted"))).filter_records(with_status) == [
+            with_status[0],
+            with_status[2],
+        ]
+
+    def test_evaluate_text_query(self, records):
+        query = rg.Query(query="Capital")
+
+        assert query.filter_records(records) == records[:2]
+
+    def test_evaluate_query_with_text_and_filter(self, records):
+        query = rg.Query(query="capital", filter=rg.Filter([("metadata.score", ">=", 0.5)]))
+
+        assert query.filter_records(records) == records[:1]
+
+    def test_filter_records_with_predicate(self, records):
+        predicate = rg.Query(filter=rg.Filter(("label.suggestion", "==", "negative"))).to_predicate()
+
+        assert list(filter(predicate, records)) == records[1:2]
+
+    def test_evaluate_range_with_incompatible_types(self, records):
+        condition = rg.Filter(("metadata.source", ">=", 0.5)).conditions[0]
+
+        assert not any(condition.evaluate(record) for record in records)
+
+    def test_evaluate_unknown_operator(self, records):
+        query = rg.Query(filter=rg.Filter(("metadata.score", "!=", 0.5)))
+
+        with pytest.raises(ValueError):
+            query.evaluate(records[0])
+
+    def test_evaluate_flattened_records(self):
+        rows = [
+            {"text": "Paris is nice", "score": 0.9, "label.suggestion": "positive", "label.response.user": "positive"},
+            {"text": "Berlin is nice", "score": 0.1, "label.suggestion": "negative", "label.response.user": None},
+        ]
+
+        assert rg.Query(filter=rg.Filter(("metadata.score", ">=", 0.5))).filter_records(rows) == rows[:1]
+        assert rg.Query(filter=rg.Filter(("label", "==", "negative"))).filter_records(rows) == rows[1:]
+        assert rg.Query(filter=rg.Filter(("status", "==", "pending"))).filter_records(rows) == rows[1:]
+        assert rg.Query(query="berlin").filter_records(rows) == rows[1:]
+
+    def test_evaluate_response_status_of_flattened_records(self):
+        record = rg.Record(
+            fields={"text": "Paris is nice"},
+            responses=[rg.Response("label", "positive", user_id=uuid4(), status="submitted")],
+        )
+        exported_row = GenericIO._record_to_dict(record, flatten=True)
+        (value_column,) = [key for key in exported_row if key.startswith("label.response.")]
+        row = {**exported_row, f"{value_column}.status": "submitted"}
+        draft_row = {**exported_row, f"{value_column}.status": "draft"}
+        submitted = rg.Query(filter=rg.Filter(("status", "==", "submitted")))
+        draft = rg.Query(filter=rg.Filter(("status", "==", "draft")))
+
+        assert submitted.evaluate(record)
+        assert not any(key.endswith(".status") for key in exported_row)
+        assert draft.evaluate(exported_row)
+        assert submitted.filter_records([row, draft_row]) == [row]
+        batch = {key: [row[key], draft_row[key]] for key in row}
+        assert list(submitted.evaluate_batch(batch)) == [True, False]
+
+    def test_evaluate_batch(self):
+        batch = {
+            "text": ["Paris is nice", "Berlin is nice", "Rome is nice"],
+            "score": [0.9, 0.1, 0.6],
+            "label.suggestion": ["positive", "negative", "positive"],
+            "label.suggestion.score": [0.7, 0.9, None],
+        }
+
+        query = rg.Query(filter=rg.Filter([("metadata.score", ">=", 0.5), ("label", "==", "positive")]))
+        assert list(query.evaluate_batch(batch)) == [True, False, True]
+
+        query = rg.Query(query="nice", filter=rg.Filter(("label.score", ">=", 0.8)))
+        assert list(query.evaluate_batch(batch)) == [False, True, False]
+
+        assert list(rg.Query().evaluate_batch(batch)) == [True, True, True]
+
+    def test_evaluate_batch_without_numpy(self, mocker):
+        mocker.patch("argilla_sdk.records._search._resolve_numpy_module", return_value=None)
+        batch = {"score": [0.9, 0.1], "tags": [["a", "b"], ["c"]]}
+
+        mask = rg.Filter([("metadata.score", ">=", 0.5), ("metadata.tags", "in", ["b"])]).evaluate_batch(batch)
+
+        assert mask == [True, False]
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
 from uuid import uuid4
 
 import pytest
 
 import argilla_sdk as rg
+from argilla_sdk.records._ingestion import DatasetSchemaSnapshot
 
 
 @pytest.fixture
@@ -223,3 +225,50 @@ def test_ingest_record_from_dict_with_vectors_and_mapping(dataset):
     assert record.fields.prompt == "Hello World, how are you?"
     assert record.suggestions.label.value == "negative"
     assert record.vectors.vector == [1, 2, 3]
+
+
+def test_ingest_record_from_dict_with_schema_snapshot(dataset):
+    schema = pickle.loads(pickle.dumps(DatasetSchemaSnapshot.from_dataset(dataset)))
+    user_id = uuid4()
+
+    record = schema.record(
+        data={
+            "id": "1",
+            "my_prompt": "What is the capital of France?",
+            "label": "positive",
+            "score": 0.5,
+            "vector": [1.0, 2.0, 3.0],
+            "my_label": "negative",
+        },
+        mapping={"my_prompt": "prompt", "my_label": "label.response"},
+        user_id=user_id,
+    )
+    model = record.api_model()
+
+    assert model.external_id == "1"
+    assert model.fields == {"prompt": "What is the capital of France?"}
+    assert model.suggestions[0].value == "positive"
+    assert model.suggestions[0].question_id == dataset.settings.question_by_name("label").id
+    assert model.responses[0].values == {"label": {"value": "negative"}}
+    assert model.responses[0].user_id == user_id
+    assert model.vectors[0].vector_values == [1.0, 2.0, 3.0]
+    assert model.metadata[0].value == 0.5
+
+
+def test_ingest_ranking_record_with_schema_snapshot():
+    settings = rg.Settings(
+        fields=[rg.TextField(name="prompt")],
+        questions=[rg.RankingQuestion(name="ranking", values=["a", "b"])],
+    )
+    dataset = rg.Dataset(name="test_dataset", settings=settings, workspace=rg.Workspace(name="workspace", id=uuid4()))
+    schema = pickle.loads(pickle.dumps(DatasetSchemaSnapshot.from_dataset(dataset)))
+    data = {"id": "1", "prompt": "Rank", "ranking": ["b", "a"], "my_ranking": ["a", "b"]}
+    mapping = {"my_ranking": "ranking.response"}
+    user_id = uuid4()
+
+    model = schema.record(data=data, mapping=mapping, user_id=user_id).api_model()
+
+    assert model.suggestions[0].value == [{"value": "b"}, {"value": "a"}]
+    assert model.responses[0].values == {"ranking": {"value": [{"value": "a"}, {"value": "b"}]}}
+    in_process_record = dataset.records._infer_record_from_mapping(data=data, mapping=mapping, user_id=user_id)
+    assert model == in_process_record.api_model()
@@ -0,0 +1,107 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+import argilla_sdk as rg
+from argilla_sdk._exceptions import NotFoundError
+from argilla_sdk.testing import FakeArgillaServer
+
+
+@pytest.fixture
+def server(mocker) -> FakeArgillaServer:
+    server = FakeArgillaServer()
+    mocker.spy(server, "handle")
+    return server
+
+
+@pytest.fixture
+def client(server: FakeArgillaServer) -> rg.Argilla:
+    return server.client()
+
+
+def _list_requests(server: FakeArgillaServer, path: str) -> int:
+    return sum(
+        1 for call in server.handle.call_args_list if call.args[0].method == "GET" and call.args[0].url.path == path
+    )
+
+
+class TestClientCollections:
+    def test_collections_are_listed_once(self, server: FakeArgillaServer, client: rg.Argilla):
+        for name in ["team-a", "team-b", "team-c"]:
+            rg.Workspace(name=name, client=client).create()
+
+        names = [client.workspaces[i].name for i in range(len(client.workspaces))]
+        workspace = client.workspaces("team-b")
+
+        assert names == ["argilla", "team-a", "team-b", "team-c"]
+        assert workspace.name == "team-b"
+        assert client.workspaces.default.name == "argilla"
+        assert _list_requests(server, "/api/v1/me/workspaces") == 1
+
+    def test_created_and_deleted_resources_invalidate_the_collection(self, client: rg.Argilla):
+        assert len(client.workspaces) == 1
+
+        workspace = rg.Workspace(name="team", client=client).create()
+        assert [ws.name for ws in client.workspaces] == ["argilla", "team"]
+
+        workspace.delete()
+        assert [ws.name for ws in client.workspaces] == ["argilla"]
+
+    def test_lookup_miss_refreshes_the_collection(self, server: FakeArgillaServer, client: rg.Argilla):
+        assert len(client.users) == 1
+        other_client = server.client()
+        rg.User(username="annotator", password="12345678", client=other_client).create()
+
+        user = client.users("annotator")
+
+        assert user.id is not None
+        assert len(client.users) == 2
+
+    def test_refresh_and_ttl(self, server: FakeArgillaServer, client: rg.Argilla):
+        client.workspaces.ttl = 0
+        len(client.workspaces)
+        len(client.workspaces)
+        client.workspaces.ttl = None
+        len(client.workspaces)
+        client.workspaces.refresh()
+
+        assert _list_requests(server, "/api/v1/me/workspaces") == 3
+
+    def test_datasets_are_looked_up_by_workspace_and_name(self, server: FakeArgillaServer, client: rg.Argilla):
+        settings = rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="comment")])
+        rg.Dataset(name="reviews", workspace="argilla", settings=settings, client=client).create()
+
+        server.handle.reset_mock()
+
+        dataset = client.datasets("reviews", workspace="argilla")
+
+        (request,) = [call.args[0] for call in server.handle.call_args_list]
+        assert dataset.name == "reviews"
+        assert request.url.path == "/api/v1/me/datasets"
+        assert request.url.params["workspace_id"] == str(client.workspaces.default.id)
+
+    def test_datasets_are_looked_up_in_the_default_workspace(self, server: FakeArgillaServer, client: rg.Argilla):
+        workspace = rg.Workspace(name="team", client=client).create()
+        settings = rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="comment")])
+        rg.Dataset(name="reviews", workspace=workspace, settings=settings, client=client).create()
+        default_dataset = rg.Dataset(name="reviews", workspace="argilla", settings=settings, client=client).create()
+
+        dataset = client.datasets("reviews")
+
+        assert dataset.id == default_dataset.id
+        assert client.datasets("reviews", workspace=workspace).workspace_id == workspace.id
+        with pytest.raises(NotFoundError):
+            client.datasets("reviews", workspace="missing")
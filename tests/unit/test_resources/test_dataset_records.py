@@ -0,0 +1,727 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+import argilla_sdk as rg
+from argilla_sdk import Record
+from argilla_sdk._api import RecordsAPI
+from argilla_sdk._exceptions import UnprocessableEntityError
+from argilla_sdk._models import RecordModel, UserModel, UserResponseModel
+from argilla_sdk.records._hashing import record_content_hash
+from argilla_sdk.records._ingestion import DatasetSchemaSnapshot
+from argilla_sdk.testing import FakeArgillaServer
+
+
+def _record_models(n: int, start: int = 0):
+    inserted_at = datetime(2024, 1, 1)
+    return [
+        RecordModel(
+            id=uuid4(), external_id=str(i), fields={"text": str(i)}, inserted_at=inserted_at + timedelta(seconds=i)
+        )
+        for i in range(start, start + n)
+    ]
+
+
+@pytest.fixture
+def dataset(mocker) -> rg.Dataset:
+    settings = rg.Settings(
+        fields=[rg.TextField(name="text")],
+        questions=[
+            rg.LabelQuestion(name="label", labels=["negative", "positive"]),
+            rg.TextQuestion(name="comment"),
+        ],
+        metadata=[
+            rg.TermsMetadataProperty(name="source", options=["wiki", "news"]),
+            rg.FloatMetadataProperty(name="score"),
+        ],
+    )
+    workspace = rg.Workspace(name="workspace", id=uuid4())
+    dataset = rg.Dataset(name="test_dataset", settings=settings, workspace=workspace)
+    dataset.id = uuid4()
+    mocker.patch.object(dataset, "exists", return_value=True)
+    return dataset
+
+
+class TestDatasetRecordsCount:
+    def test_count_records(self, dataset, mocker):
+        search = mocker.patch.object(dataset.records._api, "search", return_value=([], 42))
+
+        assert dataset.records.count() == 42
+        assert not hasattr(dataset.records, "__len__")
+
+        kwargs = search.call_args.kwargs
+        assert kwargs["dataset_id"] == dataset.id
+        assert kwargs["limit"] == 1
+        assert kwargs["with_suggestions"] is False
+        assert kwargs["with_responses"] is False
+
+    def test_count_records_with_query(self, dataset, mocker):
+        search = mocker.patch.object(dataset.records._api, "search", return_value=([], 3))
+
+        assert dataset.records.count(query="paris") == 3
+        assert search.call_args.kwargs["query"].query.text.q == "paris"
+
+    def test_facets(self, dataset, mocker):
+        def search(query, **kwargs):
+            term_filter = query.filters.and_[-1]
+            return [], {"positive": 3, "negative": 1, "wiki": 5, "news": 2, "pending": 4}.get(term_filter.values[0], 0)
+
+        mocker.patch.object(dataset.records._api, "search", side_effect=search)
+
+        facets = dataset.records.facets(["label.suggestion", "metadata.source", "status"])
+
+        assert facets == {
+            "label.suggestion": {"negative": 1, "positive": 3},
+            "metadata.source": {"wiki": 5, "news": 2},
+            "status": {"pending": 4, "draft": 0, "submitted": 0, "discarded": 0},
+        }
+
+    def test_facets_with_query_and_explicit_values(self, dataset, mocker):
+        search = mocker.patch.object(dataset.records._api, "search", return_value=([], 1))
+        query = rg.Query(query="paris", filter=rg.Filter(("metadata.score", ">=", 0.5)))
+
+        facets = dataset.records.facets({"comment.response": ["yes", "no"]}, query=query, max_workers=1)
+
+        assert facets == {"comment.response": {"yes": 1, "no": 1}}
+        for call in search.call_args_list:
+            search_query = call.kwargs["query"]
+            assert search_query.query.text.q == "paris"
+            assert len(search_query.filters.and_) == 2
+
+    def test_facets_with_unknown_values(self, dataset):
+        with pytest.raises(ValueError):
+            dataset.records.facets(["comment.response"])
+
+
+class TestDatasetRecordsStableIteration:
+    def test_stable_iteration_with_concurrent_deletes(self, dataset, mocker):
+        server_records = _record_models(20)
+        calls = []
+
+        def list_records(dataset_id, offset, limit, sort_by=None, **kwargs):
+            calls.append((offset, sort_by))
+            page = server_records[offset : offset + limit]
+            if len(calls) == 2:
+                # Delete already returned records while the scan is running
+                del server_records[0:8]
+            return page
+
+        mocker.patch.object(RecordsAPI, "list", side_effect=list_records)
+        expected_ids = [model.external_id for model in server_records]
+
+        records = list(dataset.records(batch_size=5, stable=True))
+
+        assert [record.id for record in records] == expected_ids
+        assert all(sort_by == ["inserted_at:asc"] for _, sort_by in calls)
+
+    def test_stable_iteration_with_concurrent_inserts(self, dataset, mocker):
+        server_records = _record_models(10)
+
+        def list_records(dataset_id, offset, limit, sort_by=None, **kwargs):
+            page = server_records[offset : offset + limit]
+            if len(server_records) < 15:
+                server_records.extend(_record_models(1, start=len(server_records)))
+            return page
+
+        mocker.patch.object(RecordsAPI, "list", side_effect=list_records)
+
+        records = list(dataset.records(batch_size=4, stable=True))
+
+        assert [record.id for record in records] == [str(i) for i in range(15)]
+
+    def test_stable_iteration_without_server_sorting(self, dataset, mocker):
+        server_records = _record_models(12)
+
+        def list_records(dataset_id, offset, limit, sort_by=None, **kwargs):
+            if sort_by:
+                raise UnprocessableEntityError("sort_by not supported")
+            return server_records[offset : offset + limit]
+
+        mocker.patch.object(RecordsAPI, "list", side_effect=list_records)
+
+        with pytest.warns(UserWarning):
+            records = list(dataset.records(batch_size=5, stable=True))
+
+        assert [record.id for record in records] == [str(i) for i in range(12)]
+
+    def test_offset_iteration_is_not_sorted(self, dataset, mocker):
+        list_records = mocker.patch.object(RecordsAPI, "list", side_effect=[_record_models(3), []])
+
+        records = list(dataset.records(batch_size=3))
+
+        assert len(records) == 3
+        assert list_records.call_args.kwargs["sort_by"] is None
+
+
+class TestDatasetRecordsGetMany:
+    @pytest.fixture
+    def server_records(self) -> list:
+        return _record_models(10)
+
+    @pytest.fixture
+    def list_records(self, dataset, server_records, mocker):
+        mocker.patch.object(RecordsAPI, "search", return_value=([], len(server_records)))
+        return mocker.patch.object(
+            RecordsAPI, "list", side_effect=lambda offset, limit, **kwargs: server_records[offset : offset + limit]
+        )
+
+    def test_get_many_by_ids(self, dataset, list_records):
+        records = dataset.records.get_many(["4", "missing", "1"], batch_size=3)
+
+        assert [record.id if record else None for record in records] == ["4", None, "1"]
+        assert sorted(call.kwargs["offset"] for call in list_records.call_args_list) == [0, 3, 6, 9]
+
+    def test_get_many_by_ids_stops_when_all_found(self, dataset, list_records):
+        records = dataset.records.get_many(["0", "3"], batch_size=2, max_workers=2)
+
+        assert [record.id for record in records] == ["0", "3"]
+        assert sorted(call.kwargs["offset"] for call in list_records.call_args_list) == [0, 2]
+
+    def test_get_many_by_server_ids(self, dataset, server_records, list_records):
+        ids = [server_records[7].id, uuid4(), server_records[2].id]
+
+        records = dataset.records.get_many(ids, use_server_ids=True, with_responses=False, batch_size=4)
+
+        assert [record._server_id if record else None for record in records] == [ids[0], None, ids[2]]
+        assert list_records.call_count == 3
+        assert all(call.kwargs["with_responses"] is False for call in list_records.call_args_list)
+
+    def test_get_many_by_server_ids_from_server(self):
+        client = FakeArgillaServer().client()
+        settings = rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="comment")])
+        dataset = rg.Dataset(name="reviews", workspace="argilla", settings=settings, client=client).create()
+        dataset.records.log(records=[{"id": str(i), "text": f"movie {i}"} for i in range(5)])
+        server_ids = [record._server_id for record in dataset.records]
+
+        records = dataset.records.get_many([server_ids[3], uuid4(), server_ids[1]], use_server_ids=True)
+
+        assert [record.id if record else None for record in records] == ["3", None, "1"]
+
+
+class TestDatasetRecordsDelete:
+    def test_delete_records_in_batches(self, dataset, mocker):
+        delete_many = mocker.patch.object(dataset.records._api, "delete_many")
+        records = [Record.from_model(model=model, dataset=dataset) for model in _record_models(250)]
+
+        deleted = dataset.records.delete(records)
+
+        assert deleted == 250
+        assert delete_many.call_count == 3
+        deleted_ids = [record_id for call in delete_many.call_args_list for record_id in call.kwargs["records_ids"]]
+        assert sorted(deleted_ids) == sorted(record._server_id for record in records)
+
+    def test_delete_records_by_server_ids(self, dataset, mocker):
+        delete_many = mocker.patch.object(dataset.records._api, "delete_many")
+        ids = [uuid4(), uuid4()]
+
+        assert dataset.records.delete([str(ids[0]), ids[1], ids[1]]) == 2
+        delete_many.assert_called_once_with(dataset_id=dataset.id, records_ids=ids)
+
+    def test_delete_records_by_query(self, dataset, mocker):
+        server_records = _record_models(7)
+        mocker.patch.object(
+            RecordsAPI, "search", side_effect=[([(model, 1.0) for model in server_records], 7), ([], 7)]
+        )
+        delete_many = mocker.patch.object(dataset.records._api, "delete_many")
+
+        deleted = dataset.records.delete(query=rg.Query(filter=rg.Filter(("metadata.score", ">=", 0.5))), batch_size=5)
+
+        assert deleted == 7
+        assert delete_many.call_count == 2
+
+    def test_delete_records_without_server_id(self, dataset):
+        with pytest.raises(ValueError):
+            dataset.records.delete([rg.Record(fields={"text": "text"})])
+
+    def test_delete_without_records_or_query(self, dataset):
+        with pytest.raises(ValueError):
+            dataset.records.delete()
+
+    @pytest.mark.parametrize("query", ["", rg.Query(), rg.Query(query="")])
+    def test_delete_with_empty_query(self, dataset, mocker, query):
+        search = mocker.patch.object(RecordsAPI, "search")
+        delete_many = mocker.patch.object(dataset.records._api, "delete_many")
+
+        with pytest.raises(ValueError, match="cannot be empty"):
+            dataset.records.delete(query=query)
+
+        search.assert_not_called()
+        delete_many.assert_not_called()
+
+
+class TestRecordsAPIDeleteMany:
+    def test_delete_many(self, httpx_mock: HTTPXMock):
+        dataset_id = uuid4()
+        records_ids = [uuid4(), uuid4()]
+        httpx_mock.add_response(
+            url=f"http://test_url/api/v1/datasets/{dataset_id}/records?ids={records_ids[0]}%2C{records_ids[1]}",
+            method="DELETE",
+            status_code=204,
+        )
+        client = rg.Argilla("http://test_url")
+
+        client.api.records.delete_many(dataset_id=dataset_id, records_ids=records_ids)
+
+    def test_delete_many_with_too_many_records(self):
+        client = rg.Argilla("http://test_url")
+
+        with pytest.raises(ValueError):
+            client.api.records.delete_many(dataset_id=uuid4(), records_ids=[uuid4() for _ in range(101)])
+
+
+class TestDatasetRecordsLogResponses:
+    def test_log_responses_in_batches(self, dataset, mocker):
+        user_id = uuid4()
+        mocker.patch.object(dataset._client.api.users, "get_me", return_value=UserModel(id=user_id, username="me"))
+        records = [
+            Record(
+                id=str(i),
+                fields={"text": "text"},
+                responses=[rg.Response("comment", "ok", user_id=user_id, status="draft")],
+                _server_id=uuid4(),
+                _dataset=dataset,
+            )
+            for i in range(3)
+        ]
+
+        def bulk_create_responses(responses):
+            return ["invalid value" if record_id == records[1]._server_id else None for record_id, _ in responses]
+
+        bulk_create = mocker.patch.object(
+            dataset.records._api, "bulk_create_responses", side_effect=bulk_create_responses
+        )
+
+        errors = dataset.records.log_responses(records, status="submitted", batch_size=2)
+
+        assert errors == {records[1].id: ["invalid value"]}
+        assert bulk_create.call_count == 2
+        sent_responses = [response for call in bulk_create.call_args_list for _, response in call.kwargs["responses"]]
+        assert [response.status for response in sent_responses] == ["submitted"] * 3
+
+    def test_log_responses_of_other_users_are_rejected(self, dataset, mocker):
+        mocker.patch.object(dataset._client.api.users, "get_me", return_value=UserModel(id=uuid4(), username="me"))
+        bulk_create = mocker.patch.object(dataset.records._api, "bulk_create_responses")
+        record = Record(
+            id="0",
+            fields={"text": "text"},
+            responses=[rg.Response("comment", "ok", user_id=uuid4())],
+            _server_id=uuid4(),
+            _dataset=dataset,
+        )
+
+        with pytest.raises(ValueError, match="responses of other users"):
+            dataset.records.log_responses([record])
+        bulk_create.assert_not_called()
+
+    def test_log_responses_for_records_not_on_server(self, dataset):
+        record = rg.Record(fields={"text": "text"}, responses=[rg.Response("comment", "ok", user_id=uuid4())])
+
+        with pytest.raises(ValueError):
+            dataset.records.log_responses([record])
+
+
+class TestRecordsAPIBulkCreateResponses:
+    def test_bulk_create_responses(self, httpx_mock: HTTPXMock):
+        records_ids = [uuid4(), uuid4()]
+        httpx_mock.add_response(
+            url="http://test_url/api/v1/me/responses/bulk",
+            method="POST",
+            json={
+                "items": [{"item": {"id": str(uuid4())}, "error": None}, {"item": None, "error": {"detail": "oops"}}]
+            },
+        )
+        client = rg.Argilla("http://test_url")
+        user_response = UserResponseModel(values={"comment": {"value": "ok"}}, status="submitted", user_id=uuid4())
+
+        errors = client.api.records.bulk_create_responses(
+            responses=[(record_id, user_response) for record_id in records_ids]
+        )
+
+        assert errors == [None, "oops"]
+        assert json.loads(httpx_mock.get_request().content) == {
+            "items": [
+                {"values": {"comment": {"value": "ok"}}, "status": "submitted", "record_id": str(record_id)}
+                for record_id in records_ids
+            ]
+        }
+
+
+class TestDatasetRecordsPartialUpdates:
+    def test_update_suggestions_from_dicts(self, dataset, mocker):
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert", return_value=([], 2))
+
+        dataset.records.update_suggestions(
+            [
+                {"id": "1", "text": "a long text", "label": "positive", "label.score": 0.9},
+                {"id": "2", "text": "a long text", "label": "negative", "label.score": 0.4},
+            ],
+            mapping={"label.score": "label.suggestion.score"},
+        )
+
+        assert bulk_upsert.call_args.kwargs["partial"] is True
+        dumped = [model.model_dump(exclude_unset=True) for model in bulk_upsert.call_args.kwargs["records"]]
+        assert [set(record) for record in dumped] == [{"external_id", "suggestions"}] * 2
+        assert [record["suggestions"][0]["value"] for record in dumped] == ["positive", "negative"]
+        assert [record["suggestions"][0]["score"] for record in dumped] == [0.9, 0.4]
+
+    def test_update_metadata_by_server_ids(self, dataset, mocker):
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert", return_value=([], 1))
+        server_id = uuid4()
+
+        dataset.records.update_metadata([{"id": str(server_id), "score": 0.5}], use_server_ids=True)
+
+        dumped = bulk_upsert.call_args.kwargs["records"][0].model_dump(exclude_unset=True)
+        assert dumped == {"id": str(server_id), "metadata": {"score": 0.5}}
+
+    def test_update_vectors_from_records(self, dataset, mocker):
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert", return_value=([], 1))
+        server_id = uuid4()
+        record = Record(fields={"text": "text"}, vectors=[rg.Vector("vector", [1.0, 2.0])], _server_id=server_id)
+
+        dataset.records.update_vectors([record])
+
+        dumped = bulk_upsert.call_args.kwargs["records"][0].model_dump(exclude_unset=True)
+        assert dumped == {"id": str(server_id), "vectors": {"vector": [1.0, 2.0]}}
+
+    def test_update_suggestions_without_ids(self, dataset):
+        with pytest.raises(ValueError):
+            dataset.records.update_suggestions([{"label": "positive"}])
+
+
+class TestRecordsAPIBulkUpsert:
+    def test_bulk_upsert_partial_records(self, httpx_mock: HTTPXMock):
+        dataset_id = uuid4()
+        httpx_mock.add_response(
+            url=f"http://test_url/api/v1/datasets/{dataset_id}/records/bulk",
+            method="PUT",
+            json={"items": [], "updated_item_ids": []},
+        )
+        client = rg.Argilla("http://test_url")
+
+        client.api.records.bulk_upsert(
+            dataset_id=dataset_id,
+            records=[RecordModel(external_id="1", metadata={"score": 0.5})],
+            partial=True,
+        )
+
+        assert json.loads(httpx_mock.get_request().content) == {
+            "items": [{"external_id": "1", "metadata": {"score": 0.5}}]
+        }
+
+    def test_bulk_upsert_serialized_records(self, httpx_mock: HTTPXMock):
+        dataset_id = uuid4()
+        record_id = uuid4()
+        httpx_mock.add_response(
+            url=f"http://test_url/api/v1/datasets/{dataset_id}/records/bulk",
+            method="PUT",
+            json={
+                "items": [
+                    {
+                        "id": str(record_id),
+                        "external_id": "1",
+                        "fields": {"text": "1"},
+                        "inserted_at": "2024-01-01T00:00:00",
+                        "updated_at": "2024-01-01T00:00:00",
+                    }
+                ],
+                "updated_item_ids": [str(record_id)],
+            },
+        )
+        client = rg.Argilla("http://test_url")
+        content = json.dumps({"items": [{"external_id": "1", "fields": {"text": "1"}}]}).encode()
+
+        models, updated = client.api.records.bulk_upsert_serialized(dataset_id=dataset_id, content=content)
+
+        request = httpx_mock.get_request()
+        assert request.content == content
+        assert request.headers["Content-Type"] == "application/json"
+        assert [model.id for model in models] == [record_id]
+        assert updated == 1
+
+
+class TestDatasetRecordsLogModifiedRecords:
+    def test_log_skips_unmodified_records(self, dataset, mocker):
+        records = [Record.from_model(model=model, dataset=dataset) for model in _record_models(3)]
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert")
+
+        logged_records = dataset.records.log(records)
+
+        assert logged_records == records
+        bulk_upsert.assert_not_called()
+
+    def test_log_sends_whole_fetched_records_without_only_modified(self, dataset, mocker):
+        records = [Record.from_model(model=model, dataset=dataset) for model in _record_models(3)]
+        # Changes made in place are not tracked
+        records[0].fields.to_dict()["text"] = "changed in place"
+        bulk_upsert = mocker.patch.object(
+            dataset.records._api, "bulk_upsert", side_effect=lambda dataset_id, records, partial: (records, 0)
+        )
+
+        dataset.records.log(records, only_modified=False)
+
+        bulk_upsert.assert_called_once()
+        assert bulk_upsert.call_args.kwargs["partial"] is False
+        assert [model.fields["text"] for model in bulk_upsert.call_args.kwargs["records"]][0] == "changed in place"
+
+    def test_log_sends_only_modified_attributes(self, dataset, mocker):
+        fetched_records = [Record.from_model(model=model, dataset=dataset) for model in _record_models(3)]
+        fetched_records[1].metadata["score"] = 0.5
+        new_record = Record(id="new", fields={"text": "new"})
+
+        server_records = {record._server_id: record.api_model() for record in fetched_records}
+
+        def bulk_upsert(dataset_id, records, partial=False):
+            return [server_records.get(model.id) or model.model_copy(update={"id": uuid4()}) for model in records], 0
+
+        upsert = mocker.patch.object(dataset.records._api, "bulk_upsert", side_effect=bulk_upsert)
+
+        logged_records = dataset.records.log([*fetched_records, new_record])
+
+        assert upsert.call_count == 2
+        new_call, modified_call = upsert.call_args_list
+        assert new_call.kwargs["partial"] is False
+        assert [model.external_id for model in new_call.kwargs["records"]] == ["new"]
+        assert modified_call.kwargs["partial"] is True
+        assert [model.model_dump(exclude_unset=True) for model in modified_call.kwargs["records"]] == [
+            {"id": str(fetched_records[1]._server_id), "metadata": {"score": 0.5}}
+        ]
+
+        assert [record.id for record in logged_records] == ["0", "1", "2", "new"]
+        assert logged_records[0] is fetched_records[0]
+        assert not fetched_records[1].is_modified
+
+
+class TestDatasetRecordsLogUnchangedRecords:
+    def _upsert(self, dataset_id, records, partial=False):
+        return [model.model_copy(update={"id": uuid4()}) for model in records], 0
+
+    def test_log_skips_unchanged_records_with_hash_store(self, dataset, mocker, tmp_path):
+        hash_store = tmp_path / "hashes.json"
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert", side_effect=self._upsert)
+        mocker.patch.object(dataset.records, "_fetch_record_hashes", side_effect=AssertionError("no scan expected"))
+        data = [{"id": str(i), "text": f"text {i}", "score": i} for i in range(3)]
+
+        dataset.records.log(data, user_id=uuid4(), skip_unchanged=True, hash_store=hash_store)
+        assert len(bulk_upsert.call_args.kwargs["records"]) == 3
+
+        data[1]["text"] = "changed"
+        logged_records = dataset.records.log(data, user_id=uuid4(), skip_unchanged=True, hash_store=hash_store)
+
+        assert bulk_upsert.call_count == 2
+        assert [model.external_id for model in bulk_upsert.call_args.kwargs["records"]] == ["1"]
+        assert [record.fields.text for record in logged_records] == ["text 0", "changed", "text 2"]
+        assert len(json.loads(hash_store.read_text())) == 3
+
+    def test_log_skips_unchanged_records_with_server_scan(self, dataset, mocker):
+        server_records = _record_models(3)
+        mocker.patch.object(
+            RecordsAPI, "list", side_effect=lambda offset, limit, **kwargs: server_records[offset : offset + limit]
+        )
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert", side_effect=self._upsert)
+        records = [
+            Record(id="0", fields={"text": "0"}),
+            Record(id="1", fields={"text": "modified"}),
+            Record(id="new", fields={"text": "new"}),
+        ]
+
+        dataset.records.log(records, skip_unchanged=True)
+
+        assert [model.external_id for model in bulk_upsert.call_args.kwargs["records"]] == ["1", "new"]
+
+    def test_record_content_hash_ignores_ids(self, dataset):
+        model = _record_models(1)[0]
+        fetched_record = Record.from_model(model=model, dataset=dataset)
+        local_record = Record(id="another-id", fields=dict(model.fields))
+
+        assert record_content_hash(fetched_record) == record_content_hash(local_record)
+        local_record.metadata["score"] = 1.0
+        assert record_content_hash(fetched_record) != record_content_hash(local_record)
+
+
+class TestDatasetRecordsWriter:
+    def test_write_records_in_batches(self, dataset, mocker):
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert", return_value=([], 0))
+
+        with dataset.records.writer(max_batch=3, max_latency=5, user_id=uuid4()) as writer:
+            for i in range(7):
+                writer.write({"id": str(i), "text": f"text {i}"} if i % 2 else Record(id=str(i), fields={"text": "t"}))
+
+        assert (writer.queued, writer.sent, writer.failed) == (7, 7, 0)
+        batches = [call.kwargs["records"] for call in bulk_upsert.call_args_list]
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert [model.external_id for batch in batches for model in batch] == [str(i) for i in range(7)]
+
+    def test_take_the_dataset_schema_once_per_batch(self, dataset, mocker):
+        mocker.patch.object(dataset.records._api, "bulk_upsert", return_value=([], 0))
+        from_dataset = mocker.spy(DatasetSchemaSnapshot, "from_dataset")
+
+        with dataset.records.writer(max_batch=3, max_latency=5, user_id=uuid4()) as writer:
+            for i in range(6):
+                writer.write({"id": str(i), "text": f"text {i}"})
+
+        assert writer.sent == 6
+        assert from_dataset.call_count == 2
+
+    def test_flush_records_after_max_latency(self, dataset, mocker):
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert", return_value=([], 0))
+        writer = dataset.records.writer(max_batch=100, max_latency=0.01)
+
+        writer.write(Record(id="1", fields={"text": "text"}))
+        writer.flush()
+
+        assert bulk_upsert.call_count == 1
+        assert writer.sent == 1
+        writer.close()
+
+    def test_count_failed_records(self, dataset, mocker):
+        mocker.patch.object(dataset.records._api, "bulk_upsert", side_effect=ValueError("server error"))
+        writer = dataset.records.writer(max_batch=2, max_latency=0.01)
+
+        writer.write(Record(id="1", fields={"text": "text"}))
+        writer.write(Record(id="2", fields={"text": "text"}))
+        writer.write("not a record")
+        writer.close()
+
+        assert (writer.queued, writer.sent, writer.failed) == (3, 0, 3)
+        assert writer.last_error is not None
+
+    def test_close_while_writing(self, dataset, mocker):
+        mocker.patch.object(dataset.records._api, "bulk_upsert", return_value=([], 0))
+        writer = dataset.records.writer(max_batch=10, max_latency=0.01)
+        put = writer._queue.put
+        closing = threading.Thread(target=writer.close)
+
+        def put_while_closing(item, timeout=None):
+            closing.start()
+            # Closing waits for the record being written, so the thread is still alive
+            closing.join(timeout=0.2)
+            put(item, timeout=timeout)
+
+        mocker.patch.object(writer._queue, "put", side_effect=put_while_closing)
+        writer.write(Record(id="1", fields={"text": "text"}))
+        closing.join()
+
+        assert (writer.queued, writer.sent, writer.failed) == (1, 1, 0)
+
+    def test_write_to_closed_writer(self, dataset):
+        writer = dataset.records.writer()
+        writer.close()
+
+        with pytest.raises(RuntimeError):
+            writer.write(Record(id="1", fields={"text": "text"}))
+
+
+def _label_texts(records):
+    return ["positive" if int(record["fields"]["text"]) % 2 else "negative" for record in records]
+
+
+class TestDatasetRecordsIteratorMap:
+    def _mock_records(self, dataset, mocker, n):
+        server_records = _record_models(n)
+        mocker.patch.object(
+            RecordsAPI, "list", side_effect=lambda offset, limit, **kwargs: server_records[offset : offset + limit]
+        )
+        return server_records
+
+    def test_map_writes_results_as_suggestions(self, dataset, mocker):
+        server_records = self._mock_records(dataset, mocker, 10)
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert", return_value=([], 0))
+
+        def predict(records):
+            return [
+                {"value": "positive", "score": 0.9} if int(record.fields.text) % 2 else "negative" for record in records
+            ]
+
+        processed = dataset.records(batch_size=4).map(predict, batch_size=3, workers=2, as_suggestion="label")
+
+        assert processed == 10
+        assert bulk_upsert.call_count == 4
+        written = [model for call in bulk_upsert.call_args_list for model in call.kwargs["records"]]
+        assert [model.id for model in written] == [model.id for model in server_records]
+        assert all(call.kwargs["partial"] for call in bulk_upsert.call_args_list)
+        suggestions = [model.suggestions[0] for model in written]
+        assert [suggestion.value for suggestion in suggestions[:2]] == ["negative", "positive"]
+        assert suggestions[1].score == 0.9
+
+    def test_map_without_suggestions(self, dataset, mocker):
+        self._mock_records(dataset, mocker, 5)
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert")
+
+        seen_ids = []
+
+        def collect_ids(records):
+            seen_ids.extend(record.id for record in records)
+            return [None] * len(records)
+
+        assert dataset.records().map(collect_ids, batch_size=2) == 5
+        assert seen_ids == ["0", "1", "2", "3", "4"]
+        bulk_upsert.assert_not_called()
+
+    def test_map_with_processes(self, dataset, mocker):
+        self._mock_records(dataset, mocker, 4)
+        bulk_upsert = mocker.patch.object(dataset.records._api, "bulk_upsert", return_value=([], 0))
+
+        processed = dataset.records().map(
+            _label_texts, batch_size=2, workers=2, use_processes=True, as_suggestion="label"
+        )
+
+        assert processed == 4
+        written = [model for call in bulk_upsert.call_args_list for model in call.kwargs["records"]]
+        assert [model.suggestions[0].value for model in written] == ["negative", "positive", "negative", "positive"]
+
+    def test_map_with_wrong_number_of_results(self, dataset, mocker):
+        self._mock_records(dataset, mocker, 4)
+
+        with pytest.raises(ValueError):
+            dataset.records().map(lambda records: [], batch_size=2)
+
+
+class TestDatasetRecordsLogWithProcesses:
+    def test_log_records_prepared_in_processes(self, dataset, mocker):
+        rows = [{"id": str(i), "text": str(i), "label": "positive", "answer": "ok", "score": i / 10} for i in range(10)]
+        bodies = []
+
+        def bulk_upsert_serialized(dataset_id, content):
+            items = json.loads(content)["items"]
+            bodies.append(items)
+            return [
+                RecordModel(id=uuid4(), external_id=item["external_id"], fields=item["fields"]) for item in items
+            ], 0
+
+        mocker.patch.object(dataset.records._api, "bulk_upsert_serialized", side_effect=bulk_upsert_serialized)
+        user_id = uuid4()
+
+        mapping = {"answer": "comment.response"}
+
+        records = dataset.records.log(records=rows, mapping=mapping, user_id=user_id, batch_size=3, processes=2)
+
+        assert [len(items) for items in bodies] == [3, 3, 3, 1]
+        assert [record.id for record in records] == [str(i) for i in range(10)]
+        expected = (
+            dataset.records._infer_record_from_mapping(data=rows[0], mapping=mapping, user_id=user_id)
+            .api_model()
+            .model_dump()
+        )
+        assert bodies[0][0] == json.loads(json.dumps(expected))
+
+    def test_log_records_in_processes_with_invalid_records(self, dataset):
+        with pytest.raises(ValueError):
+            dataset.records.log(records=[{"text": "1"}, "2"], user_id=uuid4(), processes=2)
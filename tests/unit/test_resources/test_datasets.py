@@ -28,6 +28,8 @@ from argilla_sdk._exceptions import (
     NotFoundError,
     UnprocessableEntityError,
 )
+from argilla_sdk._models import DatasetModel
+from argilla_sdk.testing import FakeArgillaServer
 
 
 @pytest.fixture
@@ -325,7 +327,10 @@ class TestDatasetsAPI:
         }
         api_url = "http://test_url"
         httpx_mock.add_response(
-            json=mock_return_value, url=f"{api_url}/api/v1/me/datasets", method="GET", status_code=200
+            json=mock_return_value,
+            url=f"{api_url}/api/v1/me/datasets?workspace_id={mock_workspace_id}",
+            method="GET",
+            status_code=200,
         )
         with httpx.Client():
             client = rg.Argilla(api_url)
@@ -336,3 +341,56 @@ class TestDatasetsAPI:
             assert dataset.workspace_id.hex == mock_return_value["items"][0]["workspace_id"]
             assert dataset.inserted_at.isoformat() == mock_return_value["items"][0]["inserted_at"]
             assert dataset.updated_at.isoformat() == mock_return_value["items"][0]["updated_at"]
+
+
+class TestDatasetHandles:
+    @pytest.fixture
+    def server(self, mocker) -> FakeArgillaServer:
+        server = FakeArgillaServer()
+        mocker.spy(server, "handle")
+        return server
+
+    @staticmethod
+    def _requests(server: FakeArgillaServer, method: str, path: str) -> int:
+        return sum(
+            1 for call in server.handle.call_args_list if (call.args[0].method, call.args[0].url.path) == (method, path)
+        )
+
+    @staticmethod
+    def _create_dataset(client: rg.Argilla, name: str) -> rg.Dataset:
+        settings = rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="comment")])
+        return rg.Dataset(name=name, workspace="argilla", settings=settings, client=client).create()
+
+    def test_dataset_from_model_is_configured_on_first_use(self, server: FakeArgillaServer, recwarn):
+        client = server.client()
+        model = DatasetModel(id=uuid.uuid4(), name="reviews", workspace_id=uuid.UUID(server.workspace["id"]))
+
+        dataset = rg.Dataset.from_model(model=model, client=client)
+
+        assert dataset._settings is None
+        assert dataset._Dataset__records is None
+        assert server.handle.call_count == 0
+        assert not recwarn.list
+        assert dataset.records is dataset.records
+        assert len(dataset.settings.fields) == 0
+
+    def test_workspace_datasets_are_listed_with_a_filtered_query(self, server: FakeArgillaServer):
+        client = server.client()
+        for name in ["a", "b", "c"]:
+            self._create_dataset(client, name)
+        server.handle.reset_mock()
+
+        datasets = client.workspaces("argilla").datasets
+
+        assert [dataset.name for dataset in datasets] == ["a", "b", "c"]
+        assert self._requests(server, "GET", "/api/v1/me/datasets") == 1
+        assert server.handle.call_args_list[-1].args[0].url.params["workspace_id"] == server.workspace["id"]
+
+    def test_log_does_not_check_the_dataset_for_every_record(self, server: FakeArgillaServer):
+        client = server.client()
+        dataset = self._create_dataset(client, "reviews")
+        server.handle.reset_mock()
+
+        dataset.records.log(records=[{"text": f"record {i}"} for i in range(50)])
+
+        assert self._requests(server, "GET", f"/api/v1/datasets/{dataset.id}") <= 1
@@ -14,8 +14,21 @@
 
 import uuid
 
-from argilla_sdk import Record, Suggestion, Response
-from argilla_sdk._models import MetadataModel
+import pytest
+
+import argilla_sdk as rg
+from argilla_sdk import Record, Suggestion, Response, Vector
+from argilla_sdk._models import MetadataModel, RecordModel, VectorModel
+
+
+@pytest.fixture
+def dataset():
+    settings = rg.Settings(
+        fields=[rg.TextField(name="name")],
+        questions=[rg.TextQuestion(name="question")],
+        vectors=[rg.VectorField(name="vector", dimensions=2)],
+    )
+    return rg.Dataset(name="dataset", settings=settings, workspace=rg.Workspace(name="workspace", id=uuid.uuid4()))
 
 
 class TestRecords:
@@ -60,3 +73,57 @@ class TestRecords:
             MetadataModel(name="key", value="new_value"),
             MetadataModel(name="new_key", value="new_value"),
         ]
+
+    def test_new_record_is_modified(self):
+        record = Record(fields={"name": "John"})
+
+        assert record.is_modified
+
+    def test_track_record_modifications(self, dataset):
+        record = Record.from_model(RecordModel(id=uuid.uuid4(), external_id="1", fields={"name": "John"}), dataset)
+        assert not record.is_modified
+
+        record.metadata["key"] = "value"
+        record.metadata.other_key = "value"
+        assert record._modified_attributes == {"metadata"}
+
+        record.suggestions.add(Suggestion(question_name="question", value="answer"))
+        record.suggestions.question.score = 0.5
+        record.vectors.add(Vector(name="vector", values=[1.0, 2.0]))
+        record.responses.add(Response(question_name="question", value="answer", user_id=uuid.uuid4()))
+        record.id = "2"
+        assert record._modified_attributes == {"metadata", "suggestions", "vectors", "responses", "external_id"}
+        assert record.vectors.vector == [1.0, 2.0]
+        assert record.suggestions.question.score == 0.5
+
+    def test_track_response_modifications(self, dataset):
+        user_id = uuid.uuid4()
+        record = Record.from_model(RecordModel(id=uuid.uuid4(), external_id="1", fields={"name": "John"}), dataset)
+        record.responses.add(Response(question_name="question", value="answer", user_id=user_id))
+        record._reset_modified_attributes()
+
+        record.responses.question[0].value = "other answer"
+        assert record._modified_attributes == {"responses"}
+
+        record._reset_modified_attributes()
+        record.responses.question[0].status = "submitted"
+        assert record._modified_attributes == {"responses"}
+        assert record.responses.question[0].status == "submitted"
+        assert record.responses.to_dict()["question"] == [{"value": "other answer", "user_id": user_id}]
+
+    def test_track_vector_assignments(self, dataset):
+        record = Record.from_model(
+            RecordModel(
+                id=uuid.uuid4(),
+                external_id="1",
+                fields={"name": "John"},
+                vectors=[VectorModel(name="vector", vector_values=[1.0, 2.0])],
+            ),
+            dataset,
+        )
+
+        record.vectors.vector = [3.0, 4.0]
+
+        assert record._modified_attributes == {"vectors"}
+        assert record.vectors.vector == [3.0, 4.0]
+        assert record.vectors.to_dict() == {"vector": [3.0, 4.0]}
@@ -238,7 +238,7 @@ class TestWorkspacesAPI:
             ]
         }
         api_url = "http://test_url"
-        httpx_mock.add_response(json=mock_return_value, url=f"{api_url}/api/v1/me/datasets")
+        httpx_mock.add_response(json=mock_return_value, url=f"{api_url}/api/v1/me/datasets?workspace_id={workspace_id}")
         with httpx.Client():
             client = rg.Argilla(api_url=api_url, api_key="admin.apikey")
             datasets = client.api.datasets.list(workspace_id)
@@ -15,6 +15,8 @@ import pytest
 
 import argilla_sdk as rg
 from argilla_sdk._exceptions import SettingsError
+from argilla_sdk.settings import SettingsChanges
+from argilla_sdk.testing import FakeArgillaServer
 
 
 class TestSettings:
@@ -104,3 +106,150 @@ class TestSettingsSerialization:
         assert settings_serialized["guidelines"] == "This is a guideline"
         assert settings_serialized["fields"][0]["name"] == "prompt"
         assert settings_serialized["fields"][0]["settings"]["use_markdown"] is True
+
+
+class TestSettingsSynchronization:
+    @pytest.fixture
+    def server(self, mocker) -> FakeArgillaServer:
+        server = FakeArgillaServer()
+        mocker.spy(server, "handle")
+        return server
+
+    @pytest.fixture
+    def dataset(self, server: FakeArgillaServer) -> rg.Dataset:
+        client = server.client()
+        settings = rg.Settings(
+            guidelines="Label the reviews",
+            fields=[rg.TextField(name="text")],
+            questions=[rg.LabelQuestion(name="label", labels=["negative", "positive"])],
+            vectors=[rg.VectorField(name="embedding", dimensions=3)],
+            metadata=[rg.TermsMetadataProperty(name="source")],
+        )
+        return rg.Dataset(name="reviews", workspace="argilla", settings=settings, client=client).create()
+
+    def test_get_settings(self, dataset: rg.Dataset):
+        settings = rg.Settings(_dataset=dataset).get()
+
+        assert [field.name for field in settings.fields] == ["text"]
+        assert [question.name for question in settings.questions] == ["label"]
+        assert [vector.name for vector in settings.vectors] == ["embedding"]
+        assert [metadata.name for metadata in settings.metadata] == ["source"]
+        assert settings.guidelines == "Label the reviews"
+        assert not settings.is_outdated
+
+    def test_create_settings_in_declared_order(self, server: FakeArgillaServer):
+        client = server.client()
+        names = [f"property_{i}" for i in range(10)]
+        settings = rg.Settings(
+            fields=[rg.TextField(name=f"{name}_field") for name in names],
+            questions=[rg.TextQuestion(name=f"{name}_question") for name in names],
+        )
+
+        dataset = rg.Dataset(name="ordered", workspace="argilla", settings=settings, client=client).create()
+
+        dataset_settings = server.settings[str(dataset.id)]
+        assert [field["name"] for field in dataset_settings["fields"]] == [f"{name}_field" for name in names]
+        assert [question["name"] for question in dataset_settings["questions"]] == [
+            f"{name}_question" for name in names
+        ]
+
+    def test_create_settings_rolls_back_created_properties_on_errors(
+        self, server: FakeArgillaServer, dataset: rg.Dataset
+    ):
+        settings = rg.Settings(
+            fields=[rg.TextField(name="title"), rg.TextField(name="body")],
+            questions=[rg.TextQuestion(name="comment"), rg.LabelQuestion(name="label", labels=["a", "b"])],
+            metadata=[rg.IntegerMetadataProperty(name="votes"), rg.TermsMetadataProperty(name="source")],
+            _dataset=dataset,
+        )
+
+        with pytest.raises(SettingsError, match="Failed to create 2 of 6 properties") as error:
+            settings.create()
+
+        assert "'label'" in str(error.value) and "'source'" in str(error.value)
+        dataset_settings = server.settings[str(dataset.id)]
+        assert [field["name"] for field in dataset_settings["fields"]] == ["text"]
+        assert [question["name"] for question in dataset_settings["questions"]] == ["label"]
+        assert [metadata["name"] for metadata in dataset_settings["metadata-properties"]] == ["source"]
+        assert settings.fields["title"].id is None
+
+    def test_create_settings_sends_no_questions_when_fields_fail(self, server: FakeArgillaServer, dataset: rg.Dataset):
+        settings = rg.Settings(
+            fields=[rg.TextField(name="title"), rg.TextField(name="text")],
+            questions=[rg.TextQuestion(name="comment")],
+            _dataset=dataset,
+        )
+        server.handle.reset_mock()
+
+        with pytest.raises(SettingsError, match="Failed to create 1 of 3 properties"):
+            settings.create()
+
+        assert not any("questions" in call.args[0].url.path for call in server.handle.call_args_list)
+        assert [field["name"] for field in server.settings[str(dataset.id)]["fields"]] == ["text"]
+
+    def test_create_fields_before_other_properties(self, server: FakeArgillaServer):
+        client = server.client()
+        settings = rg.Settings(
+            fields=[rg.TextField(name=f"field_{i}") for i in range(5)],
+            questions=[rg.TextQuestion(name="comment")],
+            metadata=[rg.TermsMetadataProperty(name="source")],
+        )
+        server.handle.reset_mock()
+
+        rg.Dataset(name="ordered", workspace="argilla", settings=settings, client=client).create()
+
+        created = [call.args[0].url.path.rsplit("/", 1)[-1] for call in server.handle.call_args_list]
+        created = [kind for kind in created if kind in ("fields", "questions", "metadata-properties")]
+        assert created[:5] == ["fields"] * 5
+        assert sorted(created[5:]) == ["metadata-properties", "questions"]
+
+    def test_create_and_update_settings_properties(self, server: FakeArgillaServer, dataset: rg.Dataset):
+        settings = rg.Settings(metadata=[rg.IntegerMetadataProperty(name="votes")], _dataset=dataset)
+        settings.metadata.create()
+
+        assert settings.metadata.votes.id is not None
+        settings.metadata.votes.min = 0
+        changes = settings.metadata.update()
+
+        assert changes.updated == ["votes"]
+        metadata = server.settings[str(dataset.id)]["metadata-properties"]
+        assert [item["name"] for item in metadata] == ["source", "votes"]
+
+    def test_update_without_changes_sends_no_requests(self, server: FakeArgillaServer, dataset: rg.Dataset):
+        settings = dataset.settings
+        server.handle.reset_mock()
+
+        assert settings.update() is settings
+
+        changes = settings.last_changes
+        assert not changes.has_changes
+        assert changes.unchanged == ["text", "embedding", "source"]
+        assert server.handle.call_count == 0
+
+    def test_update_sends_only_changed_properties(self, server: FakeArgillaServer, dataset: rg.Dataset):
+        settings = dataset.settings
+        settings.fields.text.use_markdown = True
+        settings.metadata.add(rg.IntegerMetadataProperty(name="votes"))
+        server.handle.reset_mock()
+
+        changes = settings.update().last_changes
+
+        assert changes.created == ["votes"]
+        assert changes.updated == ["text"]
+        assert changes.unchanged == ["embedding", "source"]
+        assert not changes.dataset_updated
+        requests = sorted((call.args[0].method, call.args[0].url.path) for call in server.handle.call_args_list)
+        assert requests == [
+            ("PATCH", f"/api/v1/fields/{settings.fields.text.id}"),
+            ("POST", f"/api/v1/datasets/{dataset.id}/metadata-properties"),
+        ]
+        assert settings.update().last_changes == SettingsChanges(unchanged=["text", "embedding", "source", "votes"])
+
+    def test_update_guidelines(self, server: FakeArgillaServer, dataset: rg.Dataset):
+        settings = dataset.settings
+        settings.guidelines = "Label the reviews by sentiment"
+
+        changes = settings.update().last_changes
+
+        assert changes.dataset_updated
+        assert server.datasets[str(dataset.id)]["guidelines"] == "Label the reviews by sentiment"
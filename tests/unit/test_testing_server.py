@@ -0,0 +1,125 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import argilla_sdk as rg
+from argilla_sdk.testing import FakeArgillaServer
+
+
+@pytest.fixture
+def server() -> FakeArgillaServer:
+    return FakeArgillaServer()
+
+
+@pytest.fixture
+def client(server: FakeArgillaServer) -> rg.Argilla:
+    return server.client()
+
+
+@pytest.fixture
+def dataset(client: rg.Argilla) -> rg.Dataset:
+    settings = rg.Settings(
+        fields=[rg.TextField(name="text")],
+        questions=[rg.LabelQuestion(name="label", labels=["negative", "positive"])],
+        metadata=[rg.IntegerMetadataProperty(name="votes"), rg.TermsMetadataProperty(name="source")],
+    )
+    return rg.Dataset(name="reviews", workspace="argilla", settings=settings, client=client).create()
+
+
+def _rows():
+    return [
+        {"id": "1", "text": "a great movie", "label": "positive", "votes": 1, "source": "web"},
+        {"id": "2", "text": "a terrible movie", "label": "negative", "votes": 5, "source": "web"},
+        {"id": "3", "text": "a great book", "label": "positive", "votes": 10, "source": "store"},
+    ]
+
+
+class TestFakeArgillaServer:
+    def test_create_dataset_and_log_records(self, server: FakeArgillaServer, dataset: rg.Dataset):
+        dataset.records.log(records=_rows())
+
+        assert server.datasets[str(dataset.id)]["status"] == "ready"
+        assert [record.id for record in dataset.records] == ["1", "2", "3"]
+        assert dataset.records.count() == 3
+
+    def test_log_updates_records_by_external_id(self, server: FakeArgillaServer, dataset: rg.Dataset):
+        dataset.records.log(records=_rows())
+        server_id = dataset.records.get_many(["2"])[0]._server_id
+        dataset.records.log(records=[{"id": "2", "text": "a terrible film"}])
+
+        record = dataset.records.get_many(["2"])[0]
+        assert len(server.records[str(dataset.id)]) == 3
+        assert record._server_id == server_id
+        assert record.fields.text == "a terrible film"
+
+    def test_search_records_with_filters(self, dataset: rg.Dataset):
+        dataset.records.log(records=_rows())
+
+        assert dataset.records.count(query="great") == 2
+        assert dataset.records.count(query=rg.Query(filter=rg.Filter(("metadata.votes", ">=", 5)))) == 2
+        assert dataset.records.count(query=rg.Query(filter=rg.Filter(("label", "==", "positive")))) == 2
+        assert (
+            dataset.records.count(query=rg.Query(query="great", filter=rg.Filter(("metadata.source", "==", "web"))))
+            == 1
+        )
+        assert dataset.records.facets(terms={"metadata.source": ["web", "store"]}) == {
+            "metadata.source": {"web": 2, "store": 1}
+        }
+
+    def test_submit_responses(self, dataset: rg.Dataset):
+        dataset.records.log(records=_rows(), mapping={"label": "label.response"})
+        records = list(dataset.records(with_responses=True))
+
+        errors = dataset.records.log_responses(records=records[:2], status="submitted")
+
+        assert errors == {}
+        assert dataset.records.count(query=rg.Query(filter=rg.Filter(("status", "==", "submitted")))) == 2
+        assert dataset.records.count(query=rg.Query(filter=rg.Filter(("status", "==", "draft")))) == 1
+
+    def test_delete_records(self, dataset: rg.Dataset):
+        dataset.records.log(records=_rows())
+
+        deleted = dataset.records.delete(query="great")
+
+        assert deleted == 2
+        assert [record.id for record in dataset.records] == ["2"]
+        assert dataset.records.get_many(["1", "2"])[0] is None
+
+    def test_delete_dataset(self, server: FakeArgillaServer, dataset: rg.Dataset):
+        dataset.delete()
+
+        assert server.datasets == {}
+        assert server.records == {}
+
+    def test_manage_users_and_workspaces(self, server: FakeArgillaServer, client: rg.Argilla):
+        workspace = rg.Workspace(name="team", client=client).create()
+        user = rg.User(username="annotator", password="12345678", client=client).create()
+
+        user.add_to_workspace(workspace)
+
+        assert [u.username for u in workspace.users] == ["annotator"]
+        assert sorted(w.name for w in client.workspaces) == ["argilla", "team"]
+
+        user.remove_from_workspace(workspace)
+        user.delete()
+        workspace.delete()
+
+        assert [u["username"] for u in server.users.values()] == ["argilla"]
+        assert [w["name"] for w in server.workspaces.values()] == ["argilla"]
+
+    def test_unknown_routes_return_not_found(self, server: FakeArgillaServer, client: rg.Argilla):
+        response = client.http_client.get("/api/v1/unknown")
+
+        assert response.status_code == 404